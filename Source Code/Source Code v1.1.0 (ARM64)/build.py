@@ -5,6 +5,7 @@ Creates a standalone Windows executable using PyInstaller.
 
 Usage:
     python build.py
+    python build.py --embed-assets   (regenerate assets_data.py from assets/)
 
 Output:
     dist/PLC_Trend_Tool.exe
@@ -42,6 +43,9 @@ EXCLUDES = [
     "notebook", "IPython", "sphinx",
 ]
 
+ASSET_FILES = ["icon.ico", "icon.png", "logo.png", "logo_light.png"]
+ASSETS_DATA = "assets_data.py"
+
 
 def find_customtkinter_path():
     """Find customtkinter package directory for bundling."""
@@ -71,6 +75,33 @@ def create_icon_from_png():
         return None
 
 
+def write_assets_data(assets_dir="assets"):
+    """Embed assets/ into assets_data.py as one zlib-compressed, base64-encoded
+    BLOB plus a (filename, offset, length) MANIFEST into the decompressed bytes."""
+    import base64
+    import zlib
+    manifest, chunks, offset = [], [], 0
+    for filename in ASSET_FILES:
+        with open(os.path.join(assets_dir, filename), "rb") as f:
+            data = f.read()
+        manifest.append((filename, offset, len(data)))
+        chunks.append(data)
+        offset += len(data)
+    b64 = base64.b64encode(zlib.compress(b"".join(chunks), 9)).decode("ascii")
+    with open(ASSETS_DATA, "w", encoding="utf-8", newline="\n") as f:
+        f.write('"""\nEmbedded asset data for PLC Trend Tool.\n'
+                'Auto-generated by build.py --embed-assets — do not edit manually.\n"""\n\n')
+        f.write("# (filename, offset, length) into zlib.decompress(base64.b64decode(BLOB))\n")
+        f.write("MANIFEST = [\n")
+        for entry in manifest:
+            f.write(f"    {entry!r},\n")
+        f.write("]\n\nBLOB = (\n")
+        for i in range(0, len(b64), 100):
+            f.write(f'    "{b64[i:i + 100]}"\n')
+        f.write(")\n")
+    print(f"  Wrote {ASSETS_DATA} ({offset:,} asset bytes -> {len(b64):,} encoded)")
+
+
 def build():
     print(f"\n{'='*60}")
     print(f"  Building {APP_NAME}")
@@ -102,21 +133,21 @@ def build():
     print("\n[2/4] Preparing assets...")
     
     # Auto-extract assets from assets_data.py if folder is missing
-    expected_assets = ["icon.ico", "icon.png", "logo.png", "logo_light.png"]
     assets_dir = "assets"
-    if not all(os.path.exists(os.path.join(assets_dir, f)) for f in expected_assets):
+    if not all(os.path.exists(os.path.join(assets_dir, f)) for f in ASSET_FILES):
         print("  Assets folder incomplete — extracting from assets_data.py...")
         try:
             import base64
-            from assets_data import ASSETS
+            import zlib
+            from assets_data import BLOB, MANIFEST
+            blob = memoryview(zlib.decompress(base64.b64decode(BLOB)))
             os.makedirs(assets_dir, exist_ok=True)
-            for filename, b64_parts in ASSETS.items():
+            for filename, offset, length in MANIFEST:
                 filepath = os.path.join(assets_dir, filename)
                 if not os.path.exists(filepath):
-                    data = base64.b64decode("".join(b64_parts))
                     with open(filepath, "wb") as f:
-                        f.write(data)
-                    print(f"    Extracted: {filename} ({len(data):,} bytes)")
+                        f.write(blob[offset:offset + length])
+                    print(f"    Extracted: {filename} ({length:,} bytes)")
         except ImportError:
             print("  WARNING: assets_data.py not found — icons may be missing")
     
@@ -189,4 +220,7 @@ def build():
 
 
 if __name__ == "__main__":
-    build()
+    if "--embed-assets" in sys.argv[1:]:
+        write_assets_data()
+    else:
+        build()
@@ -26,8 +26,12 @@ import os
 import sys
 import time
 import threading
+import weakref
 import tkinter as tk
-from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import repeat
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime, timedelta
 from typing import Optional
@@ -35,10 +39,14 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+_ICON_PHOTO_CACHE = {}  # {png path: tk.PhotoImage} decoded window icons
+
 # == PyInstaller resource path helper ==
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource - works for dev and PyInstaller bundle.
-    Checks multiple locations to handle different working directories."""
+    Checks multiple locations to handle different working directories.
+    Memoized: the probed locations don't change while the app runs."""
     # 1) PyInstaller frozen bundle
     if getattr(sys, 'frozen', False):
         candidate = os.path.join(sys._MEIPASS, relative_path)
@@ -69,6 +77,7 @@ def _ensure_assets():
     """Extract embedded assets to disk if the assets/ folder is missing.
     This makes the app self-contained — no separate asset files needed."""
     import base64
+    import zlib
     script_dir = os.path.dirname(os.path.abspath(__file__))
     assets_dir = os.path.join(script_dir, "assets")
 
@@ -80,24 +89,29 @@ def _ensure_assets():
 
     # Try to import embedded data
     try:
-        from assets_data import ASSETS
+        from assets_data import BLOB, MANIFEST
     except ImportError:
         logging.warning("assets/ folder missing and assets_data.py not found — logos will be unavailable")
         return
 
+    # One decode + decompress for all assets; files are zero-copy slices of it
+    try:
+        blob = memoryview(zlib.decompress(base64.b64decode(BLOB)))
+    except Exception as e:
+        logging.warning("Failed to unpack embedded assets: %s", e)
+        return
+
     # Extract assets to disk
     os.makedirs(assets_dir, exist_ok=True)
-    for filename, b64_parts in ASSETS.items():
+    for filename, offset, length in MANIFEST:
         filepath = os.path.join(assets_dir, filename)
         if not os.path.exists(filepath):
             try:
-                b64_str = "".join(b64_parts)
-                data = base64.b64decode(b64_str)
                 with open(filepath, "wb") as f:
-                    f.write(data)
-                logging.info(f"Extracted asset: {filepath} ({len(data):,} bytes)")
+                    f.write(blob[offset:offset + length])
+                logging.info("Extracted asset: %s (%d bytes)", filepath, length)
             except Exception as e:
-                logging.warning(f"Failed to extract {filename}: {e}")
+                logging.warning("Failed to extract %s: %s", filename, e)
 
 # Run asset extraction at import time
 _ensure_assets()
@@ -127,7 +141,9 @@ try:
     matplotlib.use('Agg')
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
     from matplotlib.figure import Figure
+    from matplotlib.patches import Rectangle
     import matplotlib.dates as mdates
+    import numpy as np  # installed with matplotlib
 except ImportError:
     print("ERROR: matplotlib not installed. Run: pip install matplotlib")
     sys.exit(1)
@@ -183,6 +199,15 @@ FONT_SIZE_BODY = 12
 FONT_SIZE_SMALL = 11
 FONT_SIZE_TINY = 10
 
+# Shared font specs, so widgets reuse one tuple instead of building their own
+FONT_HEADING_BOLD = (FONT_FAMILY, FONT_SIZE_HEADING, "bold")
+FONT_BODY = (FONT_FAMILY, FONT_SIZE_BODY)
+FONT_BODY_BOLD = (FONT_FAMILY, FONT_SIZE_BODY, "bold")
+FONT_SMALL = (FONT_FAMILY, FONT_SIZE_SMALL)
+FONT_SMALL_BOLD = (FONT_FAMILY, FONT_SIZE_SMALL, "bold")
+FONT_TINY = (FONT_FAMILY, FONT_SIZE_TINY)
+FONT_TINY_BOLD = (FONT_FAMILY, FONT_SIZE_TINY, "bold")
+
 # -- Layout --
 SIDEBAR_WIDTH = 250
 CARD_CORNER_RADIUS = 8
@@ -190,6 +215,15 @@ CARD_PADDING = 16
 BUTTON_CORNER_RADIUS = 6
 BUTTON_HEIGHT = 36
 INPUT_HEIGHT = 36
+TAG_TREE_PAGE = 500  # tag rows inserted per group before a "Show more" row
+DRAW_COOLDOWN_MS = 33  # minimum gap between queued full chart redraws (~30 fps)
+CURSOR_THROTTLE_MS = 16  # minimum gap between smart-cursor updates (~60 Hz)
+
+# Sidebar navigation: (key, label, App method that shows the view)
+NAV_SPECS = (
+    ("trend", "\U0001F4C8  Trend View", "_show_trend_view"),
+    ("connect", "\U0001F50C  PLC Connection", "_show_connect_view"),
+)
 
 # -- Application Info --
 APP_NAME = "PLC Trend Tool"
@@ -221,9 +255,14 @@ BIT_ADDRESSABLE_TYPES = {
 # SLC 500 / MicroLogix / PLC-5 data file types and structure
 SLC_CONTROLLER_TYPES = {"SLC 500 / MicroLogix", "PLC-5"}
 SLC_PROBE_TYPES = ["N", "F", "B", "T", "C", "R", "ST", "A", "L"]
+SLC_SCAN_WORKERS = 4  # parallel sessions used while scanning data files
 SLC_DEFAULT_FILES = {
     0: "O", 1: "I", 2: "S", 3: "B", 4: "T", 5: "C", 6: "R", 7: "N", 8: "F",
 }
+# Element-0 probe addresses for the file scan, built once: (file_num, file_type, address)
+SLC_DEFAULT_PROBES = tuple((fn, ft, "%s%d:0" % (ft, fn)) for fn, ft in SLC_DEFAULT_FILES.items())
+SLC_USER_PROBES = tuple((fn, tuple((ft, "%s%d:0" % (ft, fn)) for ft in SLC_PROBE_TYPES))
+                        for fn in range(9, 256))  # (file_num, ((file_type, address), ...))
 SLC_FILE_TYPE_NAMES = {
     "O": "Output", "I": "Input", "S": "Status", "B": "Binary",
     "T": "Timer", "C": "Counter", "R": "Control", "N": "Integer",
@@ -279,25 +318,56 @@ def smart_tag_name(tag, all_tags=None):
     return short if len(tag) > 40 else tag
 
 
-def resolve_color(color) -> str:
-    """Resolve a (light, dark) tuple to a single string for raw tkinter widgets."""
-    if isinstance(color, (list, tuple)) and len(color) == 2:
-        try:
-            mode = ctk.get_appearance_mode()
-            return color[0] if mode == "Light" else color[1]
-        except Exception:
-            return color[1]
+_color_mode = None  # cached ctk appearance mode, cleared on theme change
+
+
+def _invalidate_color_cache():
+    """Forget the cached appearance mode -- call after ctk.set_appearance_mode."""
+    global _color_mode
+    _color_mode = None
+
+
+@lru_cache(maxsize=512)
+def _resolve_color_for(color, light: bool) -> str:
+    if isinstance(color, tuple) and len(color) == 2:
+        return color[0] if light else color[1]
     if isinstance(color, str) and " " in color and color.startswith("#"):
         parts = color.split()
         if len(parts) == 2 and all(p.startswith("#") for p in parts):
-            try:
-                mode = ctk.get_appearance_mode()
-                return parts[0] if mode == "Light" else parts[1]
-            except Exception:
-                return parts[1]
+            return parts[0] if light else parts[1]
     return color
 
 
+def resolve_color(color) -> str:
+    """Resolve a (light, dark) tuple to a single string for raw tkinter widgets."""
+    global _color_mode
+    if _color_mode is None:
+        try: _color_mode = ctk.get_appearance_mode()
+        except Exception: _color_mode = "Dark"
+    if isinstance(color, list):
+        color = tuple(color)
+    try:
+        return _resolve_color_for(color, _color_mode == "Light")
+    except TypeError:  # unhashable -- nothing to resolve
+        return color
+
+
+def _toolbar_glyph(master, shape, size=10, color="#FFFFFF"):
+    """Draw a small play/stop/pause glyph into a transparent PhotoImage, so
+    toolbar buttons don't depend on symbol-font fallback for the icon."""
+    img = tk.PhotoImage(master=master, width=size, height=size)
+    if shape == "play":
+        for y in range(size):
+            img.put(color, to=(1, y, 1 + min(min(y, size - 1 - y) * 2 + 1, size - 1), y + 1))
+    elif shape == "stop":
+        img.put(color, to=(1, 1, size - 1, size - 1))
+    elif shape == "pause":
+        bar = max(size // 3, 2)
+        img.put(color, to=(1, 0, 1 + bar, size))
+        img.put(color, to=(size - 1 - bar, 0, size - 1, size))
+    return img
+
+
 # =========================================================================
 # SETTINGS PERSISTENCE
 # =========================================================================
@@ -308,7 +378,15 @@ def get_settings_path():
         base = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base, "plc_trend_tool_settings.json")
 
+_settings_cache = None
+_last_saved_settings = None
+
 def load_settings():
+    """Return the app settings dict. The file is parsed once; later calls
+    return the same dict, which save_settings writes back when it changes."""
+    global _settings_cache, _last_saved_settings
+    if _settings_cache is not None:
+        return _settings_cache
     defaults = {
         "theme": "Dark", "last_ip": "", "last_slot": 0,
         "last_controller": "ControlLogix", "sample_rate": "1 sec",
@@ -321,14 +399,27 @@ def load_settings():
             with open(path, "r") as f:
                 saved = json.load(f)
             defaults.update(saved)
+            if saved == defaults:
+                # File already holds every key — the first save only writes if something changes
+                _last_saved_settings = json.dumps(defaults, indent=2)
         except Exception:
             pass
+    _settings_cache = defaults
     return defaults
 
 def save_settings(settings):
+    """Write settings atomically (temp file + os.replace); skip if unchanged."""
+    global _last_saved_settings
     try:
-        with open(get_settings_path(), "w") as f:
-            json.dump(settings, f, indent=2)
+        text = json.dumps(settings, indent=2)
+        if text == _last_saved_settings:
+            return
+        path = get_settings_path()
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        _last_saved_settings = text
     except Exception:
         pass
 
@@ -421,72 +512,112 @@ class PLCManager:
             return []
         files_found = []
         total_probes = 0
+        stats_lock = threading.Lock()  # guards total_probes/progress across workers
 
-        def try_read(addr):
+        def try_read(comm, addr):
             """Attempt to read an address; returns True if successful."""
             nonlocal total_probes
-            total_probes += 1
+            with stats_lock:
+                total_probes += 1
             try:
-                result = self.comm.read(addr)
+                result = comm.read(addr)
                 return result.error is None
             except Exception:
                 return False
 
-        def find_file_size(prefix, file_num, max_size=1000):
-            """Binary search for the number of elements in a data file."""
-            # Start with a quick upper bound check
-            if not try_read(f"{prefix}{file_num}:0"):
-                return 0
+        def find_file_size(comm, prefix, file_num, max_size=1000):
+            """Binary search for the number of elements in a data file
+            (element 0 already known good)."""
+            base = "%s%d:" % (prefix, file_num)
             low, high = 1, max_size
             # Quick exponential probe to find approximate upper bound
             probe = 1
             while probe <= max_size:
-                if try_read(f"{prefix}{file_num}:{probe}"):
+                if try_read(comm, base + str(probe)):
                     low = probe + 1
                     probe *= 2
                 else:
                     high = probe
                     break
-                probe = min(probe, max_size)
             # Binary search between low and high
             while low < high:
                 mid = (low + high) // 2
-                if try_read(f"{prefix}{file_num}:{mid}"):
+                if try_read(comm, base + str(mid)):
                     low = mid + 1
                 else:
                     high = mid
             return low  # low = first failing index = count of valid elements
 
-        # Phase 1: Check default files (0-8) — known types
-        if progress_callback:
-            progress_callback("Scanning default data files (0-8)...")
-        for file_num, file_type in SLC_DEFAULT_FILES.items():
-            addr = f"{file_type}{file_num}:0"
-            if try_read(addr):
-                size = find_file_size(file_type, file_num)
+        def add_files(comm, files):
+            for file_num, file_type in files:
+                size = find_file_size(comm, file_type, file_num)
                 type_name = SLC_FILE_TYPE_NAMES.get(file_type, file_type)
                 files_found.append({
                     "file_num": file_num, "file_type": file_type,
                     "type_name": type_name, "size": size,
                 })
 
-        # Phase 2: Probe user files (9-255)
-        if progress_callback:
-            progress_callback("Scanning user data files (9-255)...")
-        for file_num in range(9, 256):
-            if progress_callback and file_num % 25 == 0:
-                progress_callback(f"Scanning data files... ({file_num}/255)")
-            # Try common types — N and F first since they're most common user files
-            for file_type in SLC_PROBE_TYPES:
-                addr = f"{file_type}{file_num}:0"
-                if try_read(addr):
-                    size = find_file_size(file_type, file_num)
-                    type_name = SLC_FILE_TYPE_NAMES.get(file_type, file_type)
-                    files_found.append({
-                        "file_num": file_num, "file_type": file_type,
-                        "type_name": type_name, "size": size,
-                    })
-                    break  # Only one type per file number
+        # Extra sessions so probes of different files overlap their network
+        # round trips. Any session that fails to open is simply not used --
+        # with none, the scan runs serially on the main connection.
+        sessions = [self.comm]
+        for _ in range(SLC_SCAN_WORKERS - 1):
+            try:
+                drv = SLCDriver(self.ip)
+                drv.open()
+                sessions.append(drv)
+            except Exception:
+                break
+
+        def run_parallel(work, items):
+            """Split items across the sessions and run work(comm, part) for each."""
+            parts = [(comm, items[k::len(sessions)]) for k, comm in enumerate(sessions)]
+            parts = [(comm, part) for comm, part in parts if part]
+            if len(parts) <= 1:
+                for comm, part in parts:
+                    work(comm, part)
+                return
+            with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+                for fut in as_completed([pool.submit(work, comm, part) for comm, part in parts]):
+                    fut.result()
+
+        try:
+            # Phase 1: Check default files (0-8) — known types
+            if progress_callback:
+                progress_callback("Scanning default data files (0-8)...")
+            to_size = [(fn, ft) for fn, ft, addr in SLC_DEFAULT_PROBES if try_read(self.comm, addr)]
+
+            # Phase 2: Probe user files (9-255)
+            if progress_callback:
+                progress_callback("Scanning user data files (9-255)...")
+            found = {}  # file_num -> file_type
+            done = 0
+
+            def probe_files(comm, part):
+                nonlocal done
+                for file_num, type_probes in part:
+                    # Try common types — N and F first since they're most common user files
+                    for file_type, addr in type_probes:
+                        if try_read(comm, addr):
+                            with stats_lock:
+                                found[file_num] = file_type
+                            break  # Only one type per file number
+                    with stats_lock:
+                        done += 1
+                        msg = f"Scanning data files... ({done}/{len(SLC_USER_PROBES)})" if done % 25 == 0 else None
+                    if progress_callback and msg:
+                        progress_callback(msg)
+
+            run_parallel(probe_files, list(SLC_USER_PROBES))
+            to_size.extend(sorted(found.items()))
+
+            if progress_callback:
+                progress_callback(f"Sizing {len(to_size)} data files...")
+            run_parallel(add_files, to_size)
+        finally:
+            for drv in sessions[1:]:
+                try: drv.close()
+                except Exception: pass
 
         files_found.sort(key=lambda f: f["file_num"])
         logger.info(f"SLC scan complete: {len(files_found)} files found, {total_probes} probes")
@@ -592,16 +723,12 @@ class PLCManager:
             if self.controller_type in SLC_CONTROLLER_TYPES:
                 with self._lock:
                     values = {}
+                    # SLCDriver sends one PCCC request per address either way,
+                    # so read tag by tag and keep a bad address to its own value
                     for tag in tag_names:
                         try:
                             ret = self.comm.read(tag)
-                            if ret.error is None:
-                                val = ret.value
-                                if isinstance(val, bool):
-                                    val = int(val)
-                                values[tag] = val
-                            else:
-                                values[tag] = None
+                            values[tag] = ret.value if ret.error is None else None
                         except Exception:
                             values[tag] = None
                     return values
@@ -609,47 +736,176 @@ class PLCManager:
             with self._lock:
                 if len(tag_names) == 1:
                     ret = self.comm.Read(tag_names[0])
-                    val = ret.Value if ret.Status == "Success" else None
-                    if isinstance(val, bool): val = int(val)
-                    return {tag_names[0]: val}
+                    return {tag_names[0]: ret.Value if ret.Status == "Success" else None}
                 else:
                     ret = self.comm.Read(tag_names)
                     values = {}
                     for r in ret:
-                        val = r.Value if r.Status == "Success" else None
-                        if isinstance(val, bool): val = int(val)
-                        values[r.TagName] = val
+                        # Intern so keys are the same objects as the trend's tag names
+                        values[sys.intern(r.TagName)] = r.Value if r.Status == "Success" else None
                     return values
         except Exception:
             return {}
 
 
+def _sample_value(v):
+    """Convert a stored float sample back to a plain value (NaN -> None,
+    whole numbers -> int so integer tags display/export the way they were read)."""
+    if v != v:
+        return None
+    return int(v) if v.is_integer() else v
+
+
+def _nearest_index(date_nums, x):
+    """Index of the sample in the sorted date_nums array closest to x."""
+    idx = int(np.searchsorted(date_nums, x))
+    if idx >= len(date_nums):
+        return len(date_nums) - 1
+    if idx > 0 and x - date_nums[idx - 1] < date_nums[idx] - x:
+        return idx - 1
+    return idx
+
+
+_UNIX_EPOCH_DATENUM = None  # matplotlib date number of 1970-01-01, set on first use
+
+
+def _epoch_to_datenum(t):
+    """Matplotlib date number for epoch seconds t in local wall-clock time --
+    the same value date2num(datetime.fromtimestamp(t)) gives, without
+    building a datetime."""
+    global _UNIX_EPOCH_DATENUM
+    if _UNIX_EPOCH_DATENUM is None:
+        _UNIX_EPOCH_DATENUM = mdates.date2num(datetime(1970, 1, 1))
+    return (t + time.localtime(t).tm_gmtoff) / 86400.0 + _UNIX_EPOCH_DATENUM
+
+
+def _iso_stamps(date_nums):
+    """Format matplotlib date numbers as ISO-8601 strings with milliseconds,
+    vectorised through datetime64 instead of one datetime object per sample."""
+    us = np.round(np.asarray(date_nums) * 86400e6).astype("int64").astype("timedelta64[us]")
+    return np.datetime_as_string(np.datetime64(mdates.get_epoch(), "us") + us, unit="ms").tolist()
+
+
 # =========================================================================
 # TREND DATA MANAGER
 # =========================================================================
 class TrendDataManager:
+    """Trend samples stored column-wise in NumPy buffers: one float64 array of
+    matplotlib date numbers plus one float64 array per tag, all sharing the same
+    valid range [_start:_n]. Missing/failed reads are stored as NaN so matplotlib
+    draws gaps. Buffers only ever grow by reallocating, and rows inside the valid
+    range are never rewritten, so arrays handed out by get_chart_data() stay
+    valid after later appends.
+
+    The buffers belong to the UI thread. The poll thread only calls push(),
+    which appends to a deque inbox (atomic in CPython); the UI timer moves
+    queued samples into the buffers with drain(). No lock is shared."""
+
+    MIN_CAPACITY = 4096
+
     def __init__(self, max_points=0):
-        self.data = []
+        self._reset_columns([])
         self.tags = []
         self.sample_rate = 1.0
         self.start_time = None
         self.trending = False
         self.max_points = max_points  # 0 = unlimited
-        self._lock = threading.Lock()
-        self.min_values = {}
-        self.max_values = {}
+        self._inbox = deque()  # (values, ts) from the poll thread, drained by the UI
+        self._reset_stats()
+
+    def _reset_columns(self, tags):
+        self._cap = max(self.MIN_CAPACITY, 2 * getattr(self, "max_points", 0))
+        self._start = 0           # first valid row (advances when max_points trims)
+        self._n = 0               # one past the last valid row
+        self._times = np.empty(self._cap)  # matplotlib date numbers
+        self._columns = {tag: np.full(self._cap, np.nan) for tag in tags}
+
+    def _ensure_columns(self, tags):
+        """Add NaN-filled columns for tags first seen mid-trend so rows stay aligned."""
+        for tag in tags:
+            if tag not in self._columns:
+                self._columns[tag] = np.full(self._cap, np.nan)
+
+    def _grow(self):
+        """Move the valid rows into fresh arrays with room to append. New arrays
+        are allocated rather than shifting in place so earlier views are untouched."""
+        keep = self._n - self._start
+        cap = max(self.MIN_CAPACITY, 2 * keep, 2 * self.max_points)
+        times = np.empty(cap)
+        times[:keep] = self._times[self._start:self._n]
+        self._times = times
+        for tag, col in self._columns.items():
+            new = np.full(cap, np.nan)
+            new[:keep] = col[self._start:self._n]
+            self._columns[tag] = new
+        self._cap, self._start, self._n = cap, 0, keep
+
+    def _append_row(self, ts, values):
+        """Append one sample. ts is epoch seconds (time.time()) or a datetime."""
+        if self._n == self._cap:
+            self._grow()
+        self._ensure_columns(values)
+        n = self._n
+        self._times[n] = mdates.date2num(ts) if isinstance(ts, datetime) else _epoch_to_datenum(ts)
+        for tag, val in values.items():
+            if val is not None:
+                try: self._columns[tag][n] = val
+                except (TypeError, ValueError): pass  # non-numeric -- leave a gap
+        self._n = n + 1
+        if self.max_points > 0 and self._n - self._start > self.max_points:
+            self._start = self._n - self.max_points
+
+    def _reset_stats(self):
         self.live_values = {}
+        self._stat_index = {}     # tag -> position in _min/_max
+        self._min = np.empty(0)   # running minimum per tag (+inf until a value arrives)
+        self._max = np.empty(0)   # running maximum per tag (-inf until a value arrives)
+
+    def _track_values(self, values):
+        """Update live values and the running min/max. The row is turned into
+        one array and folded in with np.fmin/np.fmax, which skip NaN gaps."""
+        self.live_values.update(values)
+        index = self._stat_index
+        if not index.keys() >= values.keys():
+            for tag in values:
+                index.setdefault(tag, len(index))
+            grow = len(index) - len(self._min)
+            self._min = np.concatenate((self._min, np.full(grow, np.inf)))
+            self._max = np.concatenate((self._max, np.full(grow, -np.inf)))
+        row = np.full(len(index), np.nan)
+        try:
+            row[[index[tag] for tag in values]] = [np.nan if v is None else v for v in values.values()]
+        except (TypeError, ValueError):
+            for tag, v in values.items():
+                try: row[index[tag]] = np.nan if v is None else v
+                except (TypeError, ValueError): pass  # non-numeric -- no min/max
+        np.fmin(self._min, row, out=self._min)
+        np.fmax(self._max, row, out=self._max)
+
+    def _stat_dict(self, arr):
+        vals = arr.tolist()
+        inf = float("inf")
+        return {tag: _sample_value(vals[i]) for tag, i in self._stat_index.items()
+                if vals[i] not in (inf, -inf)}
+
+    @property
+    def min_values(self):
+        """{tag: minimum seen} for tags that have had at least one numeric value."""
+        return self._stat_dict(self._min)
+
+    @property
+    def max_values(self):
+        """{tag: maximum seen} for tags that have had at least one numeric value."""
+        return self._stat_dict(self._max)
 
     def start(self, tags, sample_rate):
-        with self._lock:
-            self.data = []
-            self.tags = list(tags)
-            self.sample_rate = sample_rate
-            self.start_time = datetime.now().isoformat(timespec="milliseconds")
-            self.trending = True
-            self.min_values = {}
-            self.max_values = {}
-            self.live_values = {}
+        self._inbox.clear()
+        self.tags = [sys.intern(t) for t in tags]
+        self._reset_columns(self.tags)
+        self.sample_rate = sample_rate
+        self.start_time = datetime.now().isoformat(timespec="milliseconds")
+        self.trending = True
+        self._reset_stats()
 
     def stop(self):
         self.trending = False
@@ -657,49 +913,65 @@ class TrendDataManager:
     def update_tags(self, new_tags):
         """Update the tag list mid-trend. New tags start collecting on next poll.
         Removed tags keep their historical data in existing points."""
-        with self._lock:
-            self.tags = list(new_tags)
-
-    def add_point(self, values):
-        ts = datetime.now()
-        point = {"timestamp": ts.isoformat(timespec="milliseconds"), "dt": ts, "values": values}
-        with self._lock:
-            self.data.append(point)
-            if self.max_points > 0 and len(self.data) > self.max_points:
-                self.data = self.data[-self.max_points:]
-            for tag, val in values.items():
-                self.live_values[tag] = val
-                if val is not None:
-                    if tag not in self.min_values or val < self.min_values[tag]:
-                        self.min_values[tag] = val
-                    if tag not in self.max_values or val > self.max_values[tag]:
-                        self.max_values[tag] = val
+        self.tags = [sys.intern(t) for t in new_tags]
+        self._ensure_columns(self.tags)
+
+    def add_point(self, values, ts=None):
+        if ts is None:
+            ts = time.time()
+        self._append_row(ts, values)
+        self._track_values(values)
+
+    def push(self, values, ts):
+        """Queue a sample (ts = time.time()) from the poll thread. Safe without a lock."""
+        self._inbox.append((values, ts))
+
+    def drain(self):
+        """Move queued samples into the buffers (UI thread). Returns the count."""
+        inbox = self._inbox
+        count = 0
+        while inbox:
+            values, ts = inbox.popleft()
+            self._append_row(ts, values)
+            self._track_values(values)
+            count += 1
+        return count
 
     def get_chart_data(self):
-        with self._lock:
-            result = {}
+        """Return {tag: (date_nums, values)} as ndarray views of the valid rows.
+        X values are matplotlib date numbers (see mdates.num2date)."""
+        lo, hi = self._start, self._n
+        times = self._times[lo:hi]  # one array shared by every tag
+        columns = self._columns
+        data = {tag: (times, columns[tag][lo:hi]) for tag in self.tags if tag in columns}
+        if len(data) < len(self.tags):  # tags without a column yet plot as gaps
+            empty = np.full(hi - lo, np.nan)
             for tag in self.tags:
-                times = []
-                vals = []
-                for pt in self.data:
-                    times.append(pt["dt"])
-                    v = pt["values"].get(tag)
-                    # Use NaN for missing values (tag added mid-trend) so
-                    # matplotlib draws line gaps instead of choking on None
-                    vals.append(v if v is not None else float('nan'))
-                result[tag] = (times, vals)
-            return result
+                data.setdefault(tag, (times, empty))
+            data = {tag: data[tag] for tag in self.tags}  # keep tag order
+        return data
 
     def clear(self):
-        with self._lock:
-            self.data = []
-            self.min_values = {}
-            self.max_values = {}
-            self.live_values = {}
+        self._inbox.clear()
+        self._reset_columns(self.tags)
+        self._reset_stats()
+
+    def _snapshot(self):
+        """Return (timestamp strings, {tag: values list}) for export."""
+        self.drain()
+        lo, hi = self._start, self._n
+        stamps = _iso_stamps(self._times[lo:hi])
+        return stamps, {tag: [_sample_value(v) for v in col[lo:hi].tolist()]
+                        for tag, col in self._columns.items()}
 
     def export_pytrend(self, filepath, plc_ip, controller_type, slot):
-        with self._lock:
-            export_data = [{"timestamp": pt["timestamp"], "values": pt["values"]} for pt in self.data]
+        stamps, columns = self._snapshot()
+        tags = list(columns)
+        if tags:
+            rows = (dict(zip(tags, row)) for row in zip(*columns.values()))
+        else:
+            rows = ({} for _ in stamps)
+        export_data = [{"timestamp": ts, "values": vals} for ts, vals in zip(stamps, rows)]
         payload = {
             "version": "1.0",
             "appName": "PLC Trend Tool -- Southern Automation Solutions",
@@ -713,61 +985,105 @@ class TrendDataManager:
             },
             "data": export_data,
         }
-        with open(filepath, "w") as f:
-            json.dump(payload, f, indent=2)
+        # Compact separators keep json on its C encoder (indent forces the
+        # pure-Python path); encode once and write bytes in one call
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        with open(filepath, "wb") as f:
+            f.write(data)
 
     def export_csv(self, filepath):
-        with self._lock:
-            data_copy = list(self.data)
-        if not data_copy:
+        stamps, columns = self._snapshot()
+        if not stamps:
             return
-        with open(filepath, "w", newline="") as f:
+        cols = [columns.get(t) or repeat("") for t in self.tags]
+        # writerows pulls straight from the zipped columns -- no per-row lists
+        with open(filepath, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(["Timestamp"] + self.tags)
-            for pt in data_copy:
-                row = [pt["timestamp"]] + [pt["values"].get(t, "") for t in self.tags]
-                writer.writerow(row)
+            writer.writerows(zip(stamps, *cols))
 
     def import_pytrend(self, filepath):
-        with open(filepath, "r") as f:
-            content = json.load(f)
+        with open(filepath, "rb") as f:
+            content = json.loads(f.read())
         meta = content.get("metadata", {})
         raw_data = content.get("data", [])
-        with self._lock:
-            self.data = []
-            self.tags = meta.get("tags", [])
-            self.sample_rate = meta.get("sampleRate", 1.0)
-            self.start_time = meta.get("startTime", "")
-            self.trending = False
-            self.min_values = {}
-            self.max_values = {}
-            self.live_values = {}
-            for pt in raw_data:
-                ts_str = pt.get("timestamp", "")
-                try: dt = datetime.fromisoformat(ts_str)
-                except (ValueError, TypeError): dt = datetime.now()
-                point = {"timestamp": ts_str, "dt": dt, "values": pt.get("values", {})}
-                self.data.append(point)
-                for tag, val in point["values"].items():
-                    self.live_values[tag] = val
-                    if val is not None:
-                        if tag not in self.min_values or val < self.min_values[tag]:
-                            self.min_values[tag] = val
-                        if tag not in self.max_values or val > self.max_values[tag]:
-                            self.max_values[tag] = val
+        self.tags = [sys.intern(t) for t in meta.get("tags", [])]
+        self.sample_rate = meta.get("sampleRate", 1.0)
+        self.start_time = meta.get("startTime", "")
+        self.trending = False
+        self._reset_stats()
+        stamps = []
+        rows = []
+        for pt in raw_data:
+            ts_str = pt.get("timestamp", "")
+            try: dt = datetime.fromisoformat(ts_str)
+            except (ValueError, TypeError): dt = datetime.now()
+            stamps.append(dt)
+            rows.append(pt.get("values", {}))
+        self._load_rows(stamps, rows)
+        for values in rows:
+            self.live_values.update(values)
+        self._stat_index = {tag: i for i, tag in enumerate(self._columns)}
+        visible = slice(self._start, self._n)
+        self._min = np.array([np.fmin.reduce(col[visible], initial=np.inf) for col in self._columns.values()])
+        self._max = np.array([np.fmax.reduce(col[visible], initial=-np.inf) for col in self._columns.values()])
         return meta
 
+    def _load_rows(self, stamps, rows):
+        """Replace the buffers with whole columns built in one pass per tag.
+        Every loaded row is kept -- max_points only limits live recording."""
+        tags = dict.fromkeys(self.tags)
+        for values in rows:
+            tags.update(dict.fromkeys(values))
+        n = len(stamps)
+        self._inbox.clear()
+        self._cap = max(self.MIN_CAPACITY, 2 * n)
+        self._times = np.empty(self._cap)
+        if n:
+            self._times[:n] = mdates.date2num(stamps)
+        nan = np.nan
+        self._columns = {}
+        for tag in tags:
+            col = np.full(self._cap, nan)
+            vals = [v.get(tag) for v in rows]
+            try:
+                col[:n] = [nan if v is None else v for v in vals]
+            except (TypeError, ValueError):
+                # Mixed/non-numeric values -- fall back to per-sample conversion
+                for i, v in enumerate(vals):
+                    try: col[i] = nan if v is None else v
+                    except (TypeError, ValueError): pass
+            self._columns[tag] = col
+        self._n = n
+        self._start = 0
+
     @property
     def point_count(self):
-        with self._lock:
-            return len(self.data)
+        return self._n - self._start
+
+    def _dt_at(self, row):
+        return mdates.num2date(self._times[row]).replace(tzinfo=None)
+
+    @property
+    def first_dt(self):
+        """Timestamp of the oldest point, or None. Built on demand from the
+        date-number column so appends never allocate datetimes."""
+        return self._dt_at(self._start) if self._n > self._start else None
+
+    @property
+    def last_dt(self):
+        """Timestamp of the newest point, or None."""
+        return self._dt_at(self._n - 1) if self._n > self._start else None
 
     def get_time_range(self):
         """Return (first_dt, last_dt) or (None, None) if no data."""
-        with self._lock:
-            if not self.data:
-                return None, None
-            return self.data[0]["dt"], self.data[-1]["dt"]
+        return self.first_dt, self.last_dt
+
+    def get_time_range_num(self):
+        """Like get_time_range(), as matplotlib date numbers (no datetimes built)."""
+        if self._n > self._start:
+            return float(self._times[self._start]), float(self._times[self._n - 1])
+        return None, None
 
 
 # =========================================================================
@@ -777,10 +1093,16 @@ class PLCTrendTool(ctk.CTk):
     """Main application window -- layout matches SAS Network Diagnostic Tool."""
 
     def __init__(self):
-        super().__init__()
-        self.settings = load_settings()
+        # Read settings on a worker while CTk builds the root window; the
+        # file may live on a slow share and nothing needs it before theming.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            settings_future = pool.submit(load_settings)
+            super().__init__()
+            self.settings = settings_future.result()
         theme = self.settings.get("theme", "Dark")
         ctk.set_appearance_mode(theme)
+        _invalidate_color_cache()
+        self._refresh_theme_colors()
         ctk.set_default_color_theme("blue")
 
         self.title(APP_FULL_NAME)
@@ -808,11 +1130,18 @@ class PLCTrendTool(ctk.CTk):
         self.all_prog_tags = {}
         self.udt_defs = {}  # UDT type definitions from pylogix
         self._struct_items = {}  # tree item id -> struct metadata for lazy expansion
+        self._iid_to_tag = {}    # tree item id -> tag path for trendable rows
+        self._more_rows = {}     # "Show more" row id -> (parent, tags, next index, short names)
+        self._tag_sync_after = None  # pending coalesced _sync_tags_to_chart
 
         # Smart cursor state
         self._cursor_vline = None
         self._cursor_annotations = []
         self._cursor_dots = []
+        self._cursor_dot_map = {}          # {tag: value dot Line2D} reused across moves
+        self._cursor_pending_event = None  # latest motion event not yet drawn
+        self._cursor_timer = None          # after() id of the pending cursor update
+        self._cursor_last_ts = 0.0         # perf_counter() of the last cursor update
         self._cursor_enabled = self.settings.get("smart_cursor", True)
         self._inspect_time = None  # clicked time for table inspect (when stopped)
 
@@ -824,16 +1153,28 @@ class PLCTrendTool(ctk.CTk):
 
         # Chart state
         self._tag_scales = {}           # {tag: {"auto": True, "min": 0, "max": 100}}
+        self._manual_ylims = {}         # {tag: (min, max)} for tags whose scale isn't auto
         self._line_props = {}           # {tag: {"color": str, "width": float, "style": str}}
+        self._line_props_cache = {}     # {tag: (color, width, style)} resolved by _get_line_props
         self._chart_bg = {}             # {tag: color_hex} per-chart background color overrides
         self._tag_order = []            # display order of tags in isolated mode
+        self._ordered_tags_cache = None # cached _get_ordered_tags() result, None = stale
         self.axes = []                  # list of axes (single subplot)
         self.lines = {}                 # {tag: Line2D}
-        self._syncing_xlim = False      # guard for xlim sync callbacks
-        self._drag_state = None         # drag-reorder state: {"src_idx": int, "highlight": artist}
+        self._active_lines = []         # [(tag, Line2D)] in display order, rebuilt with the chart
+        self._widget_state = {}         # {id(widget): last kwargs} for _configure_if_changed
+        self._pending_xlim = None       # latest xlim to copy to every isolated subplot
+        self._xlim_cids = weakref.WeakKeyDictionary()  # {axes: xlim_changed callback id}
+        self._xlim_flush_scheduled = False
+        self._drag_state = None         # drag-reorder state: {"src_idx": int, "highlights": [Rectangle per axis]}
         self._fullscreen_tag = None     # tag name when a single chart is expanded to fill chart area
         self._xaxis_drag = None         # state for x-axis click-drag panning
         self._chart_zoom = 1.0          # zoom multiplier for isolated chart heights (1.0 = auto-fit)
+        self._last_zoom_key = None      # geometry the chart zoom was last applied for
+        self._resize_after = None       # pending after() id for the debounced chart resize
+        self._time_formatter = mdates.DateFormatter("%H:%M:%S")  # shared x-axis formatter
+        self._axes_layout_dirty = True  # axes rebuilt; formatter/label layout needs reapplying
+        self._chart_layout = None       # _chart_layout_key() the current axes were built for
 
         # Time window and display state
         self._time_span_seconds = self.settings.get("time_span", 30)
@@ -855,14 +1196,17 @@ class PLCTrendTool(ctk.CTk):
         CustomTkinter overrides iconbitmap in __init__, so we must:
         1. Set AppUserModelID (Windows) so taskbar uses OUR icon not Python's
         2. Use iconphoto for taskbar/ALT-TAB (CTk does NOT override this)
-        3. Use iconbitmap with retries for title bar (CTk overrides once)
+        3. Use iconbitmap for the title bar once the window is mapped
         """
         ico_path = resource_path(os.path.join("assets", "icon.ico"))
         png_path = resource_path(os.path.join("assets", "icon.png"))
         logo_path = resource_path(os.path.join("assets", "logo.png"))
 
-        for label, path in [("ICO", ico_path), ("PNG", png_path), ("Logo", logo_path)]:
-            logging.info(f"Icon [{label}]: {path} -> {'FOUND' if os.path.exists(path) else 'MISSING'}")
+        ico_exists, png_exists, logo_exists = (os.path.exists(p) for p in (ico_path, png_path, logo_path))
+        if logger.isEnabledFor(logging.INFO):
+            for label, path, found in [("ICO", ico_path, ico_exists), ("PNG", png_path, png_exists),
+                                       ("Logo", logo_path, logo_exists)]:
+                logging.info("Icon [%s]: %s -> %s", label, path, "FOUND" if found else "MISSING")
 
         # Step 1: Windows AppUserModelID — makes taskbar show our icon
         # Without this, Windows groups the app under "python.exe" icon
@@ -874,35 +1218,43 @@ class PLCTrendTool(ctk.CTk):
                 )
                 logging.info("Set Windows AppUserModelID")
             except Exception as e:
-                logging.warning(f"AppUserModelID failed: {e}")
+                logging.warning("AppUserModelID failed: %s", e)
 
         # Step 2: iconphoto — sets taskbar + ALT-TAB icon
         # CTk does NOT override this, so it sticks reliably
-        icon_file = png_path if os.path.exists(png_path) else (
-            logo_path if os.path.exists(logo_path) else None)
+        icon_file = png_path if png_exists else (logo_path if logo_exists else None)
         if icon_file:
             try:
-                icon_img = tk.PhotoImage(file=icon_file)
+                icon_img = _ICON_PHOTO_CACHE.get(icon_file)
+                if icon_img is None or icon_img.tk is not self.tk:
+                    # PhotoImages belong to one Tk interpreter -- decode again for a new one
+                    icon_img = _ICON_PHOTO_CACHE[icon_file] = tk.PhotoImage(file=icon_file)
                 self.iconphoto(True, icon_img)
                 self._icon_photo_ref = icon_img  # prevent GC
-                logging.info(f"iconphoto set from: {icon_file}")
+                logging.info("iconphoto set from: %s", icon_file)
             except Exception as e:
-                logging.warning(f"iconphoto failed: {e}")
+                logging.warning("iconphoto failed: %s", e)
 
         # Step 3: iconbitmap — sets the small icon in the title bar (Windows)
-        # CTk sets its own icon during __init__, so we override after.
-        # Multiple attempts at different delays to ensure we win the race.
-        if os.path.exists(ico_path):
-            def _set_ico():
+        # CTk schedules its own default icon during __init__ but skips it once
+        # iconbitmap() has been called, so one call when the window is first
+        # mapped is enough.
+        if ico_exists:
+            ico_set = False
+
+            def _set_ico(event=None):
+                # Disarm rather than unbind: before Python 3.13, unbind() drops
+                # every <Map> handler on the root, not just this one
+                nonlocal ico_set
+                if ico_set or (event is not None and event.widget is not self):
+                    return  # already done, or <Map> from a child widget
+                ico_set = True
                 try:
                     self.iconbitmap(ico_path)
-                    logging.info(f"iconbitmap set: {ico_path}")
+                    logging.info("iconbitmap set: %s", ico_path)
                 except Exception as e:
-                    logging.warning(f"iconbitmap failed: {e}")
-            # Try immediately, then again after CTk finishes its deferred setup
-            self.after(50, _set_ico)
-            self.after(200, _set_ico)
-            self.after(600, _set_ico)
+                    logging.warning("iconbitmap failed: %s", e)
+            self.bind("<Map>", _set_ico, add="+")
 
     # == SIDEBAR ==
     def _build_sidebar(self):
@@ -920,11 +1272,15 @@ class PLCTrendTool(ctk.CTk):
         try:
             dark_logo_path = resource_path(os.path.join("assets", "logo.png"))
             light_logo_path = resource_path(os.path.join("assets", "logo_light.png"))
-            logging.info(f"Sidebar logo paths: dark={dark_logo_path} (exists={os.path.exists(dark_logo_path)}), "
-                         f"light={light_logo_path} (exists={os.path.exists(light_logo_path)})")
-            if os.path.exists(dark_logo_path):
-                dark_img = Image.open(dark_logo_path).convert("RGBA")
-                light_img = Image.open(light_logo_path).convert("RGBA") if os.path.exists(light_logo_path) else dark_img
+            dark_exists = os.path.exists(dark_logo_path)
+            light_exists = os.path.exists(light_logo_path)
+            logging.info("Sidebar logo paths: dark=%s (exists=%s), light=%s (exists=%s)",
+                         dark_logo_path, dark_exists, light_logo_path, light_exists)
+            if dark_exists:
+                # Image.open only parses the header, so the size is known
+                # before any pixels are decoded
+                dark_img = Image.open(dark_logo_path)
+                light_img = Image.open(light_logo_path) if light_exists else dark_img
                 # Scale to fit sidebar width with padding, constrain height
                 max_w = SIDEBAR_WIDTH - 32
                 max_h = 100
@@ -934,30 +1290,45 @@ class PLCTrendTool(ctk.CTk):
                 if logo_h > max_h:
                     logo_h = max_h
                     logo_w = int(logo_h * aspect)
-                logging.info(f"Sidebar logo size: {logo_w}x{logo_h} (source: {dark_img.size})")
+                logging.info("Sidebar logo size: %dx%d (source: %s)", logo_w, logo_h, dark_img.size)
+                # Shrink the full-size sources once with a cheap filter so CTk's
+                # per-theme LANCZOS resize works on small images; 2x headroom
+                # keeps the logo sharp at up to 200% display scaling. RGB(A)
+                # sources are shrunk before the RGBA conversion; palette and
+                # other modes are converted first so resampling stays smooth.
+                bilinear = getattr(Image, "Resampling", Image).BILINEAR
+                def shrink(img):
+                    if img.mode not in ("RGB", "RGBA"):
+                        img = img.convert("RGBA")
+                    img.thumbnail((logo_w * 2, logo_h * 2), bilinear)
+                    return img if img.mode == "RGBA" else img.convert("RGBA")
+                dark_img = shrink(dark_img)
+                light_img = shrink(light_img) if light_exists else dark_img
                 ctk_logo = ctk.CTkImage(light_image=light_img, dark_image=dark_img, size=(logo_w, logo_h))
                 ctk.CTkLabel(logo_frame, text="", image=ctk_logo, fg_color="transparent").pack(expand=True)
                 self._logo_ref = ctk_logo
                 logo_loaded = True
             else:
-                logging.warning(f"Logo file not found at: {dark_logo_path}")
+                logging.warning("Logo file not found at: %s", dark_logo_path)
         except Exception as e:
-            logging.warning(f"Logo loading failed: {e}")
+            logging.warning("Logo loading failed: %s", e)
 
         if not logo_loaded:
             ctk.CTkLabel(logo_frame, text="SAS", font=(FONT_FAMILY, 28, "bold"),
                          text_color=SAS_BLUE).pack(pady=(5, 0))
 
-        ctk.CTkLabel(self._sidebar, text=APP_NAME, font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
+        ctk.CTkLabel(self._sidebar, text=APP_NAME, font=FONT_SMALL_BOLD,
                      text_color=TEXT_PRIMARY).pack(padx=16, pady=(4, 4))
         ctk.CTkFrame(self._sidebar, fg_color=BORDER_COLOR, height=1).pack(fill="x", padx=16, pady=12)
 
-        ctk.CTkLabel(self._sidebar, text="TOOLS", font=(FONT_FAMILY, FONT_SIZE_TINY, "bold"),
+        ctk.CTkLabel(self._sidebar, text="TOOLS", font=FONT_TINY_BOLD,
                      text_color=TEXT_MUTED, anchor="w").pack(fill="x", padx=20, pady=(0, 6))
 
         self._nav_buttons = {}
-        self._add_nav_button("trend", "\U0001F4C8  Trend View", self._show_trend_view)
-        self._add_nav_button("connect", "\U0001F50C  PLC Connection", self._show_connect_view)
+        self._active_nav = None
+        nav_font = ctk.CTkFont(FONT_FAMILY, FONT_SIZE_BODY)  # one font object shared by all nav buttons
+        for key, text, method in NAV_SPECS:
+            self._add_nav_button(key, text, getattr(self, method), font=nav_font)
 
         spacer = ctk.CTkFrame(self._sidebar, fg_color="transparent")
         spacer.pack(fill="both", expand=True)
@@ -965,7 +1336,7 @@ class PLCTrendTool(ctk.CTk):
         bottom = ctk.CTkFrame(self._sidebar, fg_color="transparent")
         bottom.pack(fill="x", padx=12, pady=(0, 12))
 
-        ctk.CTkButton(bottom, text="\u2699  Settings", font=(FONT_FAMILY, FONT_SIZE_BODY),
+        ctk.CTkButton(bottom, text="\u2699  Settings", font=FONT_BODY,
                       fg_color="transparent", text_color=TEXT_SECONDARY,
                       hover_color=BG_CARD_HOVER, anchor="w", height=36, corner_radius=6,
                       command=self._show_settings_view).pack(fill="x", pady=(0, 2))
@@ -973,22 +1344,22 @@ class PLCTrendTool(ctk.CTk):
         ctk.CTkFrame(bottom, fg_color=BORDER_COLOR, height=1).pack(fill="x", padx=4, pady=8)
 
         self._sidebar_status = ctk.CTkLabel(bottom, text="\u25CF Disconnected",
-                                            font=(FONT_FAMILY, FONT_SIZE_TINY),
+                                            font=FONT_TINY,
                                             text_color=STATUS_OFFLINE, anchor="w")
         self._sidebar_status.pack(fill="x", padx=4, pady=(0, 4))
 
-        self._storage_info_label = ctk.CTkLabel(bottom, text="",
-                                                 font=(FONT_FAMILY, FONT_SIZE_TINY),
-                                                 text_color=TEXT_MUTED, anchor="w")
-        self._storage_info_label.pack(fill="x", padx=4, pady=(0, 4))
+        self._sidebar_storage_label = ctk.CTkLabel(bottom, text="",
+                                                    font=FONT_TINY,
+                                                    text_color=TEXT_MUTED, anchor="w")
+        self._sidebar_storage_label.pack(fill="x", padx=4, pady=(0, 4))
 
-        ctk.CTkLabel(bottom, text=APP_COMPANY, font=(FONT_FAMILY, FONT_SIZE_TINY),
+        ctk.CTkLabel(bottom, text=APP_COMPANY, font=FONT_TINY,
                      text_color=TEXT_MUTED, anchor="w").pack(fill="x", padx=4)
-        ctk.CTkLabel(bottom, text=f"v{APP_VERSION}", font=(FONT_FAMILY, FONT_SIZE_TINY),
+        ctk.CTkLabel(bottom, text=f"v{APP_VERSION}", font=FONT_TINY,
                      text_color=TEXT_MUTED, anchor="w").pack(fill="x", padx=4)
 
-    def _add_nav_button(self, key, text, command):
-        btn = ctk.CTkButton(self._sidebar, text=text, font=(FONT_FAMILY, FONT_SIZE_BODY),
+    def _add_nav_button(self, key, text, command, font=FONT_BODY):
+        btn = ctk.CTkButton(self._sidebar, text=text, font=font,
                             fg_color="transparent", text_color=TEXT_SECONDARY,
                             hover_color=BG_CARD_HOVER, anchor="w", height=40, corner_radius=6,
                             command=command)
@@ -996,23 +1367,30 @@ class PLCTrendTool(ctk.CTk):
         self._nav_buttons[key] = btn
 
     def _set_active_nav(self, key):
-        for k, btn in self._nav_buttons.items():
-            if k == key:
-                btn.configure(fg_color=BG_CARD, text_color=SAS_BLUE_LIGHT)
-            else:
-                btn.configure(fg_color="transparent", text_color=TEXT_SECONDARY)
+        # Only the previously active and newly active buttons change
+        if key == self._active_nav:
+            return
+        prev = self._nav_buttons.get(self._active_nav)
+        if prev is not None:
+            prev.configure(fg_color="transparent", text_color=TEXT_SECONDARY)
+        btn = self._nav_buttons.get(key)
+        if btn is not None:
+            btn.configure(fg_color=BG_CARD, text_color=SAS_BLUE_LIGHT)
+        self._active_nav = key
 
     # == MAIN AREA ==
     def _build_main_area(self):
         self._main_area = ctk.CTkFrame(self, fg_color=BG_DARK, corner_radius=0)
         self._main_area.pack(side="right", fill="both", expand=True)
         self._trend_view = self._create_trend_view()
-        self._connect_view = self._create_connect_view()
-        self._settings_view = self._create_settings_view()
+        # Connection and settings views are built the first time they're shown
+        self._connect_view = None
+        self._settings_view = None
 
     def _hide_all_views(self):
         for v in [self._trend_view, self._connect_view, self._settings_view]:
-            v.pack_forget()
+            if v is not None:
+                v.pack_forget()
 
     def _show_trend_view(self):
         self._hide_all_views()
@@ -1021,6 +1399,9 @@ class PLCTrendTool(ctk.CTk):
 
     def _show_connect_view(self):
         self._hide_all_views()
+        if self._connect_view is None:
+            self._connect_view = self._create_connect_view()
+            self._restore_connect_settings()
         self._connect_view.pack(fill="both", expand=True)
         self._set_active_nav("connect")
 
@@ -1033,23 +1414,45 @@ class PLCTrendTool(ctk.CTk):
 
     def _show_settings_view(self):
         self._hide_all_views()
+        if self._settings_view is None:
+            self._settings_view = self._create_settings_view()
         self._settings_view.pack(fill="both", expand=True)
         self._set_active_nav("")
 
     def _build_section_header(self, parent, title):
-        ctk.CTkLabel(parent, text=title.upper(), font=(FONT_FAMILY, FONT_SIZE_TINY, "bold"),
+        ctk.CTkLabel(parent, text=title.upper(), font=FONT_TINY_BOLD,
                      text_color=TEXT_MUTED, anchor="w").pack(fill="x", padx=24, pady=(8, 6))
 
+    def _build_settings_card(self, parent, title):
+        """Section header plus the rounded card that holds its setting rows."""
+        self._build_section_header(parent, title)
+        card = ctk.CTkFrame(parent, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
+        card.pack(fill="x", padx=24, pady=(0, 16))
+        return card
+
+    def _build_setting_row(self, card, title, subtitle, make_control):
+        """One settings row: title/subtitle on the left, make_control(row) on the right.
+        Labels are gridded straight into the row so no inner frame is needed."""
+        row = ctk.CTkFrame(card, fg_color="transparent")
+        row.pack(fill="x", padx=16, pady=12)
+        row.grid_columnconfigure(0, weight=1)
+        ctk.CTkLabel(row, text=title, font=FONT_BODY_BOLD,
+                     text_color=TEXT_PRIMARY, anchor="w").grid(row=0, column=0, sticky="ew")
+        ctk.CTkLabel(row, text=subtitle, font=FONT_SMALL,
+                     text_color=TEXT_MUTED, anchor="w").grid(row=1, column=0, sticky="ew")
+        make_control(row).grid(row=0, column=1, rowspan=2, padx=(12, 0))
+        return row
+
     # == VIEW: PLC CONNECTION ==
     def _create_connect_view(self):
         view = ctk.CTkScrollableFrame(self._main_area, fg_color="transparent",
                                        scrollbar_button_color=BG_MEDIUM, scrollbar_button_hover_color=SAS_BLUE)
         hdr = ctk.CTkFrame(view, fg_color="transparent")
         hdr.pack(fill="x", padx=24, pady=(20, 4))
-        ctk.CTkLabel(hdr, text="\U0001F50C  PLC Connection", font=(FONT_FAMILY, FONT_SIZE_HEADING, "bold"),
+        ctk.CTkLabel(hdr, text="\U0001F50C  PLC Connection", font=FONT_HEADING_BOLD,
                      text_color=TEXT_PRIMARY, anchor="w").pack(side="left")
         ctk.CTkLabel(view, text="Connect to an Allen-Bradley controller to browse tags and start trending.\nSupports ControlLogix, CompactLogix, Micro800, SLC 500, MicroLogix, and PLC-5.",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY), text_color=TEXT_SECONDARY, anchor="w").pack(fill="x", padx=24, pady=(0, 16))
+                     font=FONT_BODY, text_color=TEXT_SECONDARY, anchor="w").pack(fill="x", padx=24, pady=(0, 16))
         self._build_section_header(view, "CONNECTION SETTINGS")
 
         conn_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS, border_width=1, border_color=BORDER_COLOR)
@@ -1060,12 +1463,12 @@ class PLCTrendTool(ctk.CTk):
         # Controller type
         row1 = ctk.CTkFrame(inner, fg_color="transparent")
         row1.pack(fill="x", pady=(0, 12))
-        ctk.CTkLabel(row1, text="Controller Type", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+        ctk.CTkLabel(row1, text="Controller Type", font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY, anchor="w", width=140).pack(side="left")
         self.controller_type_var = ctk.StringVar(value="ControlLogix")
         self._controller_menu = ctk.CTkOptionMenu(row1, variable=self.controller_type_var,
                           values=["ControlLogix", "CompactLogix", "Micro800", "SLC 500 / MicroLogix", "PLC-5"],
-                          font=(FONT_FAMILY, FONT_SIZE_BODY), fg_color=BG_MEDIUM, button_color=SAS_BLUE,
+                          font=FONT_BODY, fg_color=BG_MEDIUM, button_color=SAS_BLUE,
                           button_hover_color=SAS_BLUE_DARK, dropdown_fg_color=BG_MEDIUM, width=220, height=INPUT_HEIGHT,
                           command=self._on_controller_type_changed)
         self._controller_menu.pack(side="left", padx=(12, 0))
@@ -1073,7 +1476,7 @@ class PLCTrendTool(ctk.CTk):
         # IP Address
         row2 = ctk.CTkFrame(inner, fg_color="transparent")
         row2.pack(fill="x", pady=(0, 12))
-        ctk.CTkLabel(row2, text="IP Address", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+        ctk.CTkLabel(row2, text="IP Address", font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY, anchor="w", width=140).pack(side="left")
         self.ip_entry = ctk.CTkEntry(row2, width=200, height=INPUT_HEIGHT, font=(FONT_FAMILY_MONO, FONT_SIZE_BODY),
                                       fg_color=BG_INPUT, border_color=BORDER_COLOR, placeholder_text="192.168.1.10")
@@ -1083,13 +1486,13 @@ class PLCTrendTool(ctk.CTk):
         # Slot
         row3 = ctk.CTkFrame(inner, fg_color="transparent")
         row3.pack(fill="x", pady=(0, 16))
-        ctk.CTkLabel(row3, text="Processor Slot", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+        ctk.CTkLabel(row3, text="Processor Slot", font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY, anchor="w", width=140).pack(side="left")
         self.slot_entry = ctk.CTkEntry(row3, width=80, height=INPUT_HEIGHT, font=(FONT_FAMILY_MONO, FONT_SIZE_BODY),
                                         fg_color=BG_INPUT, border_color=BORDER_COLOR)
         self.slot_entry.insert(0, "0")
         self.slot_entry.pack(side="left", padx=(12, 0))
-        self._slot_hint_label = ctk.CTkLabel(row3, text="(Usually 0 for CompactLogix/Micro800)", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+        self._slot_hint_label = ctk.CTkLabel(row3, text="(Usually 0 for CompactLogix/Micro800)", font=FONT_SMALL,
                      text_color=TEXT_MUTED)
         self._slot_hint_label.pack(side="left", padx=(12, 0))
 
@@ -1097,10 +1500,10 @@ class PLCTrendTool(ctk.CTk):
         btn_row = ctk.CTkFrame(inner, fg_color="transparent")
         btn_row.pack(fill="x")
         self.connect_btn = ctk.CTkButton(btn_row, text="Connect", width=140, height=BUTTON_HEIGHT,
-                                          font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"), fg_color=SAS_BLUE,
+                                          font=FONT_BODY_BOLD, fg_color=SAS_BLUE,
                                           hover_color=SAS_BLUE_DARK, corner_radius=BUTTON_CORNER_RADIUS, command=self._connect)
         self.connect_btn.pack(side="left")
-        self.conn_status_label = ctk.CTkLabel(btn_row, text="", font=(FONT_FAMILY, FONT_SIZE_BODY), text_color=TEXT_SECONDARY)
+        self.conn_status_label = ctk.CTkLabel(btn_row, text="", font=FONT_BODY, text_color=TEXT_SECONDARY)
         self.conn_status_label.pack(side="left", padx=(16, 0))
 
         # Device info
@@ -1108,70 +1511,90 @@ class PLCTrendTool(ctk.CTk):
         self.device_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS, border_width=1, border_color=BORDER_COLOR)
         self.device_card.pack(fill="x", padx=24, pady=(0, 16))
         self.device_info_label = ctk.CTkLabel(self.device_card, text="Not connected -- connect to a PLC to see device information.",
-                                               font=(FONT_FAMILY, FONT_SIZE_BODY), text_color=TEXT_MUTED, anchor="w")
+                                               font=FONT_BODY, text_color=TEXT_MUTED, anchor="w")
         self.device_info_label.pack(fill="x", padx=CARD_PADDING, pady=CARD_PADDING)
         return view
 
     # == VIEW: TREND ==
     def _create_trend_view(self):
+        # Resolve theme colors once for every raw tk widget built below
+        bg_dark = resolve_color(BG_DARK)
+        bg_medium = resolve_color(BG_MEDIUM)
+        bg_card = resolve_color(BG_CARD)
+        bg_hover = resolve_color(BG_CARD_HOVER)
+        bg_input = resolve_color(BG_INPUT)
+        border = resolve_color(BORDER_COLOR)
+        text_primary = resolve_color(TEXT_PRIMARY)
+        text_secondary = resolve_color(TEXT_SECONDARY)
+        text_muted = resolve_color(TEXT_MUTED)
+
         # Plain tk.Frame — CTkFrame adds ~20px internal canvas overhead
-        view = tk.Frame(self._main_area, bg=resolve_color(BG_DARK))
+        view = tk.Frame(self._main_area, bg=bg_dark)
         view.grid_rowconfigure(0, weight=0)
         view.grid_rowconfigure(1, weight=1)
         view.grid_columnconfigure(0, weight=1)
         self._trend_view_frame = view
 
         # Toolbar — plain tk.Frame, fixed 28px
-        toolbar = tk.Frame(view, bg=resolve_color(BG_MEDIUM), height=28)
+        toolbar = tk.Frame(view, bg=bg_medium, height=28)
         toolbar.grid(row=0, column=0, sticky="ew")
         toolbar.grid_propagate(False)
         toolbar.grid_columnconfigure(0, weight=1)
         self._toolbar_frame = toolbar
 
-        inner = tk.Frame(toolbar, bg=resolve_color(BG_MEDIUM))
+        inner = tk.Frame(toolbar, bg=bg_medium)
         inner.pack(fill="x", padx=6, pady=2)
         self._toolbar_inner = inner
 
-        tb_font = (FONT_FAMILY, FONT_SIZE_SMALL)
-        tb_fg = resolve_color(TEXT_SECONDARY)
-        tb_bg = resolve_color(BG_MEDIUM)
-        tb_btn_bg = resolve_color(BG_CARD)
-        tb_border = resolve_color(BORDER_COLOR)
-        tb_hover = resolve_color(BG_CARD_HOVER)
+        tb_font = FONT_SMALL
+        tb_fg = text_secondary
+        tb_bg = bg_medium
+        tb_btn_bg = bg_card
+        tb_border = border
+        tb_hover = bg_hover
+        # Shared options: solid colored action buttons and outlined tool buttons
+        action_btn = dict(font=FONT_SMALL_BOLD, fg="#FFFFFF",
+                          activeforeground="#FFFFFF", bd=0, relief="flat", pady=1, cursor="hand2")
+        tool_btn = dict(font=tb_font, bg=tb_bg, fg=tb_fg, activebackground=tb_hover,
+                        activeforeground=text_primary, bd=1, relief="solid", pady=0,
+                        cursor="hand2", highlightthickness=0)
+
+        # Toolbar separators: one shared 1px image, so a theme change recolors
+        # every separator with a single put()
+        self._tb_sep_img = tk.PhotoImage(master=inner, width=1, height=20)
+        self._tb_sep_img.put(tb_border, to=(0, 0, 1, 20))
+        def separator():
+            tk.Label(inner, image=self._tb_sep_img, bg=tb_bg, bd=0, padx=0, pady=0,
+                     highlightthickness=0).pack(side="left", padx=4)
 
         # Tag panel toggle button
         self._tag_panel_visible = True
-        self._tag_toggle_btn = tk.Button(inner, text="\U0001F3F7 Tags", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                          bg=SAS_BLUE, fg="#FFFFFF", activebackground=SAS_BLUE_DARK,
-                                          activeforeground="#FFFFFF", bd=0, relief="flat", padx=6, pady=1,
-                                          command=self._toggle_tag_panel, cursor="hand2")
+        self._tag_toggle_btn = tk.Button(inner, text="\U0001F3F7 Tags", bg=SAS_BLUE, activebackground=SAS_BLUE_DARK,
+                                          padx=6, command=self._toggle_tag_panel, **action_btn)
         self._tag_toggle_btn.pack(side="left", padx=(0, 4))
 
-        # Separator
-        tk.Frame(inner, bg=tb_border, width=1).pack(side="left", fill="y", padx=4, pady=2)
+        separator()
 
-        # Start/Stop buttons
-        self.start_btn = tk.Button(inner, text="\u25B6 Start Trend", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                    bg=SAS_BLUE, fg="#FFFFFF", activebackground=SAS_BLUE_DARK,
-                                    activeforeground="#FFFFFF", bd=0, relief="flat", padx=8, pady=1,
-                                    command=self._start_trend, state="disabled", cursor="hand2")
+        # Start/Stop buttons — glyphs are drawn once as images (kept on self against GC)
+        self._toolbar_glyphs = {shape: _toolbar_glyph(inner, shape) for shape in ("play", "stop", "pause")}
+        glyphs = self._toolbar_glyphs
+        self.start_btn = tk.Button(inner, text=" Start Trend", image=glyphs["play"], compound="left",
+                                    bg=SAS_BLUE, activebackground=SAS_BLUE_DARK,
+                                    padx=8, command=self._start_trend, state="disabled", **action_btn)
         self.start_btn.pack(side="left", padx=(0, 6))
 
-        self.stop_btn = tk.Button(inner, text="\u25A0 Stop", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                   bg=STATUS_ERROR, fg="#FFFFFF", activebackground="#b91c1c",
-                                   activeforeground="#FFFFFF", bd=0, relief="flat", padx=8, pady=1,
-                                   command=self._stop_trend, cursor="hand2")
+        self.stop_btn = tk.Button(inner, text=" Stop", image=glyphs["stop"], compound="left",
+                                   bg=STATUS_ERROR, activebackground="#b91c1c",
+                                   padx=8, command=self._stop_trend, **action_btn)
         # stop_btn packed only when trending
 
-        self.pause_btn = tk.Button(inner, text="\u275A\u275A Pause", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                    bg=SAS_ORANGE, fg="#FFFFFF", activebackground="#d97706",
-                                    activeforeground="#FFFFFF", bd=0, relief="flat", padx=8, pady=1,
-                                    command=self._pause_trend, cursor="hand2")
+        self.pause_btn = tk.Button(inner, text=" Pause", image=glyphs["pause"], compound="left",
+                                    bg=SAS_ORANGE, activebackground="#d97706",
+                                    padx=8, command=self._pause_trend, **action_btn)
 
-        self.resume_btn = tk.Button(inner, text="\u25B6 Resume", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                     bg=STATUS_GOOD, fg="#FFFFFF", activebackground="#15803d",
-                                     activeforeground="#FFFFFF", bd=0, relief="flat", padx=8, pady=1,
-                                     command=self._resume_trend, cursor="hand2")
+        self.resume_btn = tk.Button(inner, text=" Resume", image=glyphs["play"], compound="left",
+                                     bg=STATUS_GOOD, activebackground="#15803d",
+                                     padx=8, command=self._resume_trend, **action_btn)
 
         tk.Label(inner, text="Rate:", font=tb_font, fg=tb_fg, bg=tb_bg).pack(side="left", padx=(4, 2))
         self.rate_var = ctk.StringVar(value="1 sec")
@@ -1180,42 +1603,24 @@ class PLCTrendTool(ctk.CTk):
                           font=tb_font, fg_color=BG_CARD, button_color=SAS_BLUE,
                           button_hover_color=SAS_BLUE_DARK, dropdown_fg_color=BG_MEDIUM, width=85, height=22).pack(side="left", padx=(0, 4))
 
-        # Separator
-        tk.Frame(inner, bg=tb_border, width=1).pack(side="left", fill="y", padx=4, pady=2)
-
-        # Chart properties button
-        scale_btn = tk.Button(inner, text="\u2699 Props", font=tb_font,
-                               bg=tb_bg, fg=tb_fg, activebackground=tb_hover,
-                               activeforeground=resolve_color(TEXT_PRIMARY),
-                               bd=1, relief="solid", padx=6, pady=0,
-                               command=self._show_chart_properties, cursor="hand2",
-                               highlightthickness=0)
-        scale_btn.pack(side="left", padx=(0, 4))
-
-        # New Session button — reset everything
-        new_btn = tk.Button(inner, text="\u21BB New", font=tb_font,
-                            bg=tb_bg, fg=tb_fg, activebackground=tb_hover,
-                            activeforeground=resolve_color(TEXT_PRIMARY),
-                            bd=1, relief="solid", padx=6, pady=0,
-                            command=self._new_session, cursor="hand2",
-                            highlightthickness=0)
-        new_btn.pack(side="left", padx=(0, 4))
-
-        # Separator
-        tk.Frame(inner, bg=tb_border, width=1).pack(side="left", fill="y", padx=4, pady=2)
-
-        self.point_label = tk.Label(inner, text="", font=tb_font, fg=resolve_color(TEXT_MUTED), bg=tb_bg)
+        separator()
+
+        # Chart properties and New Session (reset everything) buttons
+        for text, cmd in (("\u2699 Props", self._show_chart_properties),
+                          ("\u21BB New", self._new_session)):
+            tk.Button(inner, text=text, padx=6, command=cmd, **tool_btn).pack(side="left", padx=(0, 4))
+
+        separator()
+
+        self.point_label = tk.Label(inner, text="", font=tb_font, fg=text_muted, bg=tb_bg)
         self.point_label.pack(side="left", padx=(0, 6))
-        self.view_badge_label = tk.Label(inner, text="", font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
-                                          fg=resolve_color(TEXT_MUTED), bg=tb_bg)
+        self.view_badge_label = tk.Label(inner, text="", font=FONT_SMALL_BOLD,
+                                          fg=text_muted, bg=tb_bg)
         self.view_badge_label.pack(side="left")
 
         # Right buttons — plain tk for tight sizing
         def _make_tb_btn(parent, text, cmd, state="normal"):
-            b = tk.Button(parent, text=text, font=tb_font, bg=tb_bg, fg=tb_fg,
-                          activebackground=tb_hover, activeforeground=resolve_color(TEXT_PRIMARY),
-                          bd=1, relief="solid", padx=4, pady=0, command=cmd,
-                          state=state, cursor="hand2", highlightthickness=0)
+            b = tk.Button(parent, text=text, padx=4, command=cmd, state=state, **tool_btn)
             b.pack(side="right", padx=1)
             return b
 
@@ -1223,64 +1628,70 @@ class PLCTrendTool(ctk.CTk):
         _make_tb_btn(inner, "Import", self._import_file)
         self.export_csv_btn = _make_tb_btn(inner, "CSV", self._export_csv, "disabled")
         self.export_json_btn = _make_tb_btn(inner, ".pytrend", self._export_pytrend, "disabled")
-        tk.Label(inner, text="Export:", font=tb_font, fg=resolve_color(TEXT_MUTED), bg=tb_bg).pack(side="right", padx=(0, 2))
+        tk.Label(inner, text="Export:", font=tb_font, fg=text_muted, bg=tb_bg).pack(side="right", padx=(0, 2))
 
         # ── Horizontal PanedWindow: Tag Panel (left) | Chart+Table (right) ──
+        # Non-opaque: dragging moves only the sash outline; the tree and chart
+        # re-layout once on release instead of on every mouse motion.
         self._h_paned = tk.PanedWindow(view, orient=tk.HORIZONTAL, sashwidth=5,
-                                        bg=resolve_color(BORDER_COLOR), relief="flat",
-                                        sashrelief="flat", opaqueresize=True)
+                                        bg=border, relief="flat",
+                                        sashrelief="flat", opaqueresize=False)
         self._h_paned.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
 
         # ── Left: Tag Picker Panel ──
-        self._tag_panel = tk.Frame(self._h_paned, bg=resolve_color(BG_CARD),
-                                    highlightbackground=resolve_color(BORDER_COLOR),
+        self._tag_panel = tk.Frame(self._h_paned, bg=bg_card,
+                                    highlightbackground=border,
                                     highlightthickness=1, bd=0)
         self._tag_panel.grid_rowconfigure(2, weight=1)
         self._tag_panel.grid_columnconfigure(0, weight=1)
 
         # Tag panel header
-        tp_hdr = tk.Frame(self._tag_panel, bg=resolve_color(BG_MEDIUM))
+        tp_hdr = tk.Frame(self._tag_panel, bg=bg_medium)
         tp_hdr.grid(row=0, column=0, sticky="ew")
-        tk.Label(tp_hdr, text="\U0001F3F7 Tags", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
-                 fg=resolve_color(TEXT_PRIMARY), bg=resolve_color(BG_MEDIUM)).pack(side="left", padx=(8, 4), pady=4)
-        self.tag_count_label = tk.Label(tp_hdr, text="", font=(FONT_FAMILY, FONT_SIZE_TINY),
-                                         fg=resolve_color(TEXT_MUTED), bg=resolve_color(BG_MEDIUM))
+        tk.Label(tp_hdr, text="\U0001F3F7 Tags", font=FONT_BODY_BOLD,
+                 fg=text_primary, bg=bg_medium).pack(side="left", padx=(8, 4), pady=4)
+        self.tag_count_label = tk.Label(tp_hdr, text="", font=FONT_TINY,
+                                         fg=text_muted, bg=bg_medium)
         self.tag_count_label.pack(side="left", padx=(0, 4))
-        refresh_btn = tk.Button(tp_hdr, text="\u21BB", font=(FONT_FAMILY, FONT_SIZE_SMALL),
-                                 bg=resolve_color(BG_MEDIUM), fg=resolve_color(TEXT_SECONDARY),
-                                 activebackground=resolve_color(BG_CARD_HOVER), bd=0, relief="flat",
+        refresh_btn = tk.Button(tp_hdr, text="\u21BB", font=FONT_SMALL,
+                                 bg=bg_medium, fg=text_secondary,
+                                 activebackground=bg_hover, bd=0, relief="flat",
                                  padx=4, command=self._fetch_tags, cursor="hand2")
         refresh_btn.pack(side="right", padx=(0, 4))
         self._add_tooltip(refresh_btn, "Refresh tag list from PLC")
 
         # Search + controls row
-        tp_search = tk.Frame(self._tag_panel, bg=resolve_color(BG_CARD))
+        tp_search = tk.Frame(self._tag_panel, bg=bg_card)
         tp_search.grid(row=1, column=0, sticky="ew", padx=4, pady=(4, 2))
         self.tag_search_var = ctk.StringVar()
-        self.tag_search_var.trace_add("write", lambda *_: self._filter_tags())
+        self._filter_after = None
+        self.tag_search_var.trace_add("write", self._schedule_filter)
         self.tag_search = ctk.CTkEntry(tp_search, placeholder_text="Search...", textvariable=self.tag_search_var,
-                                        font=(FONT_FAMILY, FONT_SIZE_SMALL), fg_color=BG_INPUT,
+                                        font=FONT_SMALL, fg_color=BG_INPUT,
                                         border_color=BORDER_COLOR, height=26)
         self.tag_search.pack(side="left", fill="x", expand=True, padx=(0, 4))
 
-        sel_btn_style = dict(font=(FONT_FAMILY, FONT_SIZE_TINY), bd=0, relief="flat",
-                             bg=resolve_color(BG_MEDIUM), fg=resolve_color(TEXT_SECONDARY),
-                             activebackground=resolve_color(BG_CARD_HOVER), padx=4, cursor="hand2")
+        sel_btn_style = dict(font=FONT_TINY, bd=0, relief="flat",
+                             bg=bg_medium, fg=text_secondary,
+                             activebackground=bg_hover, padx=4, cursor="hand2")
         tk.Button(tp_search, text="All", command=self._select_all_visible, **sel_btn_style).pack(side="left", padx=1)
         tk.Button(tp_search, text="Clear", command=self._clear_selection, **sel_btn_style).pack(side="left", padx=1)
-        self.selected_label = tk.Label(tp_search, text="0 sel", font=(FONT_FAMILY, FONT_SIZE_TINY, "bold"),
-                                        fg=SAS_BLUE, bg=resolve_color(BG_CARD))
+        self.selected_label = tk.Label(tp_search, text="0 sel", font=FONT_TINY_BOLD,
+                                        fg=SAS_BLUE, bg=bg_card)
         self.selected_label.pack(side="right", padx=(4, 0))
 
         # Tag tree
-        tp_tree_frame = tk.Frame(self._tag_panel, bg=resolve_color(BG_CARD))
+        tp_tree_frame = tk.Frame(self._tag_panel, bg=bg_card)
         tp_tree_frame.grid(row=2, column=0, sticky="nsew", padx=4, pady=(0, 4))
         tp_tree_frame.grid_rowconfigure(0, weight=1)
         tp_tree_frame.grid_columnconfigure(0, weight=1)
 
         self.tree_style = ttk.Style()
-        self._apply_treeview_style()
+        # Select the ttk theme once; theme changes only reconfigure colors
+        # (theme_use reloads the theme and relayouts every ttk widget)
+        self.tree_style.theme_use("default")
         self.tag_tree = ttk.Treeview(tp_tree_frame, columns=("type",), show="tree headings", selectmode="none")
+        self._apply_treeview_style()
         self.tag_tree.heading("#0", text="Tag Name", anchor="w")
         self.tag_tree.heading("type", text="Type", anchor="w")
         self.tag_tree.column("#0", width=220, minwidth=120)
@@ -1290,42 +1701,53 @@ class PLCTrendTool(ctk.CTk):
         tree_scroll.grid(row=0, column=1, sticky="ns")
         self.tag_tree.configure(yscrollcommand=tree_scroll.set)
         self.tag_tree.bind("<ButtonRelease-1>", self._on_tag_click)
+        # Expand/collapse drive lazy population of struct/SLC children
+        self.tag_tree.bind("<<TreeviewOpen>>", self._on_tree_expand)
+        self.tag_tree.bind("<<TreeviewClose>>", self._on_tree_collapse)
         self._set_tag_placeholder("Connect to a PLC to browse tags")
 
         self._h_paned.add(self._tag_panel, width=300, minsize=200, stretch="never")
 
         # ── Right: Chart + Table (vertical PanedWindow) ──
-        right_frame = tk.Frame(self._h_paned, bg=resolve_color(BG_DARK))
+        right_frame = tk.Frame(self._h_paned, bg=bg_dark)
 
         self._paned = tk.PanedWindow(right_frame, orient=tk.VERTICAL, sashwidth=6,
-                                      bg=resolve_color(BORDER_COLOR), relief="flat",
+                                      bg=border, relief="flat",
                                       sashrelief="flat", opaqueresize=True)
         self._paned.pack(fill="both", expand=True, padx=4, pady=(0, 4))
 
         # Chart area
-        chart_wrapper = tk.Frame(self._paned, bg=resolve_color(BG_CARD),
-                                 highlightbackground=resolve_color(BORDER_COLOR),
+        chart_wrapper = tk.Frame(self._paned, bg=bg_card,
+                                 highlightbackground=border,
                                  highlightthickness=1, bd=0)
         self._chart_wrapper = chart_wrapper
         chart_wrapper.grid_rowconfigure(0, weight=1)
         chart_wrapper.grid_columnconfigure(0, weight=1)
 
         # Scrollable container for chart (allows vertical scrolling when zoomed)
-        chart_scroll_frame = tk.Frame(chart_wrapper, bg=resolve_color(BG_CARD))
+        chart_scroll_frame = tk.Frame(chart_wrapper, bg=bg_card)
         chart_scroll_frame.grid(row=0, column=0, sticky="nsew")
         chart_scroll_frame.grid_rowconfigure(0, weight=1)
         chart_scroll_frame.grid_columnconfigure(0, weight=1)
         self._chart_scroll_frame = chart_scroll_frame
 
-        self._chart_scroll_canvas = tk.Canvas(chart_scroll_frame, bg=resolve_color(BG_CARD),
-                                               highlightthickness=0, bd=0)
-        self._chart_scroll_canvas.grid(row=0, column=0, sticky="nsew")
+        # Plain frame viewport: the chart widget is placed inside it and
+        # scrolled by shifting its y offset, no Canvas window item needed.
+        self._chart_viewport = tk.Frame(chart_scroll_frame, bg=bg_card,
+                                        highlightthickness=0, bd=0)
+        self._chart_viewport.grid(row=0, column=0, sticky="nsew")
 
         self._chart_vscroll = tk.Scrollbar(chart_scroll_frame, orient=tk.VERTICAL,
-                                            command=self._chart_scroll_canvas.yview)
-        self._chart_scroll_canvas.configure(yscrollcommand=self._chart_vscroll.set)
+                                            command=self._on_chart_yview)
         # vscroll only shown when chart is taller than visible area
         self._chart_vscroll_visible = False
+        self._chart_scroll_y = 0    # px of the figure scrolled above the viewport
+        self._chart_fig_h = 1       # current figure height in px
+        self._pending_wheel_delta = 0       # wheel steps not yet applied
+        self._wheel_flush_scheduled = False
+        self._draw_pending = False          # _flush_draw queued via after_idle
+        self._scrollbar_update_pending = False  # _flush_scrollbar queued via after_idle
+        self._last_draw_end = 0.0           # perf_counter() when the last full draw finished
 
         self.fig = Figure(figsize=(10, 5), dpi=100)
         self._style_chart()
@@ -1334,17 +1756,16 @@ class PLCTrendTool(ctk.CTk):
         self._style_chart_axes(self.ax)
         self._apply_chart_bg()
 
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self._chart_scroll_canvas)
-        self.canvas.get_tk_widget().configure(bg=resolve_color(BG_CARD))
-        self._chart_canvas_window = self._chart_scroll_canvas.create_window(
-            (0, 0), window=self.canvas.get_tk_widget(), anchor="nw")
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self._chart_viewport)
+        self.canvas.get_tk_widget().configure(bg=bg_card)
+        self.canvas.get_tk_widget().place(x=0, y=0, relwidth=1.0, relheight=1.0)
 
-        # Bind scroll canvas resize to update figure sizing
-        self._chart_scroll_canvas.bind("<Configure>", self._on_scroll_canvas_configure)
+        # Bind viewport resize to update figure sizing
+        self._chart_viewport.bind("<Configure>", self._on_scroll_canvas_configure)
 
         # Mouse wheel for vertical chart scrolling when zoomed
         self.canvas.get_tk_widget().bind("<MouseWheel>", self._on_chart_mousewheel)
-        self._chart_scroll_canvas.bind("<MouseWheel>", self._on_chart_mousewheel)
+        self._chart_viewport.bind("<MouseWheel>", self._on_chart_mousewheel)
 
         # Hidden NavigationToolbar (we call its methods via custom buttons)
         _hidden_tb_frame = tk.Frame(chart_wrapper, width=0, height=0)
@@ -1352,16 +1773,16 @@ class PLCTrendTool(ctk.CTk):
         self.chart_toolbar.update()
 
         # Vertical toolbar strip on right side of chart
-        nav_strip = tk.Frame(chart_wrapper, bg=resolve_color(BG_CARD), width=28)
+        nav_strip = tk.Frame(chart_wrapper, bg=bg_card, width=28)
         nav_strip.grid(row=0, column=1, sticky="ns", padx=0, pady=0)
         nav_strip.grid_propagate(False)
         self._nav_strip = nav_strip
 
         nav_btn_style = dict(
             font=(FONT_FAMILY, 12), width=2, bd=0, relief="flat",
-            bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_SECONDARY),
-            activebackground=resolve_color(BG_CARD_HOVER),
-            activeforeground=resolve_color(TEXT_PRIMARY),
+            bg=bg_card, fg=text_secondary,
+            activebackground=bg_hover,
+            activeforeground=text_primary,
         )
         for symbol, tip, cmd in [
             ("\u2302", "Home (reset view)", self.chart_toolbar.home),
@@ -1376,13 +1797,13 @@ class PLCTrendTool(ctk.CTk):
             self._add_tooltip(btn, tip)
 
         # Zoom strip — vertical slider to control isolated chart height
-        zoom_strip = tk.Frame(chart_wrapper, bg=resolve_color(BG_CARD), width=30)
+        zoom_strip = tk.Frame(chart_wrapper, bg=bg_card, width=30)
         zoom_strip.grid(row=0, column=2, sticky="ns", padx=(0, 2), pady=0)
         zoom_strip.grid_propagate(False)
         self._zoom_strip = zoom_strip
 
         zoom_label = tk.Label(zoom_strip, text="\U0001F50D", font=(FONT_FAMILY, 9),
-                               bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_SECONDARY))
+                               bg=bg_card, fg=text_secondary)
         zoom_label.pack(side="top", pady=(6, 2))
         self._add_tooltip(zoom_label, "Chart Height Zoom")
 
@@ -1391,8 +1812,8 @@ class PLCTrendTool(ctk.CTk):
             zoom_strip, from_=5.0, to=1.0, resolution=0.1, orient=tk.VERTICAL,
             variable=self._chart_zoom_var, command=self._on_chart_zoom_change,
             showvalue=False, length=120, width=14, sliderlength=16,
-            bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_SECONDARY),
-            troughcolor=resolve_color(BG_INPUT), highlightthickness=0,
+            bg=bg_card, fg=text_secondary,
+            troughcolor=bg_input, highlightthickness=0,
             activebackground=SAS_BLUE, bd=0,
         )
         self._chart_zoom_slider.pack(side="top", fill="y", expand=True, padx=4, pady=2)
@@ -1400,45 +1821,54 @@ class PLCTrendTool(ctk.CTk):
 
         zoom_reset_btn = tk.Button(zoom_strip, text="\u21BA", font=(FONT_FAMILY, 10),
                                     width=2, bd=0, relief="flat",
-                                    bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_SECONDARY),
-                                    activebackground=resolve_color(BG_CARD_HOVER),
-                                    activeforeground=resolve_color(TEXT_PRIMARY),
+                                    bg=bg_card, fg=text_secondary,
+                                    activebackground=bg_hover,
+                                    activeforeground=text_primary,
                                     command=self._reset_chart_zoom)
         zoom_reset_btn.pack(side="bottom", pady=(2, 6))
         self._add_tooltip(zoom_reset_btn, "Reset to auto-fit")
 
-        # Right-click context menu on chart (built dynamically per-click)
+        # Right-click context menu on chart (built on first use; the context-aware
+        # entries at the top are swapped per click)
         self.canvas.get_tk_widget().bind("<Button-3>", self._show_chart_context_menu)
 
         # Smart cursor events
         self.canvas.mpl_connect("motion_notify_event", self._on_chart_mouse_move)
         self.canvas.mpl_connect("axes_leave_event", self._on_chart_mouse_leave)
 
-        # Drag-reorder events for isolated subplots (Ctrl+left-click)
-        self.canvas.mpl_connect("button_press_event", self._on_chart_press)
-        self.canvas.mpl_connect("button_release_event", self._on_chart_release)
-
-        # Lock panning to horizontal only — save ylims on press, restore on release
-        self._saved_ylims = {}
-        self.canvas.mpl_connect("button_press_event", self._pan_save_ylims)
-        self.canvas.mpl_connect("button_release_event", self._pan_restore_ylims)
-
-        # Click-to-inspect: update table with values at clicked time (when stopped)
-        self.canvas.mpl_connect("button_press_event", self._on_chart_click_inspect)
-
-        # Double-click to toggle fullscreen on a single chart in isolated mode
-        self.canvas.mpl_connect("button_press_event", self._on_chart_dblclick)
-
-        # X-axis click-drag to pan (works without pan tool selected)
-        self.canvas.mpl_connect("button_press_event", self._on_xaxis_press)
-        self.canvas.mpl_connect("button_release_event", self._on_xaxis_release)
+        # Mouse button handlers, run in this order by one press and one
+        # release callback instead of a separate matplotlib connection each:
+        #   - Ctrl+left-click drag-reorder of isolated subplots
+        #   - lock panning to horizontal (save ylims on press, restore on release)
+        #   - click-to-inspect: table shows values at the clicked time (when stopped)
+        #   - double-click toggles fullscreen on one chart in isolated mode
+        #   - x-axis click-drag to pan (works without pan tool selected)
+        self._saved_ylims = []  # [(axes, ylim)] captured when a pan/zoom drag starts
+        self._press_handlers = (self._on_chart_press, self._pan_save_ylims,
+                                self._on_chart_click_inspect, self._on_chart_dblclick,
+                                self._on_xaxis_press)
+        # Inspect and x-axis pan ignore double-clicks, so those skip them
+        self._dblclick_handlers = (self._on_chart_press, self._pan_save_ylims,
+                                   self._on_chart_dblclick)
+        self._release_handlers = (self._on_chart_release, self._pan_restore_ylims,
+                                  self._on_xaxis_release)
+        self.canvas.mpl_connect("button_press_event", self._dispatch_press)
+        self.canvas.mpl_connect("button_release_event", self._dispatch_release)
+
+        # Blitting: cache the static background after every full draw
+        self._blit_bg = None
+        self._blit_state = None
+        self._cursor_bg = None  # _blit_bg plus lines and legends, for cursor-only repaints
+        self._axis_bboxes = None  # (axes ids, x0/x1/y0/y1 array) for _get_axis_at_event
+        self._last_render_ms = 0.0  # cost of the last live refresh (sets the next delay)
+        self.canvas.mpl_connect("draw_event", self._on_chart_draw)
 
         # Auto-fit axes to fill chart area on resize (add='+' preserves matplotlib's own resize handler)
         self.canvas.get_tk_widget().bind("<Configure>", self._on_chart_resize, add="+")
 
         # Time scrollbar below chart
         chart_wrapper.grid_rowconfigure(1, weight=0)
-        scroll_frame = tk.Frame(chart_wrapper, bg=resolve_color(BG_CARD), height=18)
+        scroll_frame = tk.Frame(chart_wrapper, bg=bg_card, height=18)
         scroll_frame.grid(row=1, column=0, columnspan=3, sticky="ew")
         scroll_frame.grid_propagate(False)
         scroll_frame.grid_columnconfigure(0, weight=1)
@@ -1450,7 +1880,7 @@ class PLCTrendTool(ctk.CTk):
         self._chart_scrollbar.set(0.0, 1.0)
 
         follow_btn = tk.Button(scroll_frame, text="\u25B6\u25B6", font=(FONT_FAMILY, 7),
-                                bg=resolve_color(BG_CARD), fg=SAS_BLUE,
+                                bg=bg_card, fg=SAS_BLUE,
                                 activebackground=SAS_BLUE, activeforeground="#FFFFFF",
                                 bd=0, padx=4, pady=0, command=self._snap_to_live,
                                 cursor="hand2")
@@ -1461,13 +1891,14 @@ class PLCTrendTool(ctk.CTk):
         self._paned.add(chart_wrapper, stretch="always", minsize=200)
 
         # Table area
-        table_wrapper = tk.Frame(self._paned, bg=resolve_color(BG_CARD),
-                                 highlightbackground=resolve_color(BORDER_COLOR),
+        table_wrapper = tk.Frame(self._paned, bg=bg_card,
+                                 highlightbackground=border,
                                  highlightthickness=1, bd=0)
         self._table_wrapper = table_wrapper
 
         columns = ("tag", "type", "current", "min", "max", "status")
         self.live_tree = ttk.Treeview(table_wrapper, columns=columns, show="headings", height=6)
+        self._live_rows = []  # [(item id, row values)] currently shown, in order
         for col, txt, w, anc in [("tag","Tag Name",200,"w"),("type","Type",80,"w"),("current","Current",130,"e"),
                                   ("min","Min",130,"e"),("max","Max",130,"e"),("status","Status",70,"center")]:
             self.live_tree.heading(col, text=txt, anchor="w" if anc == "w" else anc)
@@ -1503,38 +1934,22 @@ class PLCTrendTool(ctk.CTk):
                                        scrollbar_button_color=BG_MEDIUM, scrollbar_button_hover_color=SAS_BLUE)
         hdr = ctk.CTkFrame(view, fg_color="transparent")
         hdr.pack(fill="x", padx=24, pady=(20, 4))
-        ctk.CTkLabel(hdr, text="\u2699  Settings", font=(FONT_FAMILY, FONT_SIZE_HEADING, "bold"),
+        ctk.CTkLabel(hdr, text="\u2699  Settings", font=FONT_HEADING_BOLD,
                      text_color=TEXT_PRIMARY, anchor="w").pack(side="left")
         ctk.CTkLabel(view, text="Customize application behavior. Changes are saved automatically.",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY), text_color=TEXT_SECONDARY, anchor="w").pack(fill="x", padx=24, pady=(0, 16))
-
-        self._build_section_header(view, "APPEARANCE")
-        theme_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
-        theme_card.pack(fill="x", padx=24, pady=(0, 16))
-        theme_row = ctk.CTkFrame(theme_card, fg_color="transparent")
-        theme_row.pack(fill="x", padx=16, pady=12)
-        left = ctk.CTkFrame(theme_row, fg_color="transparent")
-        left.pack(side="left", fill="x", expand=True)
-        ctk.CTkLabel(left, text="Theme", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"), text_color=TEXT_PRIMARY, anchor="w").pack(fill="x")
-        ctk.CTkLabel(left, text="Switch between dark and light mode", font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_MUTED, anchor="w").pack(fill="x")
+                     font=FONT_BODY, text_color=TEXT_SECONDARY, anchor="w").pack(fill="x", padx=24, pady=(0, 16))
+
+        theme_card = self._build_settings_card(view, "APPEARANCE")
         self._theme_var = ctk.StringVar(value=self.settings.get("theme", "Dark"))
-        ctk.CTkOptionMenu(theme_row, variable=self._theme_var, values=["Dark", "Light"], font=(FONT_FAMILY, FONT_SIZE_BODY),
-                          fg_color=BG_MEDIUM, button_color=SAS_BLUE, button_hover_color=SAS_BLUE_DARK,
-                          dropdown_fg_color=BG_MEDIUM, width=120, height=32, command=self._on_theme_selected).pack(side="right", padx=(12, 0))
+        self._build_setting_row(
+            theme_card, "Theme", "Switch between dark and light mode",
+            lambda row: ctk.CTkOptionMenu(row, variable=self._theme_var, values=["Dark", "Light"], font=FONT_BODY,
+                                          fg_color=BG_MEDIUM, button_color=SAS_BLUE, button_hover_color=SAS_BLUE_DARK,
+                                          dropdown_fg_color=BG_MEDIUM, width=120, height=32,
+                                          command=self._on_theme_selected))
 
         # -- DATA STORAGE --
-        self._build_section_header(view, "DATA STORAGE")
-        storage_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
-        storage_card.pack(fill="x", padx=24, pady=(0, 16))
-
-        storage_row = ctk.CTkFrame(storage_card, fg_color="transparent")
-        storage_row.pack(fill="x", padx=16, pady=12)
-        st_left = ctk.CTkFrame(storage_row, fg_color="transparent")
-        st_left.pack(side="left", fill="x", expand=True)
-        ctk.CTkLabel(st_left, text="Maximum Data Points", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
-                     text_color=TEXT_PRIMARY, anchor="w").pack(fill="x")
-        ctk.CTkLabel(st_left, text="Limits memory usage if the app is left running unattended",
-                     font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_MUTED, anchor="w").pack(fill="x")
+        storage_card = self._build_settings_card(view, "DATA STORAGE")
 
         points_options = {
             "Unlimited": 0,
@@ -1558,35 +1973,25 @@ class PLCTrendTool(ctk.CTk):
             save_settings(self.settings)
             self._update_storage_info()
 
-        ctk.CTkOptionMenu(storage_row, variable=self._max_points_var,
-                          values=list(points_options.keys()),
-                          font=(FONT_FAMILY, FONT_SIZE_SMALL),
-                          fg_color=BG_MEDIUM, button_color=SAS_BLUE, button_hover_color=SAS_BLUE_DARK,
-                          dropdown_fg_color=BG_MEDIUM, width=185, height=32,
-                          command=on_max_points_changed).pack(side="right", padx=(12, 0))
+        self._build_setting_row(
+            storage_card, "Maximum Data Points", "Limits memory usage if the app is left running unattended",
+            lambda row: ctk.CTkOptionMenu(row, variable=self._max_points_var,
+                                          values=list(points_options.keys()),
+                                          font=FONT_SMALL,
+                                          fg_color=BG_MEDIUM, button_color=SAS_BLUE, button_hover_color=SAS_BLUE_DARK,
+                                          dropdown_fg_color=BG_MEDIUM, width=185, height=32,
+                                          command=on_max_points_changed))
 
         # Storage info row
         info_row = ctk.CTkFrame(storage_card, fg_color="transparent")
         info_row.pack(fill="x", padx=16, pady=(0, 12))
-        self._storage_info_label = ctk.CTkLabel(info_row, text="", font=(FONT_FAMILY, FONT_SIZE_SMALL),
-                                                  text_color=TEXT_MUTED, anchor="w")
-        self._storage_info_label.pack(fill="x")
+        self._settings_storage_label = ctk.CTkLabel(info_row, text="", font=FONT_SMALL,
+                                                     text_color=TEXT_MUTED, anchor="w")
+        self._settings_storage_label.pack(fill="x")
         self._update_storage_info()
 
         # -- TRENDING --
-        self._build_section_header(view, "TRENDING")
-        trend_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
-        trend_card.pack(fill="x", padx=24, pady=(0, 16))
-
-        cursor_row = ctk.CTkFrame(trend_card, fg_color="transparent")
-        cursor_row.pack(fill="x", padx=16, pady=12)
-        cr_left = ctk.CTkFrame(cursor_row, fg_color="transparent")
-        cr_left.pack(side="left", fill="x", expand=True)
-        ctk.CTkLabel(cr_left, text="Smart Cursor", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
-                     text_color=TEXT_PRIMARY, anchor="w").pack(fill="x")
-        ctk.CTkLabel(cr_left, text="Show crosshair with tag values when hovering over the trend chart",
-                     font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_MUTED, anchor="w").pack(fill="x")
-
+        trend_card = self._build_settings_card(view, "TRENDING")
         self._cursor_switch_var = ctk.BooleanVar(value=self._cursor_enabled)
 
         def on_cursor_toggled():
@@ -1595,18 +2000,17 @@ class PLCTrendTool(ctk.CTk):
             save_settings(self.settings)
             if not self._cursor_enabled:
                 self._clear_cursor_elements()
-                try: self.canvas.draw_idle()
-                except Exception: pass
+                self._request_draw()
 
-        ctk.CTkSwitch(cursor_row, text="", variable=self._cursor_switch_var,
-                      onvalue=True, offvalue=False, command=on_cursor_toggled,
-                      fg_color=BORDER_COLOR, progress_color=SAS_BLUE,
-                      button_color=("#FFFFFF", "#CCCCCC"), button_hover_color=SAS_BLUE_LIGHT,
-                      width=46, height=24).pack(side="right", padx=(12, 0))
+        self._build_setting_row(
+            trend_card, "Smart Cursor", "Show crosshair with tag values when hovering over the trend chart",
+            lambda row: ctk.CTkSwitch(row, text="", variable=self._cursor_switch_var,
+                                      onvalue=True, offvalue=False, command=on_cursor_toggled,
+                                      fg_color=BORDER_COLOR, progress_color=SAS_BLUE,
+                                      button_color=("#FFFFFF", "#CCCCCC"), button_hover_color=SAS_BLUE_LIGHT,
+                                      width=46, height=24))
 
-        self._build_section_header(view, "ABOUT")
-        about_card = ctk.CTkFrame(view, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
-        about_card.pack(fill="x", padx=24, pady=(0, 16))
+        about_card = self._build_settings_card(view, "ABOUT")
         about_inner = ctk.CTkFrame(about_card, fg_color="transparent")
         about_inner.pack(fill="x", padx=16, pady=12)
         for text, color, style in [(APP_FULL_NAME, TEXT_PRIMARY, ("bold",)), (f"Version {APP_VERSION}", TEXT_SECONDARY, ()),
@@ -1615,39 +2019,60 @@ class PLCTrendTool(ctk.CTk):
             if not text:
                 ctk.CTkFrame(about_inner, fg_color=BORDER_COLOR, height=1).pack(fill="x", pady=6)
                 continue
-            ctk.CTkLabel(about_inner, text=text, font=(FONT_FAMILY, FONT_SIZE_BODY) + style,
+            ctk.CTkLabel(about_inner, text=text, font=FONT_BODY + style,
                          text_color=color, anchor="w").pack(fill="x", pady=1)
         return view
 
     # == STYLE HELPERS ==
     def _apply_treeview_style(self):
+        colors = self._colors
+        bg, fg = colors[BG_INPUT], colors[TEXT_PRIMARY]
+        hdr_bg, border = colors[BG_MEDIUM], colors[BORDER_COLOR]
+        key = (bg, fg, hdr_bg, border, colors[TEXT_MUTED], getattr(self, "tag_tree", None) is not None)
+        if key == getattr(self, "_tree_style_key", None):
+            return  # same palette — the style database already holds these values
+        self._tree_style_key = key
         style = self.tree_style
-        style.theme_use("default")
-        bg = resolve_color(BG_INPUT)
-        fg = resolve_color(TEXT_PRIMARY)
-        hdr_bg = resolve_color(BG_MEDIUM)
-        border = resolve_color(BORDER_COLOR)
         style.configure("Treeview", background=bg, foreground=fg, fieldbackground=bg, borderwidth=0,
-                         font=(FONT_FAMILY, FONT_SIZE_BODY), rowheight=24)
+                         font=FONT_BODY, rowheight=24)
         style.configure("Treeview.Heading", background=hdr_bg, foreground=fg, borderwidth=0,
-                         font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"), relief="flat")
+                         font=FONT_BODY_BOLD, relief="flat")
         style.map("Treeview", background=[("selected", SAS_BLUE)], foreground=[("selected", "#ffffff")])
         style.map("Treeview.Heading", background=[("active", border)])
+        # Row tag colors live on the tag tree itself — set once here (and on theme
+        # change) instead of after every fetch/filter/expand
+        if getattr(self, "tag_tree", None) is not None:
+            self.tag_tree.tag_configure("group", font=FONT_BODY_BOLD)
+            self.tag_tree.tag_configure("disabled", foreground=colors[TEXT_MUTED])
+            self.tag_tree.tag_configure("trendable", foreground=fg)
+            self.tag_tree.tag_configure("struct", foreground=resolve_color(("#5080B0", "#7AB0D8")))
+            self.tag_tree.tag_configure("more", foreground=SAS_BLUE)
 
     # == TOOLTIP + CONTEXT MENU ==
+    def _configure_if_changed(self, widget, **kwargs):
+        """Configure a widget only when the options differ from the last call.
+        Used for labels refreshed every chart tick to skip redundant Tk round-trips."""
+        key = id(widget)
+        if self._widget_state.get(key) != kwargs:
+            widget.configure(**kwargs)
+            self._widget_state[key] = kwargs
+
     def _add_tooltip(self, widget, text):
-        """Add a hover tooltip to a tk widget."""
-        tip = None
+        """Add a hover tooltip to a tk widget. All tooltips share one
+        withdrawn Toplevel that is re-labelled and shown on hover, rather
+        than creating and destroying a window per hover."""
         def show(event):
-            nonlocal tip
-            tip = tk.Toplevel(widget)
-            tip.wm_overrideredirect(True)
-            tip.wm_attributes("-topmost", True)
-            lbl = tk.Label(tip, text=text, justify="left",
-                           font=(FONT_FAMILY, FONT_SIZE_SMALL),
-                           bg=resolve_color(BG_MEDIUM), fg=resolve_color(TEXT_PRIMARY),
-                           padx=6, pady=3, relief="solid", borderwidth=1)
-            lbl.pack()
+            tip = getattr(self, "_tooltip_win", None)
+            if tip is None or not tip.winfo_exists():
+                tip = self._tooltip_win = tk.Toplevel(self)
+                tip.withdraw()
+                tip.wm_overrideredirect(True)
+                tip.wm_attributes("-topmost", True)
+                self._tooltip_lbl = tk.Label(tip, justify="left", font=FONT_SMALL,
+                                             padx=6, pady=3, relief="solid", borderwidth=1)
+                self._tooltip_lbl.pack()
+            self._tooltip_lbl.configure(text=text, bg=self._colors[BG_MEDIUM],
+                                        fg=self._colors[TEXT_PRIMARY])
             tip.update_idletasks()
             tw = tip.winfo_reqwidth()
             screen_w = widget.winfo_screenwidth()
@@ -1656,11 +2081,11 @@ class PLCTrendTool(ctk.CTk):
                 x = event.x_root - tw - 8
             y = event.y_root + 8
             tip.wm_geometry(f"+{x}+{y}")
+            tip.deiconify()
         def hide(event):
-            nonlocal tip
-            if tip:
-                tip.destroy()
-                tip = None
+            tip = getattr(self, "_tooltip_win", None)
+            if tip is not None:
+                tip.withdraw()
         widget.bind("<Enter>", show)
         widget.bind("<Leave>", hide)
 
@@ -1669,75 +2094,71 @@ class PLCTrendTool(ctk.CTk):
         if not self._isolated_mode or len(self.axes) <= 1:
             return None  # overlay mode — no specific axis
         # Convert tk event coords to figure coords
-        w = self.canvas.get_tk_widget()
-        dpi = self.fig.dpi
-        fig_w, fig_h = self.fig.get_size_inches()
-        px_w = fig_w * dpi
-        px_h = fig_h * dpi
+        px_w, px_h = self.fig.bbox.width, self.fig.bbox.height
         fx = event.x / px_w if px_w else 0
         fy = 1.0 - (event.y / px_h) if px_h else 0
-        tags = self._get_ordered_tags()
-        for i, ax in enumerate(self.axes):
-            bbox = ax.get_position()
-            if bbox.x0 <= fx <= bbox.x1 and bbox.y0 <= fy <= bbox.y1:
-                return i
-        return None
+        # Axes boxes as an (n, 4) array of x0, x1, y0, y1; rebuilt when the
+        # axes list changes or the margins are re-applied
+        key = tuple(map(id, self.axes))
+        cached = self._axis_bboxes
+        if cached is None or cached[0] != key:
+            boxes = np.array([(b.x0, b.x1, b.y0, b.y1) for b in (a.get_position() for a in self.axes)])
+            cached = self._axis_bboxes = (key, boxes)
+        bb = cached[1]
+        hit = (bb[:, 0] <= fx) & (fx <= bb[:, 1]) & (bb[:, 2] <= fy) & (fy <= bb[:, 3])
+        return int(hit.argmax()) if hit.any() else None
 
     def _show_chart_context_menu(self, event):
-        """Build and show dynamic right-click context menu on the chart."""
-        menu = tk.Menu(self.canvas.get_tk_widget(), tearoff=0,
-                       bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_PRIMARY),
-                       activebackground=SAS_BLUE, activeforeground="#FFFFFF",
-                       font=(FONT_FAMILY, FONT_SIZE_SMALL))
+        """Show the right-click context menu on the chart. The menu is built
+        once; only the mode-dependent entries at the top are swapped per show."""
+        menu = getattr(self, "_chart_ctx_menu", None)
+        if menu is None:
+            colors = self._colors
+            menu = self._chart_ctx_menu = tk.Menu(self.canvas.get_tk_widget(), tearoff=0,
+                                                  bg=colors[BG_CARD], fg=colors[TEXT_PRIMARY],
+                                                  activebackground=SAS_BLUE, activeforeground="#FFFFFF",
+                                                  font=FONT_SMALL)
+            # Fixed tail — identical for every show
+            menu.add_command(label="\u25B6  Follow Live", command=self._snap_to_live)
+            menu.add_command(label="\u2302  Reset View", command=self.chart_toolbar.home)
+            menu.add_separator()
+            menu.add_command(label="\u2386  Save Image...", command=self.chart_toolbar.save_figure)
+            self._ctx_dynamic_count = 0
+        elif self._ctx_dynamic_count:
+            menu.delete(0, self._ctx_dynamic_count - 1)
 
         # Determine which axis was right-clicked (for isolated mode)
         tags = self._get_ordered_tags()
-        clicked_ax_idx = None
-        if self._isolated_mode and len(self.axes) > 1 and tags:
-            # Convert tk event coords to matplotlib figure coords
-            w = self.canvas.get_tk_widget()
-            dpi = self.fig.dpi
-            fig_w, fig_h = self.fig.get_size_inches()
-            px_w = fig_w * dpi
-            px_h = fig_h * dpi
-            fx = event.x / px_w if px_w else 0
-            fy = 1.0 - (event.y / px_h) if px_h else 0
-            for i, ax in enumerate(self.axes):
-                bbox = ax.get_position()
-                if bbox.x0 <= fx <= bbox.x1 and bbox.y0 <= fy <= bbox.y1:
-                    clicked_ax_idx = i
-                    break
+        clicked_ax_idx = self._get_axis_at_event(event) if tags else None
 
+        entries = []  # (item type, options) inserted above the fixed tail
         # "Line Properties..." — context-aware
         if self._isolated_mode and clicked_ax_idx is not None and clicked_ax_idx < len(tags):
             clicked_tag = tags[clicked_ax_idx]
             short = clicked_tag.split(".")[-1] if "." in clicked_tag else clicked_tag
-            menu.add_command(label=f"\u270E  Line Properties ({short})...",
-                             command=lambda t=clicked_tag: self._show_line_properties([t]))
+            entries.append(("command", dict(label=f"\u270E  Line Properties ({short})...",
+                                            command=lambda t=clicked_tag: self._show_line_properties([t]))))
         elif tags:
-            menu.add_command(label="\u270E  Line Properties...",
-                             command=lambda: self._show_line_properties(list(tags)))
+            entries.append(("command", dict(label="\u270E  Line Properties...",
+                                            command=lambda: self._show_line_properties(list(tags)))))
 
-        menu.add_command(label="\u2699  Trend Properties...",
-                         command=self._show_chart_properties)
-        menu.add_separator()
+        entries.append(("command", dict(label="\u2699  Trend Properties...",
+                                        command=self._show_chart_properties)))
+        entries.append(("separator", {}))
 
         # Drag-reorder hint (isolated mode only)
         if self._isolated_mode and len(self.axes) > 1:
-            menu.add_command(label="\u2195  Reorder Charts (Ctrl + Drag)",
-                             state="disabled")
-            menu.add_command(label="\u2194  Double-Click to Expand Chart",
-                             state="disabled")
-            menu.add_separator()
+            entries.append(("command", dict(label="\u2195  Reorder Charts (Ctrl + Drag)", state="disabled")))
+            entries.append(("command", dict(label="\u2194  Double-Click to Expand Chart", state="disabled")))
+            entries.append(("separator", {}))
         elif self._fullscreen_tag:
-            menu.add_command(label="\u2196  Exit Fullscreen (Double-Click)",
-                             command=self._exit_fullscreen)
-            menu.add_separator()
+            entries.append(("command", dict(label="\u2196  Exit Fullscreen (Double-Click)",
+                                            command=self._exit_fullscreen)))
+            entries.append(("separator", {}))
 
-        menu.add_command(label="\u25B6  Follow Live", command=self._snap_to_live)
-        menu.add_command(label="\u2302  Reset View", command=self.chart_toolbar.home)
-        menu.add_separator()
-        menu.add_command(label="\u2386  Save Image...", command=self.chart_toolbar.save_figure)
+        for i, (kind, opts) in enumerate(entries):
+            menu.insert(i, kind, **opts)
+        self._ctx_dynamic_count = len(entries)
 
         try:
             menu.tk_popup(event.x_root, event.y_root)
@@ -1752,40 +2173,57 @@ class PLCTrendTool(ctk.CTk):
 
     def _apply_chart_margins(self, hspace=None):
         """Apply subplot margins using fixed pixel sizes so charts fill the space."""
+        if getattr(self, '_layout_pending', False):
+            return  # _apply_chart_zoom_inner applies margins once when it finishes
         fig_h = self.fig.get_figheight() * self.fig.dpi  # height in pixels
         fig_w = self.fig.get_figwidth() * self.fig.dpi
         if fig_h < 50 or fig_w < 50:
             return  # not sized yet
-        # Fixed pixel margins: bottom ~45px for time labels, top ~10px, left ~55px for y-labels
-        bottom = min(45 / fig_h, 0.15)
-        top = 1.0 - min(10 / fig_h, 0.05)
-        left = min(55 / fig_w, 0.12)
-        right = 1.0 - min(10 / fig_w, 0.03)
+        # Fixed pixel margins: bottom ~45px for time labels, top ~10px, left ~55px for y-labels,
+        # capped as a fraction on small figures (thresholds are folded at compile time)
+        bottom = 0.15 if fig_h < 300 else 45.0 / fig_h
+        top = 0.95 if fig_h < 200 else 1.0 - 10.0 / fig_h
+        left = 0.12 if fig_w < 55 / 0.12 else 55.0 / fig_w
+        right = 0.97 if fig_w < 10 / 0.03 else 1.0 - 10.0 / fig_w
         if hspace is None:
             if (hasattr(self, '_isolated_mode') and self._isolated_mode
                     and hasattr(self, 'axes') and len(self.axes) > 1):
                 hspace = 0
             else:
                 hspace = 0.15
+        # Keyed on the resulting fractions, so resizes within a capped range
+        # skip subplots_adjust (and the stale propagation it triggers) too
+        key = (bottom, top, left, right, hspace)
+        if key == getattr(self, '_last_margins_key', None):
+            return  # positions are already right
+        self._last_margins_key = key
         self.fig.subplots_adjust(left=left, right=right, top=top, bottom=bottom, hspace=hspace)
+        self._axis_bboxes = None  # axes moved — drop the hit-test cache
 
     def _on_chart_resize(self, event=None):
-        """Re-apply subplot spacing when the chart canvas is resized."""
-        if not hasattr(self, 'axes') or not self.axes:
-            return
-        self._apply_chart_margins()
-        try:
-            self.canvas.draw_idle()
-        except Exception:
-            pass
+        """Chart canvas resized — re-layout once the resize settles."""
+        self._schedule_resize()
 
     def _on_scroll_canvas_configure(self, event=None):
-        """When the scrollable container resizes, re-apply zoom sizing."""
-        if not hasattr(self, 'fig') or not hasattr(self, '_chart_scroll_canvas'):
+        """Scrollable container resized — re-apply zoom once the resize settles."""
+        self._schedule_resize()
+
+    def _schedule_resize(self):
+        """Debounce <Configure> storms while a window edge or sash is dragged:
+        the zoom/margin pass and redraw run 80 ms after the last event."""
+        if self._resize_after:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(80, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_after = None
+        if not hasattr(self, 'fig') or not hasattr(self, '_chart_viewport'):
             return
-        if getattr(self, '_applying_zoom', False):
-            return  # prevent recursion
-        self._apply_chart_zoom()
+        if not getattr(self, '_applying_zoom', False) and self._apply_chart_zoom():
+            return  # zoom pass already applied margins and queued the redraw
+        if not hasattr(self, 'axes') or not self.axes:
+            return
+        self._request_draw()
 
     def _on_chart_zoom_change(self, value):
         """Callback from the zoom slider."""
@@ -1799,22 +2237,24 @@ class PLCTrendTool(ctk.CTk):
         self._apply_chart_zoom()
 
     def _apply_chart_zoom(self):
-        """Resize the matplotlib figure based on zoom level and update scroll region."""
-        if not hasattr(self, '_chart_scroll_canvas'):
-            return
+        """Resize the matplotlib figure based on zoom level and update scroll region.
+        Returns True if the layout was re-applied (margins and redraw included)."""
+        if not hasattr(self, '_chart_viewport'):
+            return False
         self._applying_zoom = True
         try:
-            self._apply_chart_zoom_inner()
+            return self._apply_chart_zoom_inner()
         finally:
             self._applying_zoom = False
+            self._layout_pending = False
 
     def _apply_chart_zoom_inner(self):
         """Inner zoom logic — called inside recursion guard."""
-        sc = self._chart_scroll_canvas
+        sc = self._chart_viewport
         visible_w = sc.winfo_width()
         visible_h = sc.winfo_height()
         if visible_w < 10 or visible_h < 10:
-            return  # not sized yet
+            return False  # not sized yet
 
         tags = self._get_ordered_tags() if hasattr(self, '_tag_order') else []
         n_charts = len(tags) if self._isolated_mode and not self._fullscreen_tag else 1
@@ -1823,6 +2263,16 @@ class PLCTrendTool(ctk.CTk):
 
         dpi = self.fig.dpi
 
+        # Resize storms re-enter here with identical geometry; skip the
+        # figure resize, margin pass and redraw when nothing changed
+        key = (visible_w, visible_h, n_charts, round(self._chart_zoom, 3), dpi)
+        if key == self._last_zoom_key:
+            return False
+        self._last_zoom_key = key
+        # Margin passes triggered while the figure is being resized are
+        # deferred to the single one at the end
+        self._layout_pending = True
+
         if self._chart_zoom <= 1.0 or not self._isolated_mode or n_charts <= 1:
             # Auto-fit: figure fills visible area exactly
             fig_h_px = visible_h
@@ -1838,41 +2288,66 @@ class PLCTrendTool(ctk.CTk):
         fig_h = fig_h_px / dpi
 
         self.fig.set_size_inches(fig_w, fig_h)
-        self.canvas.get_tk_widget().configure(width=visible_w, height=fig_h_px)
-
-        # Update scroll region and scrollbar visibility
-        sc.configure(scrollregion=(0, 0, visible_w, fig_h_px))
-        sc.itemconfigure(self._chart_canvas_window, width=visible_w, height=fig_h_px)
+        self._chart_fig_h = fig_h_px
+        self.canvas.get_tk_widget().place_configure(relwidth=1.0, relheight=0, height=fig_h_px)
 
+        # Update scrollbar visibility and keep the offset inside the new height
         if need_scroll:
             if not self._chart_vscroll_visible:
                 self._chart_vscroll.grid(row=0, column=1, sticky="ns")
                 self._chart_vscroll_visible = True
+            self._set_chart_scroll(self._chart_scroll_y)
         else:
             if self._chart_vscroll_visible:
                 self._chart_vscroll.grid_forget()
                 self._chart_vscroll_visible = False
-            sc.yview_moveto(0)  # reset scroll position
+            self._set_chart_scroll(0)  # reset scroll position
 
-        self._apply_chart_margins()
-        try:
-            self.canvas.draw_idle()
-        except Exception:
-            pass
+        self._layout_pending = False
+        self._request_draw()
+        return True
 
     def _on_chart_mousewheel(self, event):
         """Handle mousewheel for vertical chart scrolling when zoomed."""
         if not self._chart_vscroll_visible:
             return  # no scrolling needed
-        # Windows: event.delta is typically +/-120
-        self._chart_scroll_canvas.yview_scroll(-1 * (event.delta // 120), "units")
+        # Windows: event.delta is typically +/-120. Fast wheels and touchpads
+        # send bursts; sum them and scroll once when Tk goes idle.
+        self._pending_wheel_delta += event.delta // 120
+        if not self._wheel_flush_scheduled:
+            self._wheel_flush_scheduled = True
+            self.after_idle(self._flush_chart_wheel)
+
+    def _flush_chart_wheel(self):
+        delta, self._pending_wheel_delta = self._pending_wheel_delta, 0
+        self._wheel_flush_scheduled = False
+        if delta:
+            self._on_chart_yview("scroll", -delta, "units")
+
+    def _on_chart_yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")."""
+        visible_h = max(self._chart_viewport.winfo_height(), 1)
+        if args[0] == "moveto":
+            offset = float(args[1]) * self._chart_fig_h
+        else:
+            step = visible_h if args[2] == "pages" else visible_h / 10
+            offset = self._chart_scroll_y + int(args[1]) * step
+        self._set_chart_scroll(offset)
+
+    def _set_chart_scroll(self, offset):
+        """Shift the chart widget up by offset px (clamped) and sync the scrollbar."""
+        fig_h = max(self._chart_fig_h, 1)
+        visible_h = max(self._chart_viewport.winfo_height(), 1)
+        offset = int(min(max(offset, 0), max(fig_h - visible_h, 0)))
+        self._chart_scroll_y = offset
+        self.canvas.get_tk_widget().place_configure(y=-offset)
+        self._chart_vscroll.set(offset / fig_h, min((offset + visible_h) / fig_h, 1.0))
 
     def _style_chart_axes(self, ax=None):
         """Style a single axes object. If ax is None, styles all axes."""
         targets = [ax] if ax else self.axes
-        face = resolve_color(BG_INPUT)
-        text = resolve_color(TEXT_SECONDARY)
-        grid = resolve_color(BORDER_COLOR)
+        colors = self._colors
+        face, text, grid = colors[BG_INPUT], colors[TEXT_SECONDARY], colors[BORDER_COLOR]
         for a in targets:
             a.set_facecolor(face)
             a.tick_params(colors=text, labelsize=9)
@@ -1927,7 +2402,14 @@ class PLCTrendTool(ctk.CTk):
     def _get_ordered_tags(self):
         """Return tags in current display order.
         Uses selected_tags as primary source (live/configuring),
-        falls back to trend.tags (imported historical data)."""
+        falls back to trend.tags (imported historical data).
+        The result is cached until the selection or order changes — callers
+        must not mutate the returned list."""
+        if self._ordered_tags_cache is None:
+            self._ordered_tags_cache = self._compute_ordered_tags()
+        return self._ordered_tags_cache
+
+    def _compute_ordered_tags(self):
         if self.selected_tags:
             tags = set(self.selected_tags)
         elif self.trend.tags:
@@ -1936,58 +2418,88 @@ class PLCTrendTool(ctk.CTk):
             return []
         # Maintain order: keep existing ordered tags still present, append new ones
         ordered = [t for t in self._tag_order if t in tags]
-        new_tags = sorted(t for t in tags if t not in set(self._tag_order))
-        ordered.extend(new_tags)
+        if len(ordered) < len(tags):  # only sort when something new appeared
+            known = frozenset(ordered)
+            ordered.extend(sorted(t for t in tags if t not in known))
         self._tag_order = ordered
         return list(self._tag_order)
 
     def _get_line_props(self, tag, idx):
-        """Get line properties for a tag, with defaults based on index.
+        """Get (color, width, style) for a tag, with defaults based on index.
         Persists the default color on first access so it stays with the tag
         even after drag-reorder changes the index."""
-        defaults = {
-            "color": TRACE_COLORS[idx % len(TRACE_COLORS)],
-            "width": 1.5,
-            "style": "-",
-        }
-        props = self._line_props.get(tag, {})
-        result = {k: props.get(k, v) for k, v in defaults.items()}
-        # Lock in the color so reordering doesn't change it
-        if "color" not in props:
-            self._line_props.setdefault(tag, {})["color"] = result["color"]
-        return result
+        cached = self._line_props_cache.get(tag)
+        if cached is not None:
+            return cached
+        props = self._line_props.get(tag)
+        if props is None:
+            props = self._line_props[tag] = {}
+        color = props.get("color")
+        if color is None:
+            # Lock in the color so reordering doesn't change it
+            color = props["color"] = TRACE_COLORS[idx % len(TRACE_COLORS)]
+        cached = self._line_props_cache[tag] = (color, props.get("width", 1.5), props.get("style", "-"))
+        return cached
 
     # == XLIM SYNC FOR ISOLATED SUBPLOTS ==
     def _connect_xlim_sync(self):
         """Connect xlim_changed callbacks so all isolated subplots stay synced."""
-        self._xlim_cids = []
         if not self._isolated_mode or len(self.axes) <= 1:
             return
         for ax in self.axes:
-            cid = ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
-            self._xlim_cids.append((ax, cid))
+            self._xlim_cids[ax] = ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
 
     def _disconnect_xlim_sync(self):
         """Remove xlim sync callbacks."""
-        for ax, cid in getattr(self, "_xlim_cids", []):
-            try:
-                ax.callbacks.disconnect(cid)
-            except Exception:
-                pass
-        self._xlim_cids = []
+        # Weak keys: axes dropped by fig.clear() are neither kept alive here
+        # nor visited
+        for ax, cid in list(self._xlim_cids.items()):
+            ax.callbacks.disconnect(cid)
+        self._xlim_cids.clear()
 
     def _on_xlim_changed(self, changed_ax):
-        """Sync xlim from changed_ax to all other axes."""
-        if self._syncing_xlim:
+        """Sync xlim from changed_ax to all other axes. A pan or zoom fires this
+        per event; only the latest limits are kept and copied across once when
+        Tk goes idle. Code that sets the same limits on every axis itself passes
+        emit=False, since there is nothing left to sync."""
+        self._pending_xlim = changed_ax.get_xlim()
+        if not self._xlim_flush_scheduled:
+            self._xlim_flush_scheduled = True
+            self.after_idle(self._flush_xlim_sync)
+
+    def _flush_xlim_sync(self):
+        new_xlim, self._pending_xlim = self._pending_xlim, None
+        self._xlim_flush_scheduled = False
+        if new_xlim is None:
             return
-        self._syncing_xlim = True
-        try:
-            new_xlim = changed_ax.get_xlim()
-            for ax in self.axes:
-                if ax is not changed_ax:
-                    ax.set_xlim(new_xlim)
-        finally:
-            self._syncing_xlim = False
+        changed = False
+        for ax in self.axes:
+            if ax.get_xlim() != new_xlim:
+                ax.set_xlim(new_xlim, emit=False)  # no xlim_changed, so no re-entry
+                changed = True
+        if changed:
+            # Straight to draw_idle: it merges with the redraw a toolbar pan
+            # has already queued, where a second idle hop would draw twice
+            try: self.canvas.draw_idle()
+            except Exception: pass
+
+    def _dispatch_press(self, event):
+        # Every press handler acts on the left button only
+        if event.button != 1:
+            return
+        self._run_chart_handlers(self._dblclick_handlers if event.dblclick else self._press_handlers, event)
+
+    def _dispatch_release(self, event):
+        self._run_chart_handlers(self._release_handlers, event)
+
+    def _run_chart_handlers(self, handlers, event):
+        # Like separate mpl_connect callbacks: one handler raising is logged
+        # and the rest still run
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Chart event handler %s failed", handler.__name__)
 
     # == DRAG/DROP REORDER FOR ISOLATED SUBPLOTS ==
     def _pan_save_ylims(self, event):
@@ -1996,10 +2508,10 @@ class PLCTrendTool(ctk.CTk):
             return
         mode = self.chart_toolbar.mode
         if mode == 'pan/zoom':
-            self._saved_ylims = {id(ax): ax.get_ylim() for ax in self.axes}
+            self._saved_ylims = [(ax, ax.get_ylim()) for ax in self.axes]
         elif mode == 'zoom rect' and self._isolated_mode and len(self.axes) > 1:
             # In isolated mode, zoom should only affect X so subplots keep their Y scales
-            self._saved_ylims = {id(ax): ax.get_ylim() for ax in self.axes}
+            self._saved_ylims = [(ax, ax.get_ylim()) for ax in self.axes]
 
     def _pan_restore_ylims(self, event):
         """Restore Y-axis limits after pan/zoom to lock vertical axis."""
@@ -2007,15 +2519,14 @@ class PLCTrendTool(ctk.CTk):
             return
         mode = self.chart_toolbar.mode
         if mode in ('pan/zoom', 'zoom rect'):
-            for ax in self.axes:
-                ylim = self._saved_ylims.get(id(ax))
-                if ylim is not None:
-                    ax.set_ylim(ylim)
-            self._saved_ylims = {}
-            try:
-                self.canvas.draw_idle()
-            except Exception:
-                pass
+            changed = False
+            for ax, ylim in self._saved_ylims:
+                if ax.get_ylim() != ylim:  # skip axes the drag left alone
+                    ax.set_ylim(ylim, emit=False)
+                    changed = True
+            self._saved_ylims = []
+            if changed:
+                self._request_draw()
 
     def _on_chart_press(self, event):
         """Handle mouse press for Ctrl+drag reorder of isolated subplots."""
@@ -2033,11 +2544,19 @@ class PLCTrendTool(ctk.CTk):
         # Deactivate toolbar pan/zoom so it doesn't conflict with drag-reorder
         if self.chart_toolbar.mode:
             self.chart_toolbar.mode = ''
-            self._saved_ylims = {}  # clear any saved ylims
+            self._saved_ylims = []  # clear any saved ylims
         # Find which subplot was clicked
         for i, ax in enumerate(self.axes):
             if event.inaxes == ax:
-                self._drag_state = {"src_idx": i, "highlight": None}
+                # One hidden drop-target highlight per subplot, in axes coords so
+                # it always spans the full plot; motion only toggles visibility
+                highlights = []
+                for a in self.axes:
+                    rect = Rectangle((0, 0), 1, 1, transform=a.transAxes, facecolor=SAS_BLUE,
+                                     alpha=0.15, zorder=0, animated=True, visible=False)
+                    a.add_patch(rect)
+                    highlights.append(rect)
+                self._drag_state = {"src_idx": i, "highlights": highlights}
                 self.canvas.get_tk_widget().config(cursor="fleur")
                 # Connect motion for drag visual
                 self._drag_motion_cid = self.canvas.mpl_connect(
@@ -2046,31 +2565,28 @@ class PLCTrendTool(ctk.CTk):
 
     def _on_drag_motion(self, event):
         """Show highlight on target subplot during drag."""
-        if self._drag_state is None:
+        state = self._drag_state
+        if state is None:
             return
-        # Remove old highlight
-        if self._drag_state.get("highlight"):
-            try:
-                self._drag_state["highlight"].remove()
-            except Exception:
-                pass
-            self._drag_state["highlight"] = None
         # Find target axis
+        tgt = None
         for i, ax in enumerate(self.axes):
-            if event.inaxes == ax and i != self._drag_state["src_idx"]:
-                # Draw highlight rectangle
-                highlight = ax.axhspan(
-                    ax.get_ylim()[0], ax.get_ylim()[1],
-                    facecolor=SAS_BLUE, alpha=0.15, zorder=0)
-                self._drag_state["highlight"] = highlight
-                self._drag_state["tgt_idx"] = i
+            if event.inaxes == ax and i != state["src_idx"]:
+                tgt = i
                 break
+        prev = state.get("tgt_idx")
+        if tgt == prev:
+            return  # still over the same target — nothing to repaint
+        highlights = state["highlights"]
+        if prev is not None and prev < len(highlights):
+            highlights[prev].set_visible(False)
+        if tgt is None:
+            state.pop("tgt_idx", None)
         else:
-            self._drag_state.pop("tgt_idx", None)
-        try:
-            self.canvas.draw_idle()
-        except Exception:
-            pass
+            state["tgt_idx"] = tgt
+            if tgt < len(highlights):
+                highlights[tgt].set_visible(True)
+        self._redraw_chart()  # blits over the cached background when it is valid
 
     def _on_chart_release(self, event):
         """Handle mouse release for drag-reorder completion."""
@@ -2080,10 +2596,10 @@ class PLCTrendTool(ctk.CTk):
         if hasattr(self, "_drag_motion_cid"):
             self.canvas.mpl_disconnect(self._drag_motion_cid)
             del self._drag_motion_cid
-        # Remove highlight
-        if self._drag_state.get("highlight"):
+        # Remove highlights
+        for rect in self._drag_state.get("highlights", ()):
             try:
-                self._drag_state["highlight"].remove()
+                rect.remove()
             except Exception:
                 pass
         self.canvas.get_tk_widget().config(cursor="")
@@ -2091,13 +2607,17 @@ class PLCTrendTool(ctk.CTk):
         tgt = self._drag_state.get("tgt_idx")
         self._drag_state = None
         if src is not None and tgt is not None and src != tgt:
-            tags = self._get_ordered_tags()
+            tags = list(self._get_ordered_tags())
             if src < len(tags) and tgt < len(tags):
                 # Move tag from src to tgt position
                 tag = tags.pop(src)
                 tags.insert(tgt, tag)
                 self._tag_order = tags
+                self._ordered_tags_cache = None
                 self._rebuild_chart()
+                return
+        if tgt is not None:
+            self._redraw_chart()  # dropped in place — repaint without the highlight
 
     # == LINE PROPERTIES DIALOG ==
     LINE_STYLES = [
@@ -2107,6 +2627,11 @@ class PLCTrendTool(ctk.CTk):
         ("-.", "Dash-Dot ─·─·"),
     ]
     LINE_WIDTHS = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]
+    # Lookups and dropdown values derived once instead of per dialog / per tag card
+    LINE_STYLE_KEY_TO_LABEL = dict(LINE_STYLES)
+    LINE_STYLE_LABEL_TO_KEY = {label: key for key, label in LINE_STYLES}
+    LINE_STYLE_LABELS = [label for _, label in LINE_STYLES]
+    LINE_WIDTH_LABELS = [str(w) for w in LINE_WIDTHS]
 
     def _show_line_properties(self, tags_to_edit):
         """Open a dialog to edit line color, width, style, and chart background for the given tags."""
@@ -2133,13 +2658,13 @@ class PLCTrendTool(ctk.CTk):
                                           height=height - 110)
         scroll.pack(fill="both", expand=True, padx=8, pady=(0, 4))
 
-        all_tags = self._get_ordered_tags()
-        default_bg = resolve_color(BG_INPUT)
+        tag_index = {tag: i for i, tag in enumerate(self._get_ordered_tags())}
+        default_bg = self._colors[BG_INPUT]
         tag_edits = {}  # {tag: {"color_var": ..., "width_var": ..., "style_var": ..., "bg_var": ...}}
 
         for tag in tags_to_edit:
-            idx = all_tags.index(tag) if tag in all_tags else 0
-            props = self._get_line_props(tag, idx)
+            idx = tag_index.get(tag, 0)
+            cur_color, cur_width, cur_style = self._get_line_props(tag, idx)
             current_bg = self._chart_bg.get(tag, "")
 
             card = ctk.CTkFrame(scroll, fg_color=BG_MEDIUM, corner_radius=6)
@@ -2151,7 +2676,7 @@ class PLCTrendTool(ctk.CTk):
 
             display_name = smart_tag_name(tag, tags_to_edit)
             ctk.CTkLabel(hdr, text=display_name,
-                         font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                         font=FONT_BODY_BOLD,
                          text_color=TEXT_PRIMARY).pack(side="left")
 
             # Line controls row
@@ -2159,12 +2684,12 @@ class PLCTrendTool(ctk.CTk):
             ctrl.pack(fill="x", padx=10, pady=(0, 4))
 
             # Color picker
-            ctk.CTkLabel(ctrl, text="Color:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+            ctk.CTkLabel(ctrl, text="Color:", font=FONT_SMALL,
                          text_color=TEXT_SECONDARY).pack(side="left")
-            color_var = ctk.StringVar(value=props["color"])
+            color_var = ctk.StringVar(value=cur_color)
             color_btn = tk.Button(ctrl, width=3, height=1,
-                                   bg=props["color"], relief="solid", bd=1,
-                                   activebackground=props["color"], cursor="hand2")
+                                   bg=cur_color, relief="solid", bd=1,
+                                   activebackground=cur_color, cursor="hand2")
             color_btn.pack(side="left", padx=(4, 12))
 
             def make_color_picker(btn, var, title, parent_dlg):
@@ -2181,26 +2706,25 @@ class PLCTrendTool(ctk.CTk):
                                                           f"Line Color — {tag}", dlg))
 
             # Width dropdown
-            ctk.CTkLabel(ctrl, text="Width:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+            ctk.CTkLabel(ctrl, text="Width:", font=FONT_SMALL,
                          text_color=TEXT_SECONDARY).pack(side="left")
-            width_var = ctk.StringVar(value=str(props["width"]))
+            width_var = ctk.StringVar(value=str(cur_width))
             ctk.CTkOptionMenu(ctrl, variable=width_var,
-                              values=[str(w) for w in self.LINE_WIDTHS],
-                              font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                              values=self.LINE_WIDTH_LABELS,
+                              font=FONT_SMALL,
                               fg_color=BG_INPUT, button_color=SAS_BLUE,
                               button_hover_color=SAS_BLUE_DARK,
                               dropdown_fg_color=BG_INPUT,
                               width=70, height=26).pack(side="left", padx=(4, 12))
 
             # Style dropdown
-            ctk.CTkLabel(ctrl, text="Style:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+            ctk.CTkLabel(ctrl, text="Style:", font=FONT_SMALL,
                          text_color=TEXT_SECONDARY).pack(side="left")
-            style_labels = {s[0]: s[1] for s in self.LINE_STYLES}
-            current_label = style_labels.get(props["style"], "Solid ─────")
+            current_label = self.LINE_STYLE_KEY_TO_LABEL.get(cur_style, "Solid ─────")
             style_var = ctk.StringVar(value=current_label)
             ctk.CTkOptionMenu(ctrl, variable=style_var,
-                              values=[s[1] for s in self.LINE_STYLES],
-                              font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                              values=self.LINE_STYLE_LABELS,
+                              font=FONT_SMALL,
                               fg_color=BG_INPUT, button_color=SAS_BLUE,
                               button_hover_color=SAS_BLUE_DARK,
                               dropdown_fg_color=BG_INPUT,
@@ -2210,7 +2734,7 @@ class PLCTrendTool(ctk.CTk):
             bg_row = ctk.CTkFrame(card, fg_color="transparent")
             bg_row.pack(fill="x", padx=10, pady=(0, 8))
 
-            ctk.CTkLabel(bg_row, text="Chart BG:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+            ctk.CTkLabel(bg_row, text="Chart BG:", font=FONT_SMALL,
                          text_color=TEXT_SECONDARY).pack(side="left")
             bg_var = ctk.StringVar(value=current_bg if current_bg else default_bg)
             bg_btn = tk.Button(bg_row, width=3, height=1,
@@ -2229,8 +2753,8 @@ class PLCTrendTool(ctk.CTk):
                     btn.configure(bg=def_bg, activebackground=def_bg)
                 return reset
             tk.Button(bg_row, text="Reset", font=(FONT_FAMILY, FONT_SIZE_SMALL - 1),
-                      bg=resolve_color(BG_CARD), fg=resolve_color(TEXT_MUTED),
-                      activebackground=resolve_color(BG_CARD_HOVER),
+                      bg=self._colors[BG_CARD], fg=self._colors[TEXT_MUTED],
+                      activebackground=self._colors[BG_CARD_HOVER],
                       bd=1, relief="solid", padx=4, pady=0, cursor="hand2",
                       command=make_reset_bg(bg_btn, bg_var)).pack(side="left")
 
@@ -2242,7 +2766,7 @@ class PLCTrendTool(ctk.CTk):
             }
 
         def apply_and_close():
-            label_to_style = {s[1]: s[0] for s in self.LINE_STYLES}
+            label_to_style = self.LINE_STYLE_LABEL_TO_KEY
             for tag, edits in tag_edits.items():
                 color = edits["color_var"].get()
                 try:
@@ -2251,6 +2775,7 @@ class PLCTrendTool(ctk.CTk):
                     w = 1.5
                 style = label_to_style.get(edits["style_var"].get(), "-")
                 self._line_props[tag] = {"color": color, "width": w, "style": style}
+                self._line_props_cache[tag] = (color, w, style)
                 if tag in self.lines:
                     self.lines[tag].set_color(color)
                     self.lines[tag].set_linewidth(w)
@@ -2269,36 +2794,73 @@ class PLCTrendTool(ctk.CTk):
                 leg = ax.get_legend()
                 if leg:
                     if self._show_legend:
-                        ax.legend(loc="upper left", fontsize=7 if self._isolated_mode else 8,
-                                  facecolor=resolve_color(BG_INPUT),
-                                  edgecolor=resolve_color(BORDER_COLOR),
-                                  labelcolor=resolve_color(TEXT_SECONDARY))
+                        # Restyle the existing legend's swatches in place rather
+                        # than rebuilding it (handles follow the labelled lines)
+                        lines = [ln for ln in ax.get_lines() if not ln.get_label().startswith("_")]
+                        for handle, ln in zip(leg.legend_handles, lines):
+                            handle.set_color(ln.get_color())
+                            handle.set_linewidth(ln.get_linewidth())
+                            handle.set_linestyle(ln.get_linestyle())
                     else:
                         leg.remove()
-            try:
-                self.canvas.draw_idle()
-            except Exception:
-                pass
+            self._request_draw()
             dlg.destroy()
 
-        ctk.CTkButton(btn_row, text="Apply & Close", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+        ctk.CTkButton(btn_row, text="Apply & Close", font=FONT_BODY_BOLD,
                        fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK, height=32,
                        command=apply_and_close).pack(side="left", padx=(0, 8))
-        ctk.CTkButton(btn_row, text="Cancel", font=(FONT_FAMILY, FONT_SIZE_BODY),
+        ctk.CTkButton(btn_row, text="Cancel", font=FONT_BODY,
                        fg_color=BG_MEDIUM, hover_color=BG_CARD_HOVER, height=32,
                        text_color=TEXT_SECONDARY,
                        command=dlg.destroy).pack(side="right")
 
     # == CHART LAYOUT MANAGEMENT ==
+    def _chart_layout_key(self, tags, display_tags, tag_index):
+        """Everything _rebuild_chart bakes into the axes. While it is unchanged
+        the existing axes and lines can be reused and only their data reloaded."""
+        return (tuple(display_tags), self._isolated_mode, self._fullscreen_tag, self._show_legend,
+                self._show_x_scale, self._show_x_grid,
+                self._colors[TEXT_SECONDARY], self._colors[BG_INPUT], self._colors[BORDER_COLOR],
+                tuple(self._get_line_props(t, tag_index.get(t, i)) for i, t in enumerate(display_tags)),
+                tuple((self._chart_bg.get(t), self._manual_ylims.get(t)) for t in tags))
+
     def _rebuild_chart(self):
         """Rebuild the chart with current tags and per-tag scales."""
+        tags = self._get_ordered_tags()
+        # Fullscreen mode: show only the expanded tag as a single subplot
+        # (_sync_tags_to_chart exits fullscreen when that tag is removed)
+        display_tags = tags
+        if self._fullscreen_tag and self._isolated_mode and self._fullscreen_tag in tags:
+            display_tags = [self._fullscreen_tag]
+        chart_data = self.trend.get_chart_data() if tags else {}
+        has_data = chart_data and any(len(times) for times, _ in chart_data.values())
+
+        tag_index = {tag: i for i, tag in enumerate(tags)}  # built once for the key and the plot loops
+        layout = self._chart_layout_key(tags, display_tags, tag_index) if tags else None
+        if has_data and layout == self._chart_layout and self.lines.keys() == set(display_tags):
+            # Same axes and styling — reload the line data instead of
+            # tearing the figure down
+            self._clear_cursor_elements()
+            for tag in display_tags:
+                self.lines[tag].set_data(*chart_data.get(tag, ([], [])))
+            self._apply_time_window(display_tags)
+            self._blit_bg = self._cursor_bg = None
+            self._request_draw()
+            self._request_scrollbar_update()
+            return
+        # Axes built without data never get the date locator/formatter, so
+        # they must not be reused once data arrives
+        self._chart_layout = layout if has_data else None
+
         self._clear_cursor_elements()
         self._disconnect_xlim_sync()
         self.fig.clear()
-        tags = self._get_ordered_tags()
-        text_color = resolve_color(TEXT_SECONDARY)
-        face_color = resolve_color(BG_INPUT)
-        grid_color = resolve_color(BORDER_COLOR)
+        self._last_zoom_key = self._last_margins_key = None  # new axes need a fresh layout pass
+        self._blit_bg = self._cursor_bg = None  # old axes' background; the deferred draw recaptures it
+        colors = self._colors
+        text_color = colors[TEXT_SECONDARY]
+        face_color = colors[BG_INPUT]
+        grid_color = colors[BORDER_COLOR]
 
         if not tags:
             self.ax = self.fig.add_subplot(111)
@@ -2306,43 +2868,36 @@ class PLCTrendTool(ctk.CTk):
             self._style_chart()
             self._style_chart_axes()
             self.lines = {}
-            self.canvas.draw()
+            self._active_lines = []
+            self.canvas.draw_idle()
             return
 
-        chart_data = self.trend.get_chart_data()
         self.lines = {}
 
-        # Fullscreen mode: show only the expanded tag as a single subplot
-        display_tags = tags
-        if self._fullscreen_tag and self._isolated_mode:
-            if self._fullscreen_tag in tags:
-                display_tags = [self._fullscreen_tag]
-            else:
-                self._fullscreen_tag = None  # tag removed, exit fullscreen
-
         if self._isolated_mode and len(display_tags) > 1:
             n = len(display_tags)
             self.axes = []
             for i, tag in enumerate(display_tags):
                 ax = self.fig.add_subplot(n, 1, i + 1)
                 self.axes.append(ax)
-                tag_idx = tags.index(tag) if tag in tags else i
-                lp = self._get_line_props(tag, tag_idx)
+                tag_idx = tag_index.get(tag, i)
+                color, width, style = self._get_line_props(tag, tag_idx)
                 times, vals = chart_data.get(tag, ([], []))
                 display_name = smart_tag_name(tag, display_tags)
                 line, = ax.plot(times, vals, label=display_name,
-                                color=lp["color"], linewidth=lp["width"],
-                                linestyle=lp["style"])
+                                color=color, linewidth=width, linestyle=style)
                 self.lines[tag] = line
                 ax.set_ylabel(display_name, fontsize=8, color=text_color)
                 if self._show_legend:
                     ax.legend(loc="upper left", fontsize=7, facecolor=face_color,
                               edgecolor=grid_color, labelcolor=text_color)
-                scale = self._tag_scales.get(tag)
-                if scale and not scale.get("auto", True):
+                ylim = self._manual_ylims.get(tag)
+                if ylim:
                     ax.autoscale(enable=False, axis='y')
-                    ax.set_ylim(scale.get("min", 0), scale.get("max", 100))
+                    ax.set_ylim(ylim)
                 if i < n - 1:
+                    # Only the bottom subplot shows time labels; nothing turns
+                    # them back on until the axes are rebuilt
                     ax.tick_params(axis="x", labelbottom=False)
                     ax.set_xlabel("")
             self.ax = self.axes[0]
@@ -2350,79 +2905,38 @@ class PLCTrendTool(ctk.CTk):
             self.ax = self.fig.add_subplot(111)
             self.axes = [self.ax]
             for i, tag in enumerate(display_tags):
-                tag_idx = tags.index(tag) if tag in tags else i
-                lp = self._get_line_props(tag, tag_idx)
+                tag_idx = tag_index.get(tag, i)
+                color, width, style = self._get_line_props(tag, tag_idx)
                 times, vals = chart_data.get(tag, ([], []))
                 display_name = smart_tag_name(tag, display_tags)
                 line, = self.ax.plot(times, vals, label=display_name,
-                                     color=lp["color"], linewidth=lp["width"],
-                                     linestyle=lp["style"])
+                                     color=color, linewidth=width, linestyle=style)
                 self.lines[tag] = line
             if self._show_legend:
                 self.ax.legend(loc="upper left", fontsize=8, facecolor=face_color,
                                edgecolor=grid_color, labelcolor=text_color)
 
             for tag in display_tags:
-                scale = self._tag_scales.get(tag)
-                if scale and not scale.get("auto", True):
+                ylim = self._manual_ylims.get(tag)
+                if ylim:
                     self.ax.autoscale(enable=False, axis='y')
-                    self.ax.set_ylim(scale.get("min", 0), scale.get("max", 100))
+                    self.ax.set_ylim(ylim)
                     break
+        self._active_lines = list(self.lines.items())
+        # Trend lines are drawn on top of a cached background (see _on_chart_draw)
+        for _, line in self._active_lines:
+            line.set_animated(True)
 
         self._style_chart()
         self._style_chart_axes()
         self._apply_chart_bg()
 
-        # Apply time window
-        has_data = chart_data and any(times for times, _ in chart_data.values())
+        self._axes_layout_dirty = True
         if has_data:
-            fmt = mdates.DateFormatter("%H:%M:%S")
-            for a in self.axes:
-                a.xaxis.set_major_formatter(fmt)
-
-            if self._follow_live and self.view_mode == "live":
-                now = datetime.now()
-                window_start = now - timedelta(seconds=self._time_span_seconds)
-                for a in self.axes:
-                    a.set_xlim(window_start, now)
-            else:
-                t_start, t_end = self.trend.get_time_range()
-                if t_start and t_end:
-                    span = (t_end - t_start).total_seconds()
-                    if span <= self._time_span_seconds:
-                        for a in self.axes:
-                            a.set_xlim(t_start, t_end)
-                    else:
-                        view_start = t_end - timedelta(seconds=self._time_span_seconds)
-                        for a in self.axes:
-                            a.set_xlim(view_start, t_end)
-
-            # Autoscale Y only for axes without manual scales
-            if self._isolated_mode and len(self.axes) > 1:
-                for i, a in enumerate(self.axes):
-                    tag = display_tags[i] if i < len(display_tags) else None
-                    scale = self._tag_scales.get(tag) if tag else None
-                    if scale and not scale.get("auto", True):
-                        pass
-                    else:
-                        a.relim()
-                        a.autoscale_view(scalex=False, scaley=True)
-            else:
-                has_manual = any(
-                    not self._tag_scales.get(t, {}).get("auto", True) for t in display_tags
-                )
-                if not has_manual:
-                    self.ax.relim()
-                    self.ax.autoscale_view(scalex=False, scaley=True)
-
             for a in self.axes:
-                for label in a.get_xticklabels():
-                    label.set_rotation(0)
-                    label.set_ha("center")
-            if self._isolated_mode and len(self.axes) > 1:
-                for a in self.axes[:-1]:
-                    a.tick_params(axis="x", labelbottom=False)
-                    a.set_xlabel("")
+                a.xaxis_date()  # limits are set as date numbers; keep date tick placement
+                a.xaxis.set_major_formatter(self._time_formatter)
+            self._apply_time_window(display_tags)
 
         if self._isolated_mode and len(display_tags) > 1:
             hspace = 0
@@ -2430,42 +2944,46 @@ class PLCTrendTool(ctk.CTk):
             hspace = 0.15
         self._apply_chart_margins(hspace=hspace)
         self._apply_chart_zoom()  # size figure to match zoom level
-        self.canvas.draw()
-        self._update_scrollbar()
-        # Connect xlim sync AFTER draw (avoids triggering during build)
+        # Render when control returns to Tk, merged with whatever the caller
+        # changes next (tag scales, legends, ...)
+        self.canvas.draw_idle()
+        self._request_scrollbar_update()
+        # Settle any pending autoscale now — the deferred draw would otherwise
+        # fire xlim_changed after the sync callbacks are connected
+        for a in self.axes:
+            a.get_xlim()
         self._connect_xlim_sync()
 
-    def _apply_tag_scales(self):
-        """Apply per-tag scale settings to current axes."""
-        tags = self._get_ordered_tags()
+    def _apply_time_window(self, display_tags):
+        """Set the time window on every axis and autoscale Y where no manual scale
+        is set (re-enabling Y autoscale a toolbar pan/zoom may have turned off)."""
+        span = self._time_span_seconds / 86400.0  # window in date-number days
+        if self._follow_live and self.view_mode == "live":
+            now = _epoch_to_datenum(time.time())
+            for a in self.axes:
+                a.set_xlim(now - span, now, emit=False)
+        else:
+            t_start, t_end = self.trend.get_time_range_num()
+            if t_start is not None:
+                view_start = max(t_start, t_end - span)
+                for a in self.axes:
+                    a.set_xlim(view_start, t_end, emit=False)
+
+        # Autoscale Y only for axes without manual scales
         if self._isolated_mode and len(self.axes) > 1:
-            for i, tag in enumerate(tags):
-                if i < len(self.axes):
-                    ax = self.axes[i]
-                    scale = self._tag_scales.get(tag)
-                    if scale and not scale.get("auto", True):
-                        ax.autoscale(enable=False, axis='y')
-                        ax.set_ylim(scale.get("min", 0), scale.get("max", 100))
-                    else:
-                        ax.autoscale(enable=True, axis='y')
-                        ax.relim()
-                        ax.autoscale_view(scaley=True, scalex=False)
+            for i, a in enumerate(self.axes):
+                tag = display_tags[i] if i < len(display_tags) else None
+                if tag not in self._manual_ylims:
+                    a.set_autoscaley_on(True)
+                    a.relim()
+                    a.autoscale_view(scalex=False, scaley=True)
         else:
-            manual_ylim = None
-            for tag in tags:
-                scale = self._tag_scales.get(tag)
-                if scale and not scale.get("auto", True):
-                    manual_ylim = (scale.get("min", 0), scale.get("max", 100))
-                    break
-            if manual_ylim:
-                self.ax.autoscale(enable=False, axis='y')
-                self.ax.set_ylim(manual_ylim)
-            else:
-                self.ax.autoscale(enable=True, axis='y')
+            manual = self._manual_ylims
+            has_manual = bool(manual) and any(t in manual for t in display_tags)
+            if not has_manual:
+                self.ax.set_autoscaley_on(True)
                 self.ax.relim()
-                self.ax.autoscale_view(scaley=True, scalex=False)
-        try: self.canvas.draw_idle()
-        except Exception: pass
+                self.ax.autoscale_view(scalex=False, scaley=True)
 
     def _show_chart_properties(self):
         """Open tabbed Trend Properties dialog (X-Axis, Y-Axis, Display)."""
@@ -2486,7 +3004,7 @@ class PLCTrendTool(ctk.CTk):
         # Notebook with tabs
         style = ttk.Style()
         style.configure("Props.TNotebook", background=resolve_color(BG_DARK))
-        style.configure("Props.TNotebook.Tab", font=(FONT_FAMILY, FONT_SIZE_BODY),
+        style.configure("Props.TNotebook.Tab", font=FONT_BODY,
                          padding=[12, 4])
         notebook = ttk.Notebook(dlg, style="Props.TNotebook")
         notebook.pack(fill="both", expand=True, padx=12, pady=(12, 4))
@@ -2500,7 +3018,7 @@ class PLCTrendTool(ctk.CTk):
         grp1.pack(fill="x", padx=12, pady=(12, 8))
 
         ctk.CTkLabel(grp1, text="Time Span (visible window)",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                     font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
         span_row = ctk.CTkFrame(grp1, fg_color="transparent")
@@ -2525,7 +3043,7 @@ class PLCTrendTool(ctk.CTk):
         span_unit_var = ctk.StringVar(value=span_unit)
         ctk.CTkOptionMenu(span_row, variable=span_unit_var,
                           values=["Second(s)", "Minute(s)", "Hour(s)"],
-                          font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                          font=FONT_SMALL,
                           fg_color=BG_INPUT, button_color=SAS_BLUE,
                           button_hover_color=SAS_BLUE_DARK,
                           dropdown_fg_color=BG_MEDIUM,
@@ -2536,18 +3054,18 @@ class PLCTrendTool(ctk.CTk):
         grp1b.pack(fill="x", padx=12, pady=(0, 8))
 
         ctk.CTkLabel(grp1b, text="Display Options",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                     font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
         x_scale_var = ctk.BooleanVar(value=self._show_x_scale)
         ctk.CTkCheckBox(grp1b, text="Display scale", variable=x_scale_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=2)
 
         x_grid_var = ctk.BooleanVar(value=self._show_x_grid)
         ctk.CTkCheckBox(grp1b, text="Display grid lines", variable=x_grid_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=(2, 10))
 
@@ -2560,32 +3078,33 @@ class PLCTrendTool(ctk.CTk):
         grp2.pack(fill="x", padx=12, pady=(12, 8))
 
         ctk.CTkLabel(grp2, text="Scale Options",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                     font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
         scale_mode_var = ctk.StringVar(value=self._scale_mode)
         for val, txt in [("same", "All pens on same scale"),
                          ("independent", "Each pen on independent scale")]:
             ctk.CTkRadioButton(grp2, text=txt, variable=scale_mode_var, value=val,
-                               font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                               font=FONT_SMALL, text_color=TEXT_SECONDARY,
                                fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                                border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=2)
 
         iso_var = ctk.BooleanVar(value=self._isolated_mode)
         ctk.CTkCheckBox(grp2, text="Isolated graphing (each pen on its own chart)",
                         variable=iso_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=(6, 10))
 
         # Per-tag scale cards
         tags = self._get_ordered_tags()
+        tag_widgets = {}  # filled as the cards are built; apply only touches built cards
         if tags:
             grp3 = ctk.CTkFrame(y_tab, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
             grp3.pack(fill="x", padx=12, pady=(0, 8))
 
             ctk.CTkLabel(grp3, text="Per-Tag Scale Configuration",
-                         font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                         font=FONT_BODY_BOLD,
                          text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
             tag_scroll = ctk.CTkScrollableFrame(grp3, fg_color="transparent",
@@ -2593,10 +3112,8 @@ class PLCTrendTool(ctk.CTk):
                                                   height=180)
             tag_scroll.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
-            tag_widgets = {}
-            for i, tag in enumerate(tags):
-                lp = self._get_line_props(tag, i)
-                color = lp["color"]
+            def build_tag_card(i, tag):
+                color = self._get_line_props(tag, i)[0]
                 scale = self._tag_scales.get(tag, {"auto": True, "min": 0, "max": 100})
 
                 card = ctk.CTkFrame(tag_scroll, fg_color=BG_MEDIUM, corner_radius=6)
@@ -2611,12 +3128,12 @@ class PLCTrendTool(ctk.CTk):
                 swatch.create_rectangle(1, 1, 11, 11, fill=color, outline=color)
 
                 display_name = smart_tag_name(tag, tags)
-                ctk.CTkLabel(row1, text=display_name, font=(FONT_FAMILY, FONT_SIZE_SMALL, "bold"),
+                ctk.CTkLabel(row1, text=display_name, font=FONT_SMALL_BOLD,
                              text_color=TEXT_PRIMARY).pack(side="left")
 
                 auto_var = ctk.BooleanVar(value=scale.get("auto", True))
                 ctk.CTkCheckBox(row1, text="Auto", variable=auto_var,
-                               font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                               font=FONT_SMALL, text_color=TEXT_SECONDARY,
                                fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                                border_color=BORDER_COLOR, width=18, height=18,
                                checkbox_width=16, checkbox_height=16).pack(side="right")
@@ -2624,14 +3141,14 @@ class PLCTrendTool(ctk.CTk):
                 row2 = ctk.CTkFrame(card, fg_color="transparent")
                 row2.pack(fill="x", padx=8, pady=(0, 6))
 
-                ctk.CTkLabel(row2, text="Min:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                ctk.CTkLabel(row2, text="Min:", font=FONT_SMALL,
                              text_color=TEXT_SECONDARY).pack(side="left")
                 min_e = ctk.CTkEntry(row2, width=70, height=24, font=(FONT_FAMILY_MONO, FONT_SIZE_SMALL),
                                      fg_color=BG_INPUT, border_color=BORDER_COLOR, text_color=TEXT_PRIMARY)
                 min_e.pack(side="left", padx=(4, 10))
                 min_e.insert(0, str(scale.get("min", 0)))
 
-                ctk.CTkLabel(row2, text="Max:", font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                ctk.CTkLabel(row2, text="Max:", font=FONT_SMALL,
                              text_color=TEXT_SECONDARY).pack(side="left")
                 max_e = ctk.CTkEntry(row2, width=70, height=24, font=(FONT_FAMILY_MONO, FONT_SIZE_SMALL),
                                      fg_color=BG_INPUT, border_color=BORDER_COLOR, text_color=TEXT_PRIMARY)
@@ -2639,8 +3156,26 @@ class PLCTrendTool(ctk.CTk):
                 max_e.insert(0, str(scale.get("max", 100)))
 
                 tag_widgets[tag] = {"auto": auto_var, "min": min_e, "max": max_e}
-        else:
-            tag_widgets = {}
+
+            def build_tag_cards(start=0):
+                # A batch per event-loop pass, so the tab paints before all cards exist
+                try:
+                    if not tag_scroll.winfo_exists():
+                        return
+                except Exception:
+                    return
+                stop = min(start + 20, len(tags))
+                for i in range(start, stop):
+                    build_tag_card(i, tags[i])
+                if stop < len(tags):
+                    dlg.after(1, build_tag_cards, stop)
+
+            # Cards are only built once the Y-Axis tab is first shown
+            def on_tab_changed(event=None):
+                if not tag_widgets and notebook.select() == str(y_tab):
+                    build_tag_cards()
+
+            notebook.bind("<<NotebookTabChanged>>", on_tab_changed, add="+")
 
         # ===== DISPLAY TAB =====
         d_tab = ctk.CTkFrame(notebook, fg_color=BG_MEDIUM)
@@ -2650,12 +3185,12 @@ class PLCTrendTool(ctk.CTk):
         grp4.pack(fill="x", padx=12, pady=(12, 8))
 
         ctk.CTkLabel(grp4, text="Legend",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                     font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
         legend_var = ctk.BooleanVar(value=self._show_legend)
         ctk.CTkCheckBox(grp4, text="Display line legend", variable=legend_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=(2, 10))
 
@@ -2663,19 +3198,19 @@ class PLCTrendTool(ctk.CTk):
         grp5.pack(fill="x", padx=12, pady=(0, 8))
 
         ctk.CTkLabel(grp5, text="Scrolling",
-                     font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                     font=FONT_BODY_BOLD,
                      text_color=TEXT_PRIMARY).pack(anchor="w", padx=12, pady=(10, 4))
 
         scroll_var = ctk.BooleanVar(value=self._allow_scrolling)
         ctk.CTkCheckBox(grp5, text="Allow scrolling", variable=scroll_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=(2, 4))
 
         cursor_var = ctk.BooleanVar(value=self._cursor_enabled)
         ctk.CTkCheckBox(grp5, text="Smart cursor (crosshair + value readout)",
                         variable=cursor_var,
-                        font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_SECONDARY,
+                        font=FONT_SMALL, text_color=TEXT_SECONDARY,
                         fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                         border_color=BORDER_COLOR).pack(anchor="w", padx=12, pady=(2, 10))
 
@@ -2714,6 +3249,8 @@ class PLCTrendTool(ctk.CTk):
                 except (ValueError, TypeError): mx = 100
                 if mn >= mx: mx = mn + 1
                 self._tag_scales[tag] = {"auto": auto, "min": mn, "max": mx}
+            self._manual_ylims = {t: (sc["min"], sc["max"]) for t, sc in self._tag_scales.items()
+                                  if not sc.get("auto", True)}
 
             # Display
             self._cursor_enabled = cursor_var.get()
@@ -2738,20 +3275,20 @@ class PLCTrendTool(ctk.CTk):
             dlg.destroy()
 
         ctk.CTkButton(btn_row, text="Apply & Close",
-                      font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"),
+                      font=FONT_BODY_BOLD,
                       fg_color=SAS_BLUE, hover_color=SAS_BLUE_DARK,
                       corner_radius=BUTTON_CORNER_RADIUS, height=BUTTON_HEIGHT,
                       command=apply_and_close).pack(side="right", padx=(8, 0))
         ctk.CTkButton(btn_row, text="Cancel",
-                      font=(FONT_FAMILY, FONT_SIZE_BODY),
+                      font=FONT_BODY,
                       fg_color="transparent", border_width=1, border_color=BORDER_COLOR,
                       text_color=TEXT_SECONDARY, hover_color=BG_CARD_HOVER,
                       corner_radius=BUTTON_CORNER_RADIUS, height=BUTTON_HEIGHT,
                       command=dlg.destroy).pack(side="right")
 
     # == SMART CURSOR ==
-    def _clear_cursor_elements(self):
-        """Remove all existing cursor overlay artists from the chart."""
+    def _clear_cursor_marks(self):
+        """Remove the cursor's value dots and readout."""
         for artist in self._cursor_annotations:
             try: artist.remove()
             except (ValueError, AttributeError): pass
@@ -2760,6 +3297,17 @@ class PLCTrendTool(ctk.CTk):
             try: artist.remove()
             except (ValueError, AttributeError): pass
         self._cursor_dots = []
+        self._cursor_dot_map = {}
+
+    def _hide_cursor_elements(self):
+        """Hide the cursor artists but keep them for the next mouse move."""
+        for artist in (getattr(self, "_cursor_vlines", []) + getattr(self, "_cursor_dots", [])
+                       + self._cursor_annotations):
+            artist.set_visible(False)
+
+    def _clear_cursor_elements(self):
+        """Remove all existing cursor overlay artists from the chart."""
+        self._clear_cursor_marks()
         if self._cursor_vline is not None:
             try: self._cursor_vline.remove()
             except (ValueError, AttributeError): pass
@@ -2771,9 +3319,29 @@ class PLCTrendTool(ctk.CTk):
         self._cursor_vlines = []
 
     def _on_chart_mouse_move(self, event):
-        """Smart cursor: vertical line + value readout at mouse position."""
+        """Throttle motion events: the first move after a pause updates the
+        cursor at once, later ones keep only the latest event and update at
+        most once per CURSOR_THROTTLE_MS, however fast the mouse reports motion."""
         if not self._cursor_enabled:
             return
+        self._cursor_pending_event = event
+        if self._cursor_timer is not None:
+            return
+        wait_ms = int(CURSOR_THROTTLE_MS - (time.perf_counter() - self._cursor_last_ts) * 1000)
+        if wait_ms <= 0:
+            self._process_cursor_event()
+        else:
+            self._cursor_timer = self.after(wait_ms, self._process_cursor_event)
+
+    def _process_cursor_event(self):
+        self._cursor_timer = None
+        self._cursor_last_ts = time.perf_counter()
+        event, self._cursor_pending_event = self._cursor_pending_event, None
+        if event is not None and self._cursor_enabled:
+            self._update_smart_cursor(event)
+
+    def _update_smart_cursor(self, event):
+        """Smart cursor: vertical line + value readout at mouse position."""
         # Check if mouse is in any of our axes
         active_ax = None
         for a in self.axes:
@@ -2788,81 +3356,74 @@ class PLCTrendTool(ctk.CTk):
         # Save current axis limits BEFORE any cursor drawing
         saved_limits = [(a.get_xlim(), a.get_ylim()) for a in self.axes]
 
-        self._clear_cursor_elements()
-
-        # Draw vertical cursor line on ALL axes (so the crosshair spans the full chart)
-        cursor_color = resolve_color(TEXT_MUTED)
-        self._cursor_vlines = []
-        for a in self.axes:
-            vl = a.axvline(x=event.xdata, color=cursor_color,
-                           linewidth=0.8, linestyle="--", alpha=0.7)
-            self._cursor_vlines.append(vl)
-        self._cursor_vline = self._cursor_vlines[0] if self._cursor_vlines else None
+        # Cursor artists (vlines, value dots, readout) are created once and then
+        # moved, re-labelled and shown/hidden; all are animated, so they're
+        # blitted over the cached background instead of forcing a full redraw.
+        self._hide_cursor_elements()
+
+        # Vertical cursor line on ALL axes (so the crosshair spans the full chart)
+        vlines = getattr(self, "_cursor_vlines", [])
+        if len(vlines) == len(self.axes) and all(vl.axes is a for vl, a in zip(vlines, self.axes)):
+            for vl in vlines:
+                vl.set_xdata([event.xdata, event.xdata])
+                vl.set_visible(True)
+        else:
+            self._clear_cursor_elements()
+            cursor_color = self._colors[TEXT_MUTED]
+            self._cursor_vlines = [a.axvline(x=event.xdata, color=cursor_color, linewidth=0.8,
+                                             linestyle="--", alpha=0.7, animated=True)
+                                   for a in self.axes]
+            self._cursor_vline = self._cursor_vlines[0] if self._cursor_vlines else None
 
         # Get chart data
         chart_data = self.trend.get_chart_data()
         if not chart_data:
-            try: self.canvas.draw_idle()
-            except Exception: pass
-            return
-
-        try:
-            mouse_dt = mdates.num2date(event.xdata)
-        except Exception:
-            try: self.canvas.draw_idle()
-            except Exception: pass
+            self._blit_cursor()
             return
 
         # Find nearest index from first tag's time array
         first_tag = next(iter(chart_data), None)
         if not first_tag:
-            try: self.canvas.draw_idle()
-            except Exception: pass
+            self._blit_cursor()
             return
-        times, _ = chart_data[first_tag]
-        if not times:
-            try: self.canvas.draw_idle()
-            except Exception: pass
+        time_nums, _ = chart_data[first_tag]  # already matplotlib date numbers
+        if not len(time_nums):
+            self._blit_cursor()
             return
 
-        try:
-            time_nums = mdates.date2num(times)
-        except Exception:
-            try: self.canvas.draw_idle()
-            except Exception: pass
-            return
-        mouse_num = event.xdata
-        idx = bisect_left(time_nums, mouse_num)
-        if idx >= len(time_nums):
-            idx = len(time_nums) - 1
-        elif idx > 0:
-            if abs(time_nums[idx] - mouse_num) > abs(time_nums[idx - 1] - mouse_num):
-                idx = idx - 1
-
-        nearest_time = times[idx]
+        idx = _nearest_index(time_nums, event.xdata)
+
+        nearest_time = mdates.num2date(time_nums[idx]).replace(tzinfo=None)
         ts_str = nearest_time.strftime("%H:%M:%S.%f")[:-3]
 
-        self._cursor_dots = []
+        dot_map = self._cursor_dot_map
         # Single tooltip with all tag values
         text_lines = [f"\u23F1 {ts_str}"]
-        ordered_tags = self._get_ordered_tags()
+        display_index = {tag: i for i, tag in enumerate(self._get_ordered_tags())}
         tags_list = list(chart_data.keys())
         for i, (tag, (t_arr, v_arr)) in enumerate(chart_data.items()):
             if idx < len(v_arr):
-                val = v_arr[idx]
+                val = _sample_value(float(v_arr[idx]))
                 # Find this tag's display index for color and axis mapping
-                disp_idx = ordered_tags.index(tag) if tag in ordered_tags else i
-                lp = self._get_line_props(tag, disp_idx)
-                color = lp["color"]
+                disp_idx = display_index.get(tag, i)
+                color = self._get_line_props(tag, disp_idx)[0]
                 display_name = smart_tag_name(tag, tags_list)
                 if val is not None and val == val:  # val==val is False for NaN
                     val_str = f"{val:.4f}" if isinstance(val, float) else str(val)
                     # In isolated mode, draw dot on the tag's own axis
                     dot_ax = self.axes[disp_idx] if self._isolated_mode and disp_idx < len(self.axes) else self.ax
-                    dot = dot_ax.plot(t_arr[idx], val, "o", color=color,
-                                      markersize=6, markeredgecolor="white",
-                                      markeredgewidth=1.0, zorder=10)
-                    self._cursor_dots.extend(dot)
+                    dot = dot_map.get(tag)
+                    if dot is not None and dot.axes is dot_ax:
+                        dot.set_data([t_arr[idx]], [val])
+                        dot.set_color(color)
+                        dot.set_visible(True)
+                    else:
+                        if dot is not None:
+                            try: dot.remove()
+                            except (ValueError, AttributeError): pass
+                        dot_map[tag], = dot_ax.plot(t_arr[idx], val, "o", color=color,
+                                                    markersize=6, markeredgecolor="white",
+                                                    markeredgewidth=1.0, zorder=10, animated=True)
                     text_lines.append(f"\u25CF {display_name}: {val_str}")
                 else:
                     text_lines.append(f"\u25CB {display_name}: ---")
@@ -2874,36 +3435,50 @@ class PLCTrendTool(ctk.CTk):
         if x_range > 0 and (event.xdata - xlim[0]) / x_range > 0.65:
             ha = "right"; x_offset = -12
 
-        ann = active_ax.annotate(
-            readout_text,
-            xy=(event.xdata, event.ydata),
-            xytext=(x_offset, 12), textcoords="offset points",
-            fontsize=9, fontfamily=FONT_FAMILY_MONO,
-            color=resolve_color(TEXT_PRIMARY), ha=ha, va="bottom",
-            bbox=dict(boxstyle="round,pad=0.5", facecolor=resolve_color(BG_CARD),
-                      edgecolor=resolve_color(BORDER_COLOR), alpha=0.92),
-            zorder=20)
-        self._cursor_annotations.append(ann)
-
-        # Restore axis limits — prevents cursor from causing zoom drift
+        self._cursor_dots = list(dot_map.values())
+
+        ann = self._cursor_annotations[0] if self._cursor_annotations else None
+        if ann is not None and ann.axes is active_ax:
+            ann.set_text(readout_text)
+            ann.xy = (event.xdata, event.ydata)
+            ann.set_position((x_offset, 12))
+            ann.set_ha(ha)
+            ann.set_visible(True)
+        else:
+            if ann is not None:
+                try: ann.remove()
+                except (ValueError, AttributeError): pass
+            ann = active_ax.annotate(
+                readout_text,
+                xy=(event.xdata, event.ydata),
+                xytext=(x_offset, 12), textcoords="offset points",
+                fontsize=9, fontfamily=FONT_FAMILY_MONO,
+                color=self._colors[TEXT_PRIMARY], ha=ha, va="bottom",
+                bbox=dict(boxstyle="round,pad=0.5", facecolor=self._colors[BG_CARD],
+                          edgecolor=self._colors[BORDER_COLOR], alpha=0.92),
+                zorder=20, animated=True)
+            self._cursor_annotations = [ann]
+
+        # Restore axis limits — newly plotted cursor artists can trigger an
+        # autoscale; restoring keeps the view (and the cached chart) valid
         for a, (xl, yl) in zip(self.axes, saved_limits):
-            a.set_xlim(xl)
-            a.set_ylim(yl)
+            if a.get_xlim() != xl:
+                a.set_xlim(xl, emit=False)
+            if a.get_ylim() != yl:
+                a.set_ylim(yl, emit=False)
 
-        try: self.canvas.draw_idle()
-        except Exception: pass
+        self._blit_cursor()
 
     def _on_chart_mouse_leave(self, event):
         """Remove cursor elements when mouse leaves the chart area."""
-        # Save axis limits before removing artists to prevent auto-rescale
-        saved_limits = [(a.get_xlim(), a.get_ylim()) for a in self.axes]
-        self._clear_cursor_elements()
-        # Restore limits so chart doesn't jump
-        for a, (xl, yl) in zip(self.axes, saved_limits):
-            a.set_xlim(xl)
-            a.set_ylim(yl)
-        try: self.canvas.draw_idle()
-        except Exception: pass
+        # Drop a pending update so the cursor doesn't reappear after leaving
+        self._cursor_pending_event = None
+        if self._cursor_timer is not None:
+            self.after_cancel(self._cursor_timer)
+            self._cursor_timer = None
+        # Hide (not remove) the cursor artists, then blit the clean chart back
+        self._hide_cursor_elements()
+        self._blit_cursor()
 
     def _on_chart_click_inspect(self, event):
         """On left-click when stopped or paused, update the data table to show values at clicked time."""
@@ -2929,23 +3504,13 @@ class PLCTrendTool(ctk.CTk):
         first_tag = next(iter(chart_data), None)
         if not first_tag:
             return
-        times, _ = chart_data[first_tag]
-        if not times:
+        time_nums, _ = chart_data[first_tag]  # already matplotlib date numbers
+        if not len(time_nums):
             return
-        try:
-            time_nums = mdates.date2num(times)
-        except Exception:
-            return
-        mouse_num = event.xdata
-        idx = bisect_left(time_nums, mouse_num)
-        if idx >= len(time_nums):
-            idx = len(time_nums) - 1
-        elif idx > 0:
-            if abs(time_nums[idx] - mouse_num) > abs(time_nums[idx - 1] - mouse_num):
-                idx -= 1
+        idx = _nearest_index(time_nums, event.xdata)
 
         # Store inspect state and update table
-        self._inspect_time = times[idx]
+        self._inspect_time = mdates.num2date(time_nums[idx]).replace(tzinfo=None)
         self._inspect_idx = idx
         self._update_live_table()
 
@@ -2991,8 +3556,7 @@ class PLCTrendTool(ctk.CTk):
         if self.chart_toolbar.mode:
             return  # don't interfere with toolbar pan/zoom
         # Check if click is in a time label area (between subplots or below bottom)
-        fig_h = self.fig.get_figheight() * self.fig.dpi
-        fig_w = self.fig.get_figwidth() * self.fig.dpi
+        fig_w, fig_h = self.fig.bbox.width, self.fig.bbox.height  # pixels, cached by matplotlib
         if fig_h <= 0 or fig_w <= 0:
             return
         ref_ax = self.axes[0]
@@ -3028,12 +3592,9 @@ class PLCTrendTool(ctk.CTk):
         orig = self._xaxis_drag["xlim"]
         new_xlim = (orig[0] + dx, orig[1] + dx)
         for a in self.axes:
-            a.set_xlim(new_xlim)
+            a.set_xlim(new_xlim, emit=False)
         self._follow_live = False
-        try:
-            self.canvas.draw_idle()
-        except Exception:
-            pass
+        self._request_draw()
 
     def _on_xaxis_release(self, event):
         """End x-axis drag panning."""
@@ -3046,30 +3607,6 @@ class PLCTrendTool(ctk.CTk):
         self.canvas.get_tk_widget().config(cursor="")
         self._update_scrollbar()
 
-    def _update_storage_info(self):
-        """Update the storage info label with current usage."""
-        current_pts = self.trend.point_count
-        max_pts = self.trend.max_points
-        n_tags = len(self.trend.tags) if self.trend.tags else 0
-        if current_pts > 0 and n_tags > 0:
-            # Rough estimate: ~100 bytes per tag per point + overhead
-            est_bytes = current_pts * (100 * n_tags + 80)
-            if est_bytes > 1024 * 1024:
-                est_str = f"{est_bytes / (1024*1024):.1f} MB"
-            else:
-                est_str = f"{est_bytes / 1024:.0f} KB"
-            if max_pts > 0:
-                pct = (current_pts / max_pts) * 100
-                self._storage_info_label.configure(
-                    text=f"Current: {current_pts:,} / {max_pts:,} points ({pct:.0f}%)  •  Est. memory: {est_str}  •  {n_tags} tags")
-            else:
-                self._storage_info_label.configure(
-                    text=f"Current: {current_pts:,} points (unlimited)  •  Est. memory: {est_str}  •  {n_tags} tags")
-        else:
-            limit_str = f"{max_pts:,} points" if max_pts > 0 else "unlimited"
-            self._storage_info_label.configure(
-                text=f"Current: {current_pts:,} points  •  Limit: {limit_str}  •  No active trend data")
-
     # == CONNECTION LOGIC ==
     def _on_controller_type_changed(self, value):
         """Update UI hints when controller type dropdown changes."""
@@ -3140,16 +3677,19 @@ class PLCTrendTool(ctk.CTk):
         self._struct_items = {}
         self.tag_data_types.clear()
         self._tag_scales.clear()
+        self._manual_ylims.clear()
         self._line_props.clear()
+        self._line_props_cache.clear()
         self._chart_bg.clear()
         self._tag_order.clear()
+        self._ordered_tags_cache = None
         self._fullscreen_tag = None
         self._inspect_time = None
         self._clear_cursor_elements()
         self.export_json_btn.configure(state="disabled")
         self.export_csv_btn.configure(state="disabled")
         self.clear_data_btn.configure(state="disabled")
-        self.point_label.configure(text="")
+        self._configure_if_changed(self.point_label, text="")
         self.view_badge_label.configure(text="", fg=resolve_color(TEXT_MUTED))
         self._tag_toggle_btn.configure(text="\U0001F3F7 Tags")
         self._update_selected_count()
@@ -3158,8 +3698,9 @@ class PLCTrendTool(ctk.CTk):
 
     # == TAG BROWSER LOGIC ==
     def _set_tag_placeholder(self, text):
-        for item in self.tag_tree.get_children():
-            self.tag_tree.delete(item)
+        self.tag_tree.delete(*self.tag_tree.get_children())
+        self._iid_to_tag = {}
+        self._more_rows = {}
         self.tag_tree.insert("", "end", text=text, values=("",))
         self.tag_count_label.configure(text="")
 
@@ -3183,8 +3724,9 @@ class PLCTrendTool(ctk.CTk):
         threading.Thread(target=do_fetch, daemon=True).start()
 
     def _on_tags_fetched(self, ctrl_tags, prog_tags, udt_defs, error):
-        for item in self.tag_tree.get_children():
-            self.tag_tree.delete(item)
+        self.tag_tree.delete(*self.tag_tree.get_children())
+        self._iid_to_tag = {}
+        self._more_rows = {}
         if error:
             self.tag_tree.insert("", "end", text=f"Error: {error}", values=("",))
             return
@@ -3194,44 +3736,67 @@ class PLCTrendTool(ctk.CTk):
         self.tag_data_types = {}
         self._struct_items = {}  # map tree item id -> (full_tag_path, dataTypeValue, array_size)
         total = 0
-        muted = resolve_color(TEXT_MUTED)
-        primary = resolve_color(TEXT_PRIMARY)
-        struct_fg = resolve_color(("#5080B0", "#7AB0D8"))
         is_slc = self.plc.controller_type in SLC_CONTROLLER_TYPES
+        insert = self.tag_tree.insert
+        data_types = self.tag_data_types
 
-        if is_slc:
-            # SLC / MicroLogix / PLC-5 — show scanned data files
-            file_count = len(ctrl_tags)
-            gid = self.tag_tree.insert("", "end", text=f"Data Files ({file_count} found)", values=("",), open=True, tags=("group",))
-            for tag in ctrl_tags:
-                self._insert_tag_item(gid, tag, tag["name"])
-                total += 1
-        else:
-            # Logix controllers — standard tag list
-            if ctrl_tags:
-                gid = self.tag_tree.insert("", "end", text=f"Controller Tags ({len(ctrl_tags)})", values=("",), open=True, tags=("group",))
-                for tag in ctrl_tags:
-                    self.tag_data_types[tag["name"]] = tag["dataType"]
-                    self._insert_tag_item(gid, tag, tag["name"])
-                    total += 1
-            for prog_name in sorted(prog_tags.keys()):
-                tags = prog_tags[prog_name]
-                gid = self.tag_tree.insert("", "end", text=f"{prog_name} ({len(tags)})", values=("",), open=False, tags=("group",))
-                for tag in tags:
-                    self.tag_data_types[tag["name"]] = tag["dataType"]
-                    dn = tag["name"].split(".")[-1] if "." in tag["name"] else tag["name"]
-                    self._insert_tag_item(gid, tag, tag["name"], display_name=dn)
-                    total += 1
-        self.tag_tree.tag_configure("group", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"))
-        self.tag_tree.tag_configure("disabled", foreground=muted)
-        self.tag_tree.tag_configure("trendable", foreground=primary)
-        self.tag_tree.tag_configure("struct", foreground=struct_fg)
+        # Detach the tree while rebuilding so Tk doesn't re-layout per insert
+        self.tag_tree.grid_remove()
+        try:
+            if is_slc:
+                # SLC / MicroLogix / PLC-5 — show scanned data files
+                file_count = len(ctrl_tags)
+                gid = insert("", "end", text=f"Data Files ({file_count} found)", values=("",), open=True, tags=("group",))
+                self._insert_tag_page(gid, ctrl_tags)
+                total = file_count
+            else:
+                # Logix controllers — standard tag list
+                if ctrl_tags:
+                    gid = insert("", "end", text=f"Controller Tags ({len(ctrl_tags)})", values=("",), open=True, tags=("group",))
+                    for tag in ctrl_tags:
+                        data_types[tag["name"]] = tag["dataType"]
+                    self._insert_tag_page(gid, ctrl_tags)
+                    total += len(ctrl_tags)
+                for prog_name in sorted(prog_tags.keys()):
+                    tags = prog_tags[prog_name]
+                    for tag in tags:
+                        data_types[tag["name"]] = tag["dataType"]
+                    self._insert_program_group(prog_name, tags)
+                    total += len(tags)
+        finally:
+            self.tag_tree.grid()
         label = f"{total} data files" if is_slc else f"{total} tags"
         self.tag_count_label.configure(text=label)
         self._update_selected_count()
-        # Bind tree expand/collapse for lazy population
-        self.tag_tree.bind("<<TreeviewOpen>>", self._on_tree_expand)
-        self.tag_tree.bind("<<TreeviewClose>>", self._on_tree_collapse)
+
+    def _insert_program_group(self, prog_name, tags, open_=False):
+        """Insert a program group row. Collapsed groups get a dummy child and
+        their tags are only inserted on first expand (see _on_tree_expand)."""
+        gid = self.tag_tree.insert("", "end", text=f"{prog_name} ({len(tags)})", values=("",), open=open_, tags=("group",))
+        if open_:
+            self._populate_program_tags(gid, tags)
+        else:
+            self._struct_items[gid] = {"_program_tags": tags, "populated": False}
+            self.tag_tree.insert(gid, "end", text="Loading...", values=("",), tags=("_dummy",))
+        return gid
+
+    def _populate_program_tags(self, gid, tags):
+        self._insert_tag_page(gid, tags, short_names=True)
+
+    def _insert_tag_page(self, parent, tags, start=0, short_names=False):
+        """Insert up to TAG_TREE_PAGE tags under parent, then a "Show more" row
+        for the rest, so huge tag lists don't create thousands of tree items
+        nobody scrolls to. short_names shows the part after the last '.'."""
+        end = min(start + TAG_TREE_PAGE, len(tags))
+        insert_tag = self._insert_tag_item
+        for tag in tags[start:end]:
+            name = tag["name"]
+            insert_tag(parent, tag, name, display_name=name.rsplit(".", 1)[-1] if short_names else None)
+        remaining = len(tags) - end
+        if remaining > 0:
+            more = self.tag_tree.insert(parent, "end", values=("",), tags=("more",),
+                                        text=f"\u2026 Show {min(remaining, TAG_TREE_PAGE)} more ({remaining} remaining)")
+            self._more_rows[more] = (parent, tags, end, short_names)
 
     def _insert_tag_item(self, parent, tag, full_path, display_name=None):
         """Insert a tag into the tree. Struct tags get a dummy child for the expand arrow."""
@@ -3298,8 +3863,10 @@ class PLCTrendTool(ctk.CTk):
             else:
                 prefix = "\u2611 " if full_path in self.selected_tags else "\u2610 "
                 tt = "trendable" if is_trendable else "disabled"
-                self.tag_tree.insert(parent, "end", text=prefix + name,
-                                     values=(tag["dataType"],), tags=(tt, full_path))
+                iid = self.tag_tree.insert(parent, "end", text=prefix + name,
+                                           values=(tag["dataType"],), tags=(tt, full_path))
+                if is_trendable:
+                    self._iid_to_tag[iid] = full_path
 
     def _on_tree_expand(self, event):
         """Lazy-load children when a struct/SLC node is expanded."""
@@ -3319,10 +3886,11 @@ class PLCTrendTool(ctk.CTk):
             if "_dummy" in self.tag_tree.item(child, "tags"):
                 self.tag_tree.delete(child)
 
-        primary = resolve_color(TEXT_PRIMARY)
-
+        # === Program tag group (deferred from _on_tags_fetched / _filter_tags) ===
+        if "_program_tags" in info:
+            self._populate_program_tags(item, info["_program_tags"])
         # === SLC Data File expansion ===
-        if info.get("_slc_file"):
+        elif info.get("_slc_file"):
             self._populate_slc_file(item, info)
         # === SLC element with sub-addresses (Timer, Counter, Control, Binary) ===
         elif info.get("_slc_element"):
@@ -3336,7 +3904,6 @@ class PLCTrendTool(ctk.CTk):
             dt = info.get("dataType", "UNKNOWN")
             bit_count = BIT_ADDRESSABLE_TYPES.get(dt, 0)
             max_show = min(info["array"], 100)
-            struct_fg = resolve_color(("#5080B0", "#7AB0D8"))
             for i in range(max_show):
                 el_path = f"{info['path']}[{i}]"
                 if bit_count > 0:
@@ -3356,15 +3923,14 @@ class PLCTrendTool(ctk.CTk):
                 else:
                     # BOOL, REAL, LREAL — directly trendable, no bit expansion
                     prefix = "\u2611 " if el_path in self.selected_tags else "\u2610 "
-                    self.tag_tree.insert(item, "end", text=f"{prefix}[{i}]",
-                                         values=(dt,),
-                                         tags=("trendable", el_path))
+                    iid = self.tag_tree.insert(item, "end", text=f"{prefix}[{i}]",
+                                               values=(dt,),
+                                               tags=("trendable", el_path))
+                    self._iid_to_tag[iid] = el_path
                     self.tag_data_types[el_path] = dt
             if info["array"] > 100:
                 self.tag_tree.insert(item, "end", text=f"... ({info['array'] - 100} more)",
                                      values=("",), tags=("disabled",))
-            self.tag_tree.tag_configure("trendable", foreground=primary)
-            self.tag_tree.tag_configure("struct", foreground=struct_fg)
         elif info["array"]:
             # Array of structs — create indexed children
             max_show = min(info["array"], 100)
@@ -3404,8 +3970,6 @@ class PLCTrendTool(ctk.CTk):
         ft = info["_file_type"]
         fn = info["_file_num"]
         sz = info["_file_size"]
-        primary = resolve_color(TEXT_PRIMARY)
-        struct_fg = resolve_color(("#5080B0", "#7AB0D8"))
         max_show = min(sz, 200)
 
         for i in range(max_show):
@@ -3414,8 +3978,9 @@ class PLCTrendTool(ctk.CTk):
                 # Directly trendable only — Float, Long Integer
                 dt_name = "REAL" if ft == "F" else "LINT"
                 prefix = "\u2611 " if addr in self.selected_tags else "\u2610 "
-                self.tag_tree.insert(parent_item, "end", text=f"{prefix}{addr}",
-                                     values=(dt_name,), tags=("trendable", addr))
+                iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{addr}",
+                                           values=(dt_name,), tags=("trendable", addr))
+                self._iid_to_tag[iid] = addr
                 self.tag_data_types[addr] = dt_name
             elif ft in SLC_INTEGER_WORD_TYPES:
                 # Integer word — expandable to whole word + individual bits
@@ -3476,14 +4041,11 @@ class PLCTrendTool(ctk.CTk):
         if sz > 200:
             self.tag_tree.insert(parent_item, "end", text=f"... ({sz - 200} more elements)",
                                  values=("",), tags=("disabled",))
-        self.tag_tree.tag_configure("trendable", foreground=primary)
-        self.tag_tree.tag_configure("struct", foreground=struct_fg)
 
     def _populate_slc_element(self, parent_item, info):
         """Populate sub-elements for SLC Timer, Counter, Control, Binary, or Integer word."""
         addr = info["path"]
         etype = info["_element_type"]
-        primary = resolve_color(TEXT_PRIMARY)
 
         if etype == "T":
             subs = SLC_TIMER_SUBS
@@ -3496,26 +4058,27 @@ class PLCTrendTool(ctk.CTk):
             for bit in range(16):
                 bit_addr = f"{addr}/{bit}"
                 prefix = "\u2611 " if bit_addr in self.selected_tags else "\u2610 "
-                self.tag_tree.insert(parent_item, "end", text=f"{prefix}{bit_addr}",
-                                     values=("BOOL",), tags=("trendable", bit_addr))
+                iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{bit_addr}",
+                                           values=("BOOL",), tags=("trendable", bit_addr))
+                self._iid_to_tag[iid] = bit_addr
                 self.tag_data_types[bit_addr] = "BOOL"
-            self.tag_tree.tag_configure("trendable", foreground=primary)
             return
         elif etype == "INT_WORD":
             # Integer word — whole word as decimal + individual bits
             # First: trendable whole word
             prefix = "\u2611 " if addr in self.selected_tags else "\u2610 "
-            self.tag_tree.insert(parent_item, "end", text=f"{prefix}{addr}  (word)",
-                                 values=("INT",), tags=("trendable", addr))
+            iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{addr}  (word)",
+                                       values=("INT",), tags=("trendable", addr))
+            self._iid_to_tag[iid] = addr
             self.tag_data_types[addr] = "INT"
             # Then: 16 individual bits
             for bit in range(16):
                 bit_addr = f"{addr}/{bit}"
                 prefix = "\u2611 " if bit_addr in self.selected_tags else "\u2610 "
-                self.tag_tree.insert(parent_item, "end", text=f"{prefix}{bit_addr}",
-                                     values=("BOOL",), tags=("trendable", bit_addr))
+                iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{bit_addr}",
+                                           values=("BOOL",), tags=("trendable", bit_addr))
+                self._iid_to_tag[iid] = bit_addr
                 self.tag_data_types[bit_addr] = "BOOL"
-            self.tag_tree.tag_configure("trendable", foreground=primary)
             return
         else:
             return
@@ -3525,14 +4088,14 @@ class PLCTrendTool(ctk.CTk):
             sub_addr = f"{addr}{suffix}"
             if trendable:
                 prefix = "\u2611 " if sub_addr in self.selected_tags else "\u2610 "
-                self.tag_tree.insert(parent_item, "end", text=f"{prefix}{sub_addr}",
-                                     values=(dt,), tags=("trendable", sub_addr))
+                iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{sub_addr}",
+                                           values=(dt,), tags=("trendable", sub_addr))
+                self._iid_to_tag[iid] = sub_addr
                 self.tag_data_types[sub_addr] = dt
             else:
                 muted = resolve_color(TEXT_MUTED)
                 self.tag_tree.insert(parent_item, "end", text=f"  {sub_addr}",
                                      values=(dt,), tags=("disabled",))
-        self.tag_tree.tag_configure("trendable", foreground=primary)
 
     def _populate_bit_addressable(self, parent_item, info):
         """Populate bit-level children for a Logix integer-type tag (INT, DINT, etc.).
@@ -3540,7 +4103,6 @@ class PLCTrendTool(ctk.CTk):
         addr = info["path"]
         dt = info.get("dataType", "DINT")
         bit_count = info.get("_bit_count", 32)
-        primary = resolve_color(TEXT_PRIMARY)
 
         # First: trendable whole word
         prefix = "\u2611 " if addr in self.selected_tags else "\u2610 "
@@ -3551,18 +4113,19 @@ class PLCTrendTool(ctk.CTk):
             display = f"[{parts[1]}  (whole word)" if len(parts) == 2 else f"{display}  (whole word)"
         else:
             display = f"{display}  (whole word)"
-        self.tag_tree.insert(parent_item, "end", text=f"{prefix}{display}",
-                             values=(dt,), tags=("trendable", addr))
+        iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}{display}",
+                                   values=(dt,), tags=("trendable", addr))
+        self._iid_to_tag[iid] = addr
         self.tag_data_types[addr] = dt
 
         # Then: individual bits
         for bit in range(bit_count):
             bit_addr = f"{addr}.{bit}"
             prefix = "\u2611 " if bit_addr in self.selected_tags else "\u2610 "
-            self.tag_tree.insert(parent_item, "end", text=f"{prefix}.{bit}",
-                                 values=("BOOL",), tags=("trendable", bit_addr))
+            iid = self.tag_tree.insert(parent_item, "end", text=f"{prefix}.{bit}",
+                                       values=("BOOL",), tags=("trendable", bit_addr))
+            self._iid_to_tag[iid] = bit_addr
             self.tag_data_types[bit_addr] = "BOOL"
-        self.tag_tree.tag_configure("trendable", foreground=primary)
 
     def _populate_udt_members(self, parent_item, base_path, data_type_value):
         """Populate tree children from UDT definition fields."""
@@ -3571,9 +4134,6 @@ class PLCTrendTool(ctk.CTk):
             self.tag_tree.insert(parent_item, "end", text="(unable to resolve structure)",
                                  values=("",), tags=("disabled",))
             return
-        muted = resolve_color(TEXT_MUTED)
-        primary = resolve_color(TEXT_PRIMARY)
-        struct_fg = resolve_color(("#5080B0", "#7AB0D8"))
         for field in udt_def["fields"]:
             field_path = f"{base_path}.{field['name']}"
             is_struct = field.get("is_struct", 0)
@@ -3593,7 +4153,6 @@ class PLCTrendTool(ctk.CTk):
                     "populated": False,
                 }
                 self.tag_tree.insert(child, "end", text="Loading...", values=("",), tags=("_dummy",))
-                self.tag_tree.tag_configure("struct", foreground=struct_fg)
             else:
                 # Atomic member — check if trendable
                 is_trendable = field["dataType"] in TRENDABLE_TYPES
@@ -3612,7 +4171,6 @@ class PLCTrendTool(ctk.CTk):
                         "dataType": field["dataType"],
                     }
                     self.tag_tree.insert(arr_parent, "end", text="Loading...", values=("",), tags=("_dummy",))
-                    self.tag_tree.tag_configure("struct", foreground=struct_fg)
                 elif is_trendable:
                     bit_count = BIT_ADDRESSABLE_TYPES.get(field["dataType"], 0)
                     if bit_count > 0:
@@ -3631,38 +4189,32 @@ class PLCTrendTool(ctk.CTk):
                             "dataType": field["dataType"],
                         }
                         self.tag_tree.insert(child, "end", text="Loading...", values=("",), tags=("_dummy",))
-                        self.tag_tree.tag_configure("struct", foreground=struct_fg)
                     else:
                         # BOOL, REAL, LREAL — directly trendable
                         prefix = "\u2611 " if field_path in self.selected_tags else "\u2610 "
-                        self.tag_tree.insert(parent_item, "end",
-                                             text=prefix + field["name"],
-                                             values=(field["dataType"],),
-                                             tags=("trendable", field_path))
+                        iid = self.tag_tree.insert(parent_item, "end",
+                                                   text=prefix + field["name"],
+                                                   values=(field["dataType"],),
+                                                   tags=("trendable", field_path))
+                        self._iid_to_tag[iid] = field_path
                         self.tag_data_types[field_path] = field["dataType"]
-                        self.tag_tree.tag_configure("trendable", foreground=primary)
                 else:
                     self.tag_tree.insert(parent_item, "end",
                                          text=f"  {field['name']}",
                                          values=(field["dataType"],),
                                          tags=("disabled",))
-                    self.tag_tree.tag_configure("disabled", foreground=muted)
 
     def _on_tag_click(self, event):
         item = self.tag_tree.identify_row(event.y)
         if not item: return
-        item_tags = self.tag_tree.item(item, "tags")
-        if "group" in item_tags or "disabled" in item_tags or "_dummy" in item_tags:
-            return
-        # Struct items — let Treeview's native expand/collapse handle it
-        if "struct" in item_tags:
+        page = self._more_rows.pop(item, None)
+        if page:
+            self.tag_tree.delete(item)
+            self._insert_tag_page(*page)
             return
-        # Trendable items — toggle selection
-        tag_name = None
-        for t in item_tags:
-            if t not in ("trendable", "disabled", "group", "struct", "_dummy"):
-                tag_name = t
-                break
+        # Only trendable rows are mapped — group/disabled/placeholder rows are
+        # ignored and struct rows are left to Treeview's native expand/collapse
+        tag_name = self._iid_to_tag.get(item)
         if not tag_name: return
         ct = self.tag_tree.item(item, "text")
         if tag_name in self.selected_tags:
@@ -3672,50 +4224,67 @@ class PLCTrendTool(ctk.CTk):
             self.selected_tags.add(tag_name)
             self.tag_tree.item(item, text="\u2611 " + ct[2:])
         self._update_selected_count()
-        self._sync_tags_to_chart()
+        self._schedule_tag_sync()
+
+    def _schedule_tag_sync(self):
+        """Coalesce a burst of checkbox clicks into one chart rebuild."""
+        if self._tag_sync_after:
+            self.after_cancel(self._tag_sync_after)
+        self._tag_sync_after = self.after(120, self._sync_tags_to_chart)
+
+    def _schedule_filter(self, *_):
+        """Debounce the tag search: rebuild the tree 150 ms after the last keystroke."""
+        if self._filter_after:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(150, self._filter_tags)
 
     def _filter_tags(self):
+        self._filter_after = None
         query = self.tag_search_var.get().lower().strip()
-        for item in self.tag_tree.get_children(): self.tag_tree.delete(item)
+        self.tag_tree.delete(*self.tag_tree.get_children())
+        self._iid_to_tag = {}
+        self._more_rows = {}
         self._struct_items = {}
         def matches(tag): return not query or query in tag["name"].lower() or query in tag["dataType"].lower()
-        muted = resolve_color(TEXT_MUTED)
-        primary = resolve_color(TEXT_PRIMARY)
-        struct_fg = resolve_color(("#5080B0", "#7AB0D8"))
         is_slc = self.plc.controller_type in SLC_CONTROLLER_TYPES
-        fc = [t for t in self.all_ctrl_tags if matches(t)]
-        if fc:
-            label = f"Data Files ({len(fc)})" if is_slc else f"Controller Tags ({len(fc)})"
-            gid = self.tag_tree.insert("", "end", text=label, values=("",), open=True, tags=("group",))
-            for tag in fc:
-                self._insert_tag_item(gid, tag, tag["name"])
-        if not is_slc:
-            for pn in sorted(self.all_prog_tags.keys()):
-                fp = [t for t in self.all_prog_tags[pn] if matches(t)]
-                if fp or (query and query in pn.lower()):
-                    ts = fp if fp else self.all_prog_tags[pn]
-                    gid = self.tag_tree.insert("", "end", text=f"{pn} ({len(ts)})", values=("",), open=bool(query), tags=("group",))
-                    for tag in ts:
-                        dn = tag["name"].split(".")[-1] if "." in tag["name"] else tag["name"]
-                        self._insert_tag_item(gid, tag, tag["name"], display_name=dn)
-        self.tag_tree.tag_configure("group", font=(FONT_FAMILY, FONT_SIZE_BODY, "bold"))
-        self.tag_tree.tag_configure("disabled", foreground=muted)
-        self.tag_tree.tag_configure("trendable", foreground=primary)
-        self.tag_tree.tag_configure("struct", foreground=struct_fg)
+        insert = self.tag_tree.insert
+        self.tag_tree.grid_remove()
+        try:
+            fc = [t for t in self.all_ctrl_tags if matches(t)]
+            if fc:
+                label = f"Data Files ({len(fc)})" if is_slc else f"Controller Tags ({len(fc)})"
+                gid = insert("", "end", text=label, values=("",), open=True, tags=("group",))
+                self._insert_tag_page(gid, fc)
+            if not is_slc:
+                for pn in sorted(self.all_prog_tags.keys()):
+                    fp = [t for t in self.all_prog_tags[pn] if matches(t)]
+                    if fp or (query and query in pn.lower()):
+                        ts = fp if fp else self.all_prog_tags[pn]
+                        self._insert_program_group(pn, ts, open_=bool(query))
+        finally:
+            self.tag_tree.grid()
+
+    @staticmethod
+    def _is_checkbox_tag(tag):
+        """True for tags _insert_tag_item shows as a selectable checkbox row
+        (trendable, not a data file, struct or bit-addressable integer)."""
+        if tag.get("_slc_file", False) or tag.get("is_struct", 0) or not tag.get("trendable", False):
+            return False
+        return not BIT_ADDRESSABLE_TYPES.get(tag["dataType"], 0)
 
     def _select_all_visible(self):
-        def walk(parent):
-            for item in self.tag_tree.get_children(parent):
-                tags = self.tag_tree.item(item, "tags")
-                if "trendable" in tags:
-                    for t in tags:
-                        if t not in ("trendable", "disabled", "group", "struct", "_dummy"):
-                            self.selected_tags.add(t)
-                            ct = self.tag_tree.item(item, "text")
-                            if ct.startswith("\u2610 "): self.tag_tree.item(item, text="\u2611 " + ct[2:])
-                            break
-                walk(item)
-        walk("")
+        for item, tag_name in self._iid_to_tag.items():
+            self.selected_tags.add(tag_name)
+            ct = self.tag_tree.item(item, "text")
+            if ct.startswith("\u2610 "): self.tag_tree.item(item, text="\u2611 " + ct[2:])
+        # Rows behind a "Show more" row aren't inserted yet; select them too so
+        # they show checked when paged in
+        for _, tags, end, _ in self._more_rows.values():
+            self.selected_tags.update(t["name"] for t in tags[end:] if self._is_checkbox_tag(t))
+        # Likewise for program groups that were never expanded
+        for info in self._struct_items.values():
+            if "_program_tags" in info and not info["populated"]:
+                self.selected_tags.update(t["name"] for t in info["_program_tags"] if self._is_checkbox_tag(t))
         self._update_selected_count()
         self._sync_tags_to_chart()
 
@@ -3738,7 +4307,13 @@ class PLCTrendTool(ctk.CTk):
     def _sync_tags_to_chart(self):
         """Sync selected tags to the chart immediately.
         Works pre-trend (preview with empty lines) and mid-trend (live add/remove)."""
+        if self._tag_sync_after:  # a direct call supersedes the pending one
+            self.after_cancel(self._tag_sync_after)
+            self._tag_sync_after = None
         tags = list(self.selected_tags)
+        self._ordered_tags_cache = None
+        if self._fullscreen_tag not in self.selected_tags:
+            self._fullscreen_tag = None  # expanded tag was removed — exit fullscreen
 
         # Initialize per-tag scales for any new tags
         for tag in tags:
@@ -3764,7 +4339,7 @@ class PLCTrendTool(ctk.CTk):
             self.view_badge_label.configure(text="\u25CF READY", fg=SAS_BLUE)
         elif not tags and not self.trend.trending:
             self.view_badge_label.configure(text="", fg=resolve_color(TEXT_MUTED))
-            self.point_label.configure(text="")
+            self._configure_if_changed(self.point_label, text="")
 
     # == TRENDING LOGIC ==
     def _parse_sample_rate(self):
@@ -3774,6 +4349,8 @@ class PLCTrendTool(ctk.CTk):
 
     def _start_trend(self):
         if not self.selected_tags: return
+        if self._tag_sync_after:
+            self._sync_tags_to_chart()  # apply clicks still waiting to be synced
         tags = list(self.selected_tags)
         rate = self._parse_sample_rate()
 
@@ -3805,23 +4382,36 @@ class PLCTrendTool(ctk.CTk):
         self._show_trend_view()
 
     def _trend_loop(self):
+        """Poll the PLC on a fixed schedule. Samples are timestamped here and
+        pushed to the trend inbox; the UI timer ingests them (see _update_display),
+        so chart redraws and exports never delay the next read."""
+        next_t = time.monotonic()
         while self.trend.trending:
             if self.plc.connected:
                 values = self.plc.read_tags(self.trend.tags)
-                if values: self.trend.add_point(values)
-            time.sleep(self.trend.sample_rate)
+                if values: self.trend.push(values, time.time())
+            # Sleep until the next sample slot rather than a full period after
+            # the read, so read latency doesn't stretch the sample rate
+            next_t += self.trend.sample_rate
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_t = time.monotonic()  # fell behind -- don't burst to catch up
 
     def _schedule_chart_update(self, interval_ms):
         if self.chart_update_timer: self.after_cancel(self.chart_update_timer)
         self.chart_update_timer = self.after(interval_ms, lambda: self._update_display(interval_ms))
 
     def _update_display(self, interval_ms):
+        t0 = time.perf_counter()
+        self.trend.drain()  # ingest samples queued by the poll thread
         if not self.trend.trending and self.view_mode == "live": return
         
         # When paused, keep collecting but don't update chart
         if self._paused:
-            self.point_label.configure(text=f"{self.trend.point_count:,} points")
-            if hasattr(self, "_storage_info_label"):
+            self._configure_if_changed(self.point_label, text=f"{self.trend.point_count:,} points")
+            if hasattr(self, "_sidebar_storage_label"):
                 self._update_storage_info()
             if self.trend.trending:
                 self.chart_update_timer = self.after(interval_ms, lambda: self._update_display(interval_ms))
@@ -3829,8 +4419,24 @@ class PLCTrendTool(ctk.CTk):
 
         chart_data = self.trend.get_chart_data()
         any_data = False
+        no_data = ([], [])
+        for tag, line in self._active_lines:
+            times, vals = chart_data.get(tag, no_data)
+            if len(times):
+                line.set_data(times, vals)
+                any_data = True
+
+        if not any_data:
+            # Nothing plotted yet (trend just started / data cleared) — skip the
+            # axes work and redraw, just refresh the counters
+            self._update_live_table()
+            self._configure_if_changed(self.point_label, text=f"{self.trend.point_count:,} points")
+            if self.trend.trending:
+                self.chart_update_timer = self.after(interval_ms, lambda: self._update_display(interval_ms))
+            return
 
         # Save xlim per-axis BEFORE any modifications (for manual scroll preservation)
+        # (set_data above doesn't touch the view limits)
         saved_xlims = {}
         if not self._follow_live:
             for i, a in enumerate(self.axes):
@@ -3838,86 +4444,165 @@ class PLCTrendTool(ctk.CTk):
                 except Exception: pass
 
         if self._isolated_mode and len(self.axes) > 1:
-            ordered_tags = self._get_ordered_tags()
-            for tag in ordered_tags:
-                if tag in self.lines:
-                    times, vals = chart_data.get(tag, ([], []))
-                    if times:
-                        self.lines[tag].set_data(times, vals)
-                        any_data = True
-            if any_data:
-                for i, tag in enumerate(ordered_tags):
-                    if i < len(self.axes):
-                        ax = self.axes[i]
-                        ax.relim()
-                        scale = self._tag_scales.get(tag)
-                        if scale and not scale.get("auto", True):
-                            ax.autoscale(enable=False, axis='y')
-                            ax.set_ylim(scale["min"], scale["max"])
-                            ax.autoscale(enable=True, axis='x')
-                            ax.autoscale_view(scalex=True, scaley=False)
-                        else:
-                            ax.autoscale(enable=True)
-                            ax.autoscale_view()
+            for i, tag in enumerate(self._get_ordered_tags()):
+                if i < len(self.axes):
+                    ax = self.axes[i]
+                    ax.relim()
+                    ylim = self._manual_ylims.get(tag)
+                    if ylim:
+                        ax.autoscale(enable=False, axis='y')
+                        ax.set_ylim(ylim)
+                        ax.autoscale(enable=True, axis='x')
+                        ax.autoscale_view(scalex=True, scaley=False)
+                    else:
+                        ax.autoscale(enable=True)
+                        ax.autoscale_view()
         else:
-            for tag, (times, vals) in chart_data.items():
-                if tag in self.lines and times:
-                    self.lines[tag].set_data(times, vals)
-                    any_data = True
-            if any_data:
-                self.ax.relim()
-                # Check for manual Y scale (only for tags currently displayed)
-                manual_ylim = None
-                for tag in self.lines:
-                    scale = self._tag_scales.get(tag)
-                    if scale and not scale.get("auto", True):
-                        manual_ylim = (scale["min"], scale["max"])
-                        break
-                if manual_ylim:
-                    # Autoscale X only, set Y manually
-                    self.ax.autoscale(enable=False, axis='y')
-                    self.ax.set_ylim(manual_ylim)
-                    self.ax.autoscale(enable=True, axis='x')
-                    self.ax.autoscale_view(scalex=True, scaley=False)
-                else:
-                    self.ax.autoscale(enable=True)
-                    self.ax.autoscale_view()
-
-        if any_data:
-            # Set X range
-            if self._follow_live and self.view_mode == "live":
-                now = datetime.now()
-                window_start = now - timedelta(seconds=self._time_span_seconds)
-                for a in self.axes:
-                    a.set_xlim(window_start, now)
-            elif saved_xlims:
-                # Restore user's scroll position (autoscale_view reset it)
-                for i, a in enumerate(self.axes):
-                    if i in saved_xlims:
-                        a.set_xlim(saved_xlims[i])
+            self.ax.relim()
+            # Check for manual Y scale (only for tags currently displayed)
+            manual = self._manual_ylims
+            manual_ylim = next((manual[t] for t in self.lines if t in manual), None) if manual else None
+            if manual_ylim:
+                # Autoscale X only, set Y manually
+                self.ax.autoscale(enable=False, axis='y')
+                self.ax.set_ylim(manual_ylim)
+                self.ax.autoscale(enable=True, axis='x')
+                self.ax.autoscale_view(scalex=True, scaley=False)
+            else:
+                self.ax.autoscale(enable=True)
+                self.ax.autoscale_view()
 
-            self._update_scrollbar()
+        # Set X range (as date numbers, so matplotlib has no datetimes to convert)
+        if self._follow_live and self.view_mode == "live":
+            now = _epoch_to_datenum(time.time())
+            window_start = now - self._time_span_seconds / 86400.0
+            for a in self.axes:
+                a.set_xlim(window_start, now, emit=False)
+        elif saved_xlims:
+            # Restore user's scroll position (autoscale_view reset it)
+            for i, a in enumerate(self.axes):
+                if i in saved_xlims:
+                    a.set_xlim(saved_xlims[i])
+
+        self._request_scrollbar_update()
 
-            fmt = mdates.DateFormatter("%H:%M:%S")
+        # The formatter only changes when the axes are rebuilt (tick labels keep
+        # matplotlib's default horizontal, centered layout — nothing rotates them)
+        layout_changed = self._axes_layout_dirty
+        if layout_changed:
             for a in self.axes:
-                a.xaxis.set_major_formatter(fmt)
-                for label in a.get_xticklabels():
-                    label.set_rotation(0)
-                    label.set_ha("center")
-            # Re-hide x tick labels on non-bottom subplots in isolated mode
-            if self._isolated_mode and len(self.axes) > 1:
-                for a in self.axes[:-1]:
-                    a.tick_params(axis="x", labelbottom=False)
-                    a.set_xlabel("")
-            try: self.canvas.draw_idle()
-            except Exception: pass
+                a.xaxis_date()  # date locator for the float limits set above
+                a.xaxis.set_major_formatter(self._time_formatter)
+            self._axes_layout_dirty = False
+        # Follow-live shifts the x limits every tick, which forces a full redraw;
+        # a scrolled-back view with steady limits only re-blits the lines.
+        # The draw stays on the Tk thread: this loop mutates the same Figure
+        # every tick and matplotlib artists are not thread-safe, so the
+        # adaptive interval below is what keeps time free for input.
+        self._redraw_chart(full=layout_changed, sync=True)
 
         self._update_live_table()
-        self.point_label.configure(text=f"{self.trend.point_count:,} points")
-        if hasattr(self, "_storage_info_label"):
+        self._configure_if_changed(self.point_label, text=f"{self.trend.point_count:,} points")
+        if hasattr(self, "_sidebar_storage_label"):
             self._update_storage_info()
         if self.trend.trending:
-            self.chart_update_timer = self.after(interval_ms, lambda: self._update_display(interval_ms))
+            # Back off when a refresh costs more than half the interval so Tk
+            # keeps time for input; queued samples are drawn together next tick
+            self._last_render_ms = (time.perf_counter() - t0) * 1000
+            next_ms = max(interval_ms, int(2 * self._last_render_ms))
+            self.chart_update_timer = self.after(next_ms, lambda: self._update_display(interval_ms))
+
+    def _chart_view_state(self):
+        """Figure size and axis limits a cached blit background is valid for."""
+        return self.fig.bbox.bounds, tuple((a.get_xlim(), a.get_ylim()) for a in self.axes)
+
+    def _on_chart_draw(self, event):
+        """After a full draw, cache the background (animated trend lines are
+        excluded) and paint the lines on top of it."""
+        self._blit_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._blit_state = self._chart_view_state()
+        self._draw_chart_overlays()
+        self._last_draw_end = time.perf_counter()
+
+    def _draw_chart_overlays(self):
+        """Draw the animated trend lines, then the artists that belong above them."""
+        if self._drag_state:
+            for rect in self._drag_state.get("highlights", ()):
+                if rect.get_visible() and rect.axes is not None:
+                    rect.axes.draw_artist(rect)
+        for _, line in self._active_lines:
+            if line.axes is not None:
+                line.axes.draw_artist(line)
+        for a in self.axes:
+            leg = a.get_legend()
+            if leg is not None:
+                a.draw_artist(leg)
+        # Snapshot the finished chart so cursor moves only repaint the cursor
+        self._cursor_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_cursor_artists()
+
+    def _draw_cursor_artists(self):
+        for artist in (getattr(self, "_cursor_vlines", []) + getattr(self, "_cursor_dots", [])
+                       + self._cursor_annotations):
+            if artist.axes is not None:
+                artist.axes.draw_artist(artist)
+
+    def _blit_cursor(self):
+        """Repaint just the cursor artists over the cached chart (background,
+        lines and legends); falls back to _redraw_chart when the cache is stale."""
+        if self._cursor_bg is None or self._blit_bg is None or self._blit_state != self._chart_view_state():
+            self._redraw_chart()
+            return
+        self.canvas.restore_region(self._cursor_bg)
+        self._draw_cursor_artists()
+        self.canvas.blit(self.fig.bbox)
+
+    def _request_draw(self):
+        """Queue one full chart redraw for when Tk goes idle. Any number of
+        view changes in the same event burst share a single margins pass and
+        draw_idle."""
+        if self._draw_pending:
+            return
+        self._draw_pending = True
+        self.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        # Hold redraws to one per DRAW_COOLDOWN_MS, measured from the end of the
+        # previous draw, so a burst of requests can't starve input handling
+        wait_ms = int(DRAW_COOLDOWN_MS - (time.perf_counter() - self._last_draw_end) * 1000)
+        if wait_ms > 0:
+            self.after(wait_ms, self._flush_draw)
+            return
+        self._draw_pending = False
+        if not hasattr(self, 'canvas'):
+            return
+        self._apply_chart_margins()
+        try: self.canvas.draw_idle()
+        except Exception: pass
+
+    def _redraw_chart(self, full=False, sync=False):
+        """Repaint the chart after line data changed. Blits the lines over the
+        cached background when limits/size are unchanged, otherwise full redraw
+        (immediately with sync=True, so the caller can time it)."""
+        if not full and self._blit_bg is not None and self._blit_state == self._chart_view_state():
+            self.canvas.restore_region(self._blit_bg)
+            self._draw_chart_overlays()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            try: self.canvas.draw() if sync else self.canvas.draw_idle()
+            except Exception: pass
+
+    def _request_scrollbar_update(self):
+        """Queue a scrollbar refresh for when Tk goes idle, so chart updates
+        don't recompute it mid-render and repeated requests collapse to one."""
+        if self._scrollbar_update_pending:
+            return
+        self._scrollbar_update_pending = True
+        self.after_idle(self._flush_scrollbar)
+
+    def _flush_scrollbar(self):
+        self._scrollbar_update_pending = False
+        self._update_scrollbar()
 
     def _update_scrollbar(self):
         """Update the horizontal scrollbar to reflect current view vs total data."""
@@ -3926,6 +4611,11 @@ class PLCTrendTool(ctk.CTk):
             self._chart_scrollbar.set(0.0, 1.0)
             return
         total_seconds = max((t_end - t_start).total_seconds(), 0.001)
+        if self._follow_live and self.view_mode == "live":
+            # Following live: the view is always the last time span ending now,
+            # so skip converting the axis limits back to datetimes
+            self._chart_scrollbar.set(max(0.0, 1.0 - self._time_span_seconds / total_seconds), 1.0)
+            return
         try:
             xlim = self.axes[0].get_xlim()
             view_start = mdates.num2date(xlim[0]).replace(tzinfo=None)
@@ -3950,9 +4640,8 @@ class PLCTrendTool(ctk.CTk):
             view_end = view_start + timedelta(seconds=self._time_span_seconds)
             self._follow_live = False
             for a in self.axes:
-                a.set_xlim(view_start, view_end)
-            try: self.canvas.draw_idle()
-            except Exception: pass
+                a.set_xlim(view_start, view_end, emit=False)
+            self._request_draw()
             self._update_scrollbar()
         elif args[0] == "scroll":
             amount = int(args[1])
@@ -3966,35 +4655,30 @@ class PLCTrendTool(ctk.CTk):
                 return
             self._follow_live = False
             for a in self.axes:
-                a.set_xlim(view_start, view_end)
-            try: self.canvas.draw_idle()
-            except Exception: pass
+                a.set_xlim(view_start, view_end, emit=False)
+            self._request_draw()
             self._update_scrollbar()
 
     def _snap_to_live(self):
         """Snap chart back to following live data."""
         self._follow_live = True
-        if self.trend.data:
-            now = datetime.now() if self.trend.trending else self.trend.data[-1]["dt"]
+        last_dt = self.trend.last_dt
+        if last_dt is not None:
+            now = datetime.now() if self.trend.trending else last_dt
             window_start = now - timedelta(seconds=self._time_span_seconds)
             tags = self._get_ordered_tags()
             for i, a in enumerate(self.axes):
-                a.set_xlim(window_start, now)
+                a.set_xlim(window_start, now, emit=False)
                 tag = tags[i] if self._isolated_mode and i < len(tags) else None
                 if self._isolated_mode and tag:
-                    scale = self._tag_scales.get(tag)
-                    if scale and not scale.get("auto", True):
+                    if tag in self._manual_ylims:
                         continue
                 elif not self._isolated_mode:
-                    has_manual = any(
-                        not self._tag_scales.get(t, {}).get("auto", True) for t in tags
-                    )
-                    if has_manual:
+                    if any(t in self._manual_ylims for t in tags):
                         continue
                 a.relim()
                 a.autoscale_view(scalex=False, scaley=True)
-            try: self.canvas.draw_idle()
-            except Exception: pass
+            self._request_draw()
             self._update_scrollbar()
 
     def _pause_trend(self):
@@ -4033,9 +4717,12 @@ class PLCTrendTool(ctk.CTk):
         self.selected_tags.clear()
         self.tag_data_types.clear()
         self._tag_scales.clear()
+        self._manual_ylims.clear()
         self._line_props.clear()
+        self._line_props_cache.clear()
         self._chart_bg.clear()
         self._tag_order.clear()
+        self._ordered_tags_cache = None
         self._fullscreen_tag = None
         self._inspect_time = None
         self._paused = False
@@ -4058,10 +4745,10 @@ class PLCTrendTool(ctk.CTk):
         self.export_json_btn.configure(state="disabled")
         self.export_csv_btn.configure(state="disabled")
         self.clear_data_btn.configure(state="disabled")
-        self.point_label.configure(text="")
+        self._configure_if_changed(self.point_label, text="")
         self.view_badge_label.configure(text="", fg=resolve_color(TEXT_MUTED))
         self._tag_toggle_btn.configure(text="\U0001F3F7 Tags")
-        if hasattr(self, "_storage_info_label"):
+        if hasattr(self, "_sidebar_storage_label"):
             self._update_storage_info()
 
         # Rebuild chart (empty)
@@ -4098,9 +4785,8 @@ class PLCTrendTool(ctk.CTk):
     def _estimate_data_size(self):
         """Estimate the in-memory data size and approximate export file size.
         Returns (in_memory_bytes, export_estimate_bytes, display_string)."""
-        with self.trend._lock:
-            point_count = len(self.trend.data)
-            tag_count = len(self.trend.tags)
+        point_count = self.trend.point_count
+        tag_count = len(self.trend.tags)
         if point_count == 0 or tag_count == 0:
             return 0, 0, ""
         # Estimate: each data point stores a timestamp string (~24 chars) +
@@ -4109,8 +4795,8 @@ class PLCTrendTool(ctk.CTk):
         avg_tag_name_len = sum(len(t) for t in self.trend.tags) / max(tag_count, 1)
         bytes_per_point = 30 + tag_count * (avg_tag_name_len + 12)  # timestamp + values
         in_memory = int(point_count * bytes_per_point)
-        # pytrend export is JSON with indentation — roughly 1.4x in-memory estimate
-        export_est = int(in_memory * 1.4)
+        # pytrend export is compact JSON — close to the per-point estimate above
+        export_est = in_memory
         # Format nicely
         if export_est < 1024:
             size_str = f"{export_est} B"
@@ -4123,10 +4809,15 @@ class PLCTrendTool(ctk.CTk):
         return in_memory, export_est, size_str
 
     def _update_storage_info(self):
-        """Update the sidebar storage estimate label."""
+        """Update the storage estimate labels in the sidebar and, once the
+        settings view has been built, on the settings page."""
+        labels = [self._sidebar_storage_label]
+        if hasattr(self, "_settings_storage_label"):
+            labels.append(self._settings_storage_label)
         _, export_est, size_str = self._estimate_data_size()
         if not size_str:
-            self._storage_info_label.configure(text="")
+            for label in labels:
+                self._configure_if_changed(label, text="")
             return
         # Color-code based on size: green < 50MB, yellow < 200MB, red >= 200MB
         if export_est < 50 * 1024 * 1024:
@@ -4135,16 +4826,15 @@ class PLCTrendTool(ctk.CTk):
             color = STATUS_WARN
         else:
             color = STATUS_ERROR
-        self._storage_info_label.configure(
-            text=f"\U0001F4BE Est. export: ~{size_str}",
-            text_color=color)
+        for label in labels:
+            self._configure_if_changed(
+                label, text=f"\U0001F4BE Est. export: ~{size_str}", text_color=color)
 
     def _update_live_table(self):
-        for item in self.live_tree.get_children(): self.live_tree.delete(item)
-
         def fmt(v):
             if v is None: return "---"
             if isinstance(v, float): return f"{v:.4f}"
+            if isinstance(v, bool): return str(int(v))  # BOOLs arrive raw from the poll
             return str(v)
 
         # When stopped with an inspected time, show values at that point
@@ -4156,6 +4846,8 @@ class PLCTrendTool(ctk.CTk):
         else:
             self.live_tree.heading("current", text="Current")
 
+        min_values, max_values = self.trend.min_values, self.trend.max_values
+        rows = []
         for tag in self._get_ordered_tags():
             dt = self.tag_data_types.get(tag, "---")
             if inspecting:
@@ -4163,16 +4855,28 @@ class PLCTrendTool(ctk.CTk):
                 times, vals = chart_data.get(tag, ([], []))
                 idx = getattr(self, '_inspect_idx', 0)
                 if idx < len(vals):
-                    val = vals[idx]
+                    val = _sample_value(float(vals[idx]))
                 else:
                     val = None
-                mn = self.trend.min_values.get(tag)
-                mx = self.trend.max_values.get(tag)
+                mn = min_values.get(tag)
+                mx = max_values.get(tag)
             else:
                 val = self.trend.live_values.get(tag)
-                mn = self.trend.min_values.get(tag)
-                mx = self.trend.max_values.get(tag)
-            self.live_tree.insert("", "end", values=(tag, dt, fmt(val), fmt(mn), fmt(mx), "OK" if val is not None else "ERR"))
+                mn = min_values.get(tag)
+                mx = max_values.get(tag)
+            rows.append((tag, dt, fmt(val), fmt(mn), fmt(mx), "OK" if val is not None else "ERR"))
+
+        # Same tags in the same order: update only the rows whose text changed
+        # instead of deleting and re-inserting the whole table
+        shown = self._live_rows
+        if len(shown) == len(rows) and all(old[1][0] == new[0] for old, new in zip(shown, rows)):
+            for i, ((iid, old), new) in enumerate(zip(shown, rows)):
+                if old != new:
+                    self.live_tree.item(iid, values=new)
+                    shown[i] = (iid, new)
+            return
+        self.live_tree.delete(*self.live_tree.get_children())
+        self._live_rows = [(self.live_tree.insert("", "end", values=row), row) for row in rows]
 
     def _clear_data(self):
         self.trend.clear()
@@ -4180,10 +4884,11 @@ class PLCTrendTool(ctk.CTk):
         self._inspect_time = None
         self._fullscreen_tag = None
         self._tag_scales = {}
+        self._manual_ylims = {}
         self._rebuild_chart()
         self._update_live_table()
-        self.point_label.configure(text="0 points")
-        if hasattr(self, "_storage_info_label"):
+        self._configure_if_changed(self.point_label, text="0 points")
+        if hasattr(self, "_sidebar_storage_label"):
             self._update_storage_info()
 
     # == EXPORT / IMPORT ==
@@ -4227,6 +4932,7 @@ class PLCTrendTool(ctk.CTk):
             self._follow_live = False
             # Set selected_tags from imported data so _get_ordered_tags works
             self.selected_tags = set(self.trend.tags)
+            self._ordered_tags_cache = None
             for tag in self.trend.tags:
                 if tag not in self.tag_data_types: self.tag_data_types[tag] = "---"
                 if tag not in self._tag_scales:
@@ -4238,9 +4944,9 @@ class PLCTrendTool(ctk.CTk):
             self.export_json_btn.configure(state="normal")
             self.export_csv_btn.configure(state="normal")
             self.clear_data_btn.configure(state="normal")
-            self.point_label.configure(text=f"{self.trend.point_count:,} points (imported)")
+            self._configure_if_changed(self.point_label, text=f"{self.trend.point_count:,} points (imported)")
             self._show_trend_view()
-            if hasattr(self, "_storage_info_label"):
+            if hasattr(self, "_sidebar_storage_label"):
                 self._update_storage_info()
             messagebox.showinfo("Import", f"Loaded {meta.get('totalPoints', 0):,} points\nPLC: {meta.get('plcIP', '?')}\nTags: {', '.join(self.trend.tags)}")
         except Exception as e:
@@ -4251,12 +4957,23 @@ class PLCTrendTool(ctk.CTk):
         self.settings["theme"] = value
         save_settings(self.settings)
         ctk.set_appearance_mode(value)
+        _invalidate_color_cache()
+        self._refresh_theme_colors()
         self.after(100, self._refresh_after_theme_change)
 
+    def _refresh_theme_colors(self):
+        """Resolve the palette for the current theme once. Hover/motion
+        handlers read self._colors[X] instead of calling resolve_color."""
+        self._colors = {c: resolve_color(c) for c in (BG_DARK, BG_MEDIUM, BG_CARD, BG_CARD_HOVER, BG_INPUT,
+                                                     BORDER_COLOR, TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED)}
+
     def _refresh_after_theme_change(self):
         self._apply_treeview_style()
         self._style_chart()
         self._style_chart_axes()  # styles all axes
+        # The cursor artists are reused while their axes survive; drop them so
+        # the next mouse move recreates them in the new palette
+        self._clear_cursor_elements()
         self._apply_chart_bg()
         # Update plain tk.Frame wrappers that don't auto-theme
         if hasattr(self, "_toolbar_frame"):
@@ -4267,6 +4984,7 @@ class PLCTrendTool(ctk.CTk):
             for w in self._toolbar_inner.winfo_children():
                 try: w.configure(bg=tb_bg)
                 except Exception: pass
+            self._tb_sep_img.put(resolve_color(BORDER_COLOR), to=(0, 0, 1, 20))
         if hasattr(self, "_trend_view_frame"):
             self._trend_view_frame.configure(bg=resolve_color(BG_DARK))
         if hasattr(self, "_chart_wrapper"):
@@ -4307,15 +5025,14 @@ class PLCTrendTool(ctk.CTk):
                     leg.get_frame().set_edgecolor(grid_color)
                     for txt in leg.get_texts():
                         txt.set_color(text_color)
-        try: self.canvas.draw_idle()
-        except Exception: pass
-        if self.all_ctrl_tags:
-            self.tag_tree.tag_configure("disabled", foreground=resolve_color(TEXT_MUTED))
-            self.tag_tree.tag_configure("trendable", foreground=resolve_color(TEXT_PRIMARY))
-            self.tag_tree.tag_configure("struct", foreground=resolve_color(("#5080B0", "#7AB0D8")))
+        self._request_draw()
 
     # == SETTINGS PERSISTENCE ==
     def _restore_settings(self):
+        if self.settings.get("sample_rate"): self.rate_var.set(self.settings["sample_rate"])
+
+    def _restore_connect_settings(self):
+        """Fill the connection form from settings (runs when the view is first built)."""
         if self.settings.get("last_ip"): self.ip_entry.insert(0, self.settings["last_ip"])
         if self.settings.get("last_slot") is not None:
             self.slot_entry.delete(0, "end")
@@ -4323,13 +5040,13 @@ class PLCTrendTool(ctk.CTk):
         if self.settings.get("last_controller"):
             self.controller_type_var.set(self.settings["last_controller"])
             self._on_controller_type_changed(self.settings["last_controller"])
-        if self.settings.get("sample_rate"): self.rate_var.set(self.settings["sample_rate"])
 
     def _save_current_settings(self):
-        self.settings["last_ip"] = self.ip_entry.get().strip()
-        try: self.settings["last_slot"] = int(self.slot_entry.get().strip())
-        except ValueError: self.settings["last_slot"] = 0
-        self.settings["last_controller"] = self.controller_type_var.get()
+        if self._connect_view is not None:  # never opened -- keep the saved values
+            self.settings["last_ip"] = self.ip_entry.get().strip()
+            try: self.settings["last_slot"] = int(self.slot_entry.get().strip())
+            except ValueError: self.settings["last_slot"] = 0
+            self.settings["last_controller"] = self.controller_type_var.get()
         self.settings["sample_rate"] = self.rate_var.get()
         self.settings["time_span"] = self._time_span_seconds
         self.settings["isolated_mode"] = self._isolated_mode